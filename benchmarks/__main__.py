@@ -0,0 +1,72 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from benchmarks.baseline import BenchmarkResult, compare, load_baseline, save_baseline
+from benchmarks.cases import CASES, BenchEnv
+
+DEFAULT_BASELINE = Path(__file__).with_name('baseline.json')
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmark the finish pipeline and compare against a baseline.',
+    )
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='baseline JSON file')
+    parser.add_argument('--save', action='store_true', help='write the results as the baseline')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.25,
+        help='fail when a case is this fraction slower than the baseline (default: 0.25)',
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='runs per case; the best is kept')
+    parser.add_argument('-k', dest='only', help='only run cases whose name contains this text')
+    return parser.parse_args(argv)
+
+
+def _format_ratio(ratio: Optional[float]) -> str:
+    return '      new' if ratio is None else f'{(ratio - 1) * 100:+8.1f}%'
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    if args.threshold < 0 or args.repeat < 1:
+        raise ValueError('threshold must be >= 0 and repeat must be >= 1')
+
+    cases = [case for case in CASES if not args.only or args.only in case.name]
+    env = BenchEnv.create()
+    try:
+        results = [
+            BenchmarkResult(case.name, case.ops, min(case.run(env) for _ in range(args.repeat)))
+            for case in cases
+        ]
+    finally:
+        env.close()
+
+    comparisons = compare(results, load_baseline(args.baseline))
+    regressed = [c for c in comparisons if c.regressed(args.threshold)]
+    for result, comparison in zip(results, comparisons, strict=True):
+        flag = '  REGRESSED' if comparison in regressed else ''
+        print(
+            f'{result.name:<24} {result.ops:>7} ops {result.seconds * 1000:>10.2f} ms '
+            f'{result.per_op * 1e6:>9.2f} us/op {_format_ratio(comparison.ratio)}{flag}'
+        )
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f'Baseline written to {args.baseline}')
+        return 0
+
+    if regressed:
+        print(
+            f'{len(regressed)} case(s) slower than the baseline by more than {args.threshold:.0%}'
+        )
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
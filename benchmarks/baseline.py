@@ -0,0 +1,57 @@
+import json
+import platform
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    ops: int
+    seconds: float
+
+    @property
+    def per_op(self) -> float:
+        return self.seconds / self.ops
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline: Optional[float]
+    current: float
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline:
+            return None
+        return self.current / self.baseline
+
+    def regressed(self, threshold: float) -> bool:
+        ratio = self.ratio
+        return ratio is not None and ratio > 1 + threshold
+
+
+def load_baseline(path: str | Path) -> dict[str, float]:
+    path = Path(path)
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding='utf-8'))
+    return {name: entry['per_op'] for name, entry in data.get('results', {}).items()}
+
+
+def save_baseline(path: str | Path, results: list[BenchmarkResult]) -> None:
+    data = {
+        'python': sys.version.split()[0],
+        'machine': platform.platform(),
+        'results': {
+            r.name: {'ops': r.ops, 'seconds': r.seconds, 'per_op': r.per_op} for r in results
+        },
+    }
+    Path(path).write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+
+
+def compare(results: list[BenchmarkResult], baseline: dict[str, float]) -> list[Comparison]:
+    return [Comparison(r.name, baseline.get(r.name), r.per_op) for r in results]
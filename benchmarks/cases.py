@@ -0,0 +1,144 @@
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtCore import QObject, Slot  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from botflow.i18n import I18n  # noqa: E402
+from botflow.loops import AsyncLoopThreadWorker  # noqa: E402
+from botflow.pages import LoadingPage  # noqa: E402
+from botflow.types import FinishContext  # noqa: E402
+from botflow.workers import PipelineWorker  # noqa: E402
+
+
+@dataclass
+class BenchEnv:
+    app: QApplication
+    loop: AsyncLoopThreadWorker
+    loading_page: LoadingPage
+    logger: logging.Logger = field(default_factory=lambda: _quiet_logger())
+
+    @classmethod
+    def create(cls) -> 'BenchEnv':
+        app = QApplication.instance() or QApplication([])
+        loop = AsyncLoopThreadWorker()
+        loop.start()
+        return cls(app, loop, LoadingPage(I18n.from_locales_dirs('en_US')))
+
+    def close(self) -> None:
+        self.loop.stop()
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    name: str
+    ops: int
+    fn: Callable[[BenchEnv, int], float]
+
+    def run(self, env: BenchEnv) -> float:
+        return self.fn(env, self.ops)
+
+
+def _quiet_logger() -> logging.Logger:
+    logger = logging.getLogger('botflow-bench')
+    logger.setLevel(logging.WARNING)
+    logger.propagate = False
+    return logger
+
+
+def _sync_step(context: FinishContext) -> None:
+    pass
+
+
+async def _async_step(context: FinishContext) -> None:
+    pass
+
+
+async def _noop() -> None:
+    pass
+
+
+def _pipeline_sync(env: BenchEnv, n: int) -> float:
+    worker = PipelineWorker({}, [_sync_step] * n, env.logger, env.loop)
+    start = time.perf_counter()
+    worker.runner.execute()
+    return time.perf_counter() - start
+
+
+def _pipeline_async(env: BenchEnv, n: int) -> float:
+    worker = PipelineWorker({}, [_async_step] * n, env.logger, env.loop)
+    start = time.perf_counter()
+    worker.runner.execute()
+    return time.perf_counter() - start
+
+
+def _pipeline_on_loop(env: BenchEnv, n: int) -> float:
+    worker = PipelineWorker({}, [_async_step] * n, env.logger, env.loop)
+    start = time.perf_counter()
+    env.loop.run(worker.runner.execute_async())
+    return time.perf_counter() - start
+
+
+def _loop_roundtrip(env: BenchEnv, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        env.loop.run(_noop())
+    return time.perf_counter() - start
+
+
+class _ProgressSink(QObject):
+    def __init__(self, page: LoadingPage) -> None:
+        super().__init__()
+        self.page = page
+        self.count = 0
+
+    @Slot(int)
+    def on_progress(self, value: int) -> None:
+        self.page.set_progress(value)
+        self.count += 1
+
+
+def _progress_to_gui(env: BenchEnv, n: int) -> float:
+    worker = PipelineWorker({}, [], env.logger, env.loop)
+    sink = _ProgressSink(env.loading_page)
+    worker.progress.connect(sink.on_progress)
+
+    def emit() -> None:
+        for i in range(n):
+            worker.progress.emit(i % 101)
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=emit)
+    thread.start()
+    while sink.count < n:
+        env.app.processEvents()
+    elapsed = time.perf_counter() - start
+    thread.join()
+    return elapsed
+
+
+def _progress_throttled(env: BenchEnv, n: int) -> float:
+    def report(context: FinishContext) -> None:
+        for i in range(n):
+            context.pipeline_info.progress(i % 101)
+
+    worker = PipelineWorker({}, [report], env.logger, env.loop, max_updates_per_second=30)
+    start = time.perf_counter()
+    worker.runner.execute()
+    return time.perf_counter() - start
+
+
+CASES: list[BenchCase] = [
+    *(BenchCase(f'pipeline_sync_{n}', n, _pipeline_sync) for n in (10, 1_000, 10_000)),
+    *(BenchCase(f'pipeline_async_{n}', n, _pipeline_async) for n in (10, 1_000, 10_000)),
+    *(BenchCase(f'pipeline_on_loop_{n}', n, _pipeline_on_loop) for n in (10, 1_000, 10_000)),
+    BenchCase('loop_run_roundtrip', 2_000, _loop_roundtrip),
+    BenchCase('progress_to_gui', 20_000, _progress_to_gui),
+    BenchCase('progress_throttled', 100_000, _progress_throttled),
+]
@@ -1,14 +1,24 @@
-from botflow.manager import FlowManager
-from botflow.types import FlowSpec
-from botflow.widgets import (
-    FileStepSpec,
-    FileWidget,
-    FormInput,
-    FormStepSpec,
-    FormWidget,
-    TextStepSpec,
-    TextWidget,
-)
+import importlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from botflow.cache import cache_step
+from botflow.registry import ResourceSpec
+from botflow.retry import RetryPolicy, retry_step
+from botflow.specs import FinishStep, FlowSpec
+
+if TYPE_CHECKING:
+    from botflow.app import run_application, run_flow_manager
+    from botflow.manager import FlowManager
+    from botflow.widgets import (
+        FileStepSpec,
+        FileWidget,
+        FormInput,
+        FormStepSpec,
+        FormWidget,
+        TextStepSpec,
+        TextWidget,
+    )
 
 __all__ = [
     'FlowManager',
@@ -19,35 +29,41 @@ __all__ = [
     'FormWidget',
     'TextStepSpec',
     'TextWidget',
+    'FinishStep',
     'FlowSpec',
+    'ResourceSpec',
+    'RetryPolicy',
+    'cache_step',
+    'retry_step',
+    'run_application',
+    'run_flow_manager',
 ]
 
-import sys
-from pathlib import Path
+# Qt-backed names are imported on first access so Qt-free entry points such as
+# botflow.headless never load PySide6.
+_LAZY_MODULES = {
+    'FlowManager': 'botflow.manager',
+    'FileStepSpec': 'botflow.widgets',
+    'FileWidget': 'botflow.widgets',
+    'FormInput': 'botflow.widgets',
+    'FormStepSpec': 'botflow.widgets',
+    'FormWidget': 'botflow.widgets',
+    'TextStepSpec': 'botflow.widgets',
+    'TextWidget': 'botflow.widgets',
+    'run_application': 'botflow.app',
+    'run_flow_manager': 'botflow.app',
+}
 
-from PySide6.QtWidgets import QApplication
 
+def __getattr__(name: str) -> Any:
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-def get_hook_dirs():
-    return [str(Path(__file__).resolve().with_name('__pyinstaller'))]
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
 
-def run_application():
-    app = QApplication.instance()
-    if not app:
-        app = QApplication(sys.argv)
-    return app
-
-
-def run_flow_manager(
-    flow_manager: FlowManager,
-    *,
-    width: int = 720,
-    height: int = 300,
-    window_title: str = 'Flow Manager',
-):
-    app = run_application()
-    flow_manager.resize(width, height)
-    flow_manager.setWindowTitle(window_title)
-    flow_manager.show()
-    sys.exit(app.exec())
+def get_hook_dirs():
+    return [str(Path(__file__).resolve().with_name('__pyinstaller'))]
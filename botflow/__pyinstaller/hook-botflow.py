@@ -8,3 +8,5 @@ if module_path:
     datas = [(str(botflow_dir / 'resources'), 'lib_resources')]
 else:
     datas = []
+
+hiddenimports = ['botflow.app', 'botflow.manager', 'botflow.widgets']
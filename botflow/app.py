@@ -0,0 +1,26 @@
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from botflow.manager import FlowManager
+
+
+def run_application():
+    app = QApplication.instance()
+    if not app:
+        app = QApplication(sys.argv)
+    return app
+
+
+def run_flow_manager(
+    flow_manager: FlowManager,
+    *,
+    width: int = 720,
+    height: int = 300,
+    window_title: str = 'Flow Manager',
+):
+    app = run_application()
+    flow_manager.resize(width, height)
+    flow_manager.setWindowTitle(window_title)
+    flow_manager.show()
+    sys.exit(app.exec())
@@ -0,0 +1,171 @@
+import csv
+import json
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from logging import Logger
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Union
+
+from PySide6.QtCore import QObject, Qt, Signal, Slot
+
+from botflow.cancellation import CancelToken
+from botflow.exceptions import PipelineExceptedError
+from botflow.loops import LoopRunner
+from botflow.reporter import ProgressReporter
+from botflow.types import PipelineStep
+from botflow.workers import PipelineWorker
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    index: int
+    ok: bool
+    context: dict[str, Any]
+    error: str = field(default='')
+
+
+def load_batch_records(path: Union[str, Path]) -> list[dict[str, Any]]:
+    path = Path(path)
+
+    if path.suffix.lower() == '.csv':
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            return [dict(row) for row in csv.DictReader(f)]
+
+    if path.suffix.lower() == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if not isinstance(data, list) or not all(isinstance(r, dict) for r in data):
+            raise ValueError('JSON batch file must contain a list of objects.')
+        return data
+
+    raise ValueError('Batch file must have a .csv or .json extension.')
+
+
+class BatchWorker(QObject):
+    progress = Signal(int)
+    status = Signal(str)
+    record_finished = Signal(object)
+    error = Signal(str)
+    cancelled = Signal()
+    finished = Signal(list)
+
+    def __init__(
+        self,
+        records: Iterable[dict[str, Any]],
+        pipeline: List[PipelineStep],
+        logger: Logger,
+        async_loop: LoopRunner,
+        concurrency: int = 4,
+        base_context: Optional[dict[str, Any]] = None,
+        max_updates_per_second: Optional[float] = None,
+        **worker_kwargs: Any,
+    ):
+        super().__init__()
+        self.records = records
+        self.pipeline = pipeline
+        self.logger = logger
+        self.async_loop = async_loop
+        self.async_loop.start()
+        self.concurrency = max(1, concurrency)
+        self.base_context = base_context or {}
+        self.worker_kwargs = worker_kwargs
+        self.reporter = ProgressReporter(
+            self.status.emit, self.progress.emit, max_rate=max_updates_per_second
+        )
+        self.cancel_token = CancelToken()
+
+        self._lock = threading.Lock()
+        self._record_progress: list[int] = []
+        self._done = 0
+        self._failed = 0
+
+    def cancel(self) -> None:
+        self.logger.info('Batch cancellation requested')
+        self.cancel_token.cancel()
+
+    def _report_record_progress(self, index: int, value: int) -> None:
+        with self._lock:
+            self._record_progress[index] = max(0, min(value, 100))
+            overall = sum(self._record_progress) // len(self._record_progress)
+            self.reporter.progress(overall)
+
+    def _run_record(self, index: int, record: dict[str, Any]) -> BatchResult:
+        ctx = {**self.base_context, **record}
+        outcome: dict[str, Any] = {'ok': False, 'error': 'Cancelled'}
+
+        if not self.cancel_token.cancelled:
+            token = self.cancel_token.child()
+            worker = PipelineWorker(
+                ctx,
+                self.pipeline,
+                self.logger,
+                self.async_loop,
+                cancel_token=token,
+                **self.worker_kwargs,
+            )
+            direct = Qt.ConnectionType.DirectConnection
+            worker.progress.connect(lambda v: self._report_record_progress(index, v), direct)
+            worker.finished.connect(lambda d: outcome.update(ok=True, error=''), direct)
+            worker.error.connect(lambda e: outcome.update(ok=False, error=e), direct)
+            worker.run()
+            token.detach()
+
+        result = BatchResult(
+            index=index,
+            ok=outcome['ok'],
+            context=ctx,
+            error=outcome['error'],
+        )
+
+        with self._lock:
+            self._record_progress[index] = 100
+            self._done += 1
+            self._failed += 0 if result.ok else 1
+            done, failed = self._done, self._failed
+
+        total = len(self._record_progress)
+        self.logger.info('Batch record %d finished (ok=%s)', index + 1, result.ok)
+        self.reporter.status(f'Processed {done} of {total} records ({failed} failed)')
+        self.record_finished.emit(result)
+        return result
+
+    @Slot()
+    def run(self):
+        try:
+            records = list(self.records)
+            total = len(records)
+            self._record_progress = [0] * total
+            self.logger.info('Starting batch with %d records', total)
+
+            self.reporter.progress(0)
+            self.reporter.status(f'Processed 0 of {total} records (0 failed)')
+
+            with ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix='botflow-batch'
+            ) as pool:
+                futures = [pool.submit(self._run_record, i, r) for i, r in enumerate(records)]
+                results = [fut.result() for fut in futures]
+
+            if self.cancel_token.cancelled:
+                self.logger.warning('Batch cancelled')
+                self.reporter.flush()
+                self.cancelled.emit()
+                return
+
+            self.reporter.progress(100)
+            self.reporter.flush()
+
+            self.logger.info('Batch finished: %d ok, %d failed', total - self._failed, self._failed)
+            self.finished.emit(results)
+        except Exception as e:
+            tb = traceback.format_exc()
+            self.logger.warning('Batch Error: %s', tb)
+            self.reporter.flush()
+
+            if isinstance(e, PipelineExceptedError):
+                self.error.emit(e.popup_message)
+            else:
+                self.error.emit(tb)
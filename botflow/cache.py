@@ -0,0 +1,139 @@
+import hashlib
+import os
+import pickle
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, TypeVar, Union
+
+Fn = TypeVar('Fn', bound=Callable[..., Any])
+
+CACHE_ATTR = 'botflow_cache'
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    version: str = field(default='')
+
+
+def cache_step(
+    inputs: Iterable[str], outputs: Iterable[str], version: str = ''
+) -> Callable[[Fn], Fn]:
+    def decorator(fn: Fn) -> Fn:
+        setattr(fn, CACHE_ATTR, CachePolicy(tuple(inputs), tuple(outputs), version))
+        return fn
+
+    return decorator
+
+
+class StepCache:
+    def __init__(
+        self,
+        directory: Union[str, Path] = './.botflow_cache',
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._file_hashes: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def _file_digest(self, path: Path) -> str:
+        stat = path.stat()
+        memo_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            digest = self._file_hashes.get(memo_key)
+        if digest:
+            return digest
+
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+        digest = f'{stat.st_size}:{stat.st_mtime_ns}:{h.hexdigest()}'
+
+        with self._lock:
+            self._file_hashes[memo_key] = digest
+        return digest
+
+    @staticmethod
+    def _frame(tag: bytes, payload: bytes) -> bytes:
+        return tag + f'{len(payload)}:'.encode() + payload
+
+    def _fingerprint(self, value: Any) -> bytes:
+        if isinstance(value, (str, Path)) and str(value):
+            try:
+                path = Path(value)
+                if path.is_file():
+                    return self._frame(b'f', self._file_digest(path).encode())
+            except (OSError, ValueError):
+                pass
+
+        # Containers carry a type tag, their length and a terminator so nesting can't collide.
+        if isinstance(value, dict):
+            items = sorted(value.items(), key=lambda kv: repr(kv[0]))
+            body = b''.join(self._fingerprint(k) + self._fingerprint(v) for k, v in items)
+            return b'd%d(' % len(items) + body + b')'
+
+        if isinstance(value, (list, tuple)):
+            tag = b'l' if isinstance(value, list) else b't'
+            return tag + b'%d(' % len(value) + b''.join(map(self._fingerprint, value)) + b')'
+
+        try:
+            return self._frame(b'p', pickle.dumps(value))
+        except Exception:
+            return self._frame(b'r', repr(value).encode())
+
+    def key(self, fn: Callable[..., Any], policy: CachePolicy, data: dict[str, Any]) -> str:
+        h = hashlib.sha256()
+        h.update(f'{fn.__module__}.{fn.__qualname__}:{policy.version}'.encode())
+        for name in policy.inputs:
+            h.update(self._frame(b'n', name.encode()))
+            h.update(self._fingerprint(data[name]) if name in data else b'<missing>')
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f'{key}.pkl'
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                outputs = pickle.load(f)
+            os.utime(path)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+        return outputs if isinstance(outputs, dict) else None
+
+    def put(self, key: str, outputs: dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(outputs, f)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.directory.glob('*.pkl'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for path in self.directory.glob('*.pkl'):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from botflow.exceptions import PipelineCancelledError
+
+T = TypeVar('T')
+
+
+class CancelToken:
+    def __init__(self, parent: Optional['CancelToken'] = None) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+        self._parent = parent
+
+        if parent:
+            parent.add_callback(self.cancel)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def child(self) -> 'CancelToken':
+        return CancelToken(parent=self)
+
+    def detach(self) -> None:
+        if self._parent:
+            self._parent.remove_callback(self.cancel)
+            self._parent = None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise PipelineCancelledError('Pipeline cancelled')
+
+
+def wait_future(
+    fut: Future,
+    cancel_token: Optional[CancelToken] = None,
+    timeout: Optional[float] = None,
+) -> Any:
+    stop = threading.Event()
+
+    def abandon() -> None:
+        fut.cancel()
+        stop.set()
+
+    fut.add_done_callback(lambda _: stop.set())
+    if cancel_token:
+        cancel_token.add_callback(abandon)
+
+    try:
+        if not stop.wait(timeout):
+            fut.cancel()
+            raise TimeoutError(f'Timed out after {timeout:g}s')
+
+        if cancel_token and cancel_token.cancelled and (fut.cancelled() or not fut.done()):
+            raise PipelineCancelledError('Pipeline cancelled')
+
+        return fut.result()
+    finally:
+        if cancel_token:
+            cancel_token.remove_callback(abandon)
+
+
+async def await_cancellable(
+    awaitable: Awaitable[T], cancel_token: Optional[CancelToken] = None
+) -> T:
+    task = asyncio.ensure_future(awaitable)
+    loop = asyncio.get_running_loop()
+
+    def abandon() -> None:
+        loop.call_soon_threadsafe(task.cancel)
+
+    if cancel_token:
+        cancel_token.add_callback(abandon)
+
+    try:
+        return await task
+    except asyncio.CancelledError:
+        current = asyncio.current_task()
+        if cancel_token and cancel_token.cancelled and not (current and current.cancelling()):
+            raise PipelineCancelledError('Pipeline cancelled') from None
+        raise
+    finally:
+        if cancel_token:
+            cancel_token.remove_callback(abandon)
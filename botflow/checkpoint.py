@@ -0,0 +1,49 @@
+import os
+import pickle
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from botflow.processes import picklable_view
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    completed: tuple[str, ...]
+    data: dict[str, Any]
+
+
+class CheckpointStore:
+    def __init__(self, directory: Union[str, Path] = './checkpoints') -> None:
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        safe_key = re.sub(r'[^\w.-]', '_', key) or 'pipeline'
+        return self.directory / f'{safe_key}.ckpt'
+
+    def save(self, key: str, completed: list[str], data: dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+
+        checkpoint = Checkpoint(completed=tuple(completed), data=picklable_view(dict(data)))
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(checkpoint, f)
+        os.replace(tmp_path, path)
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        path = self._path(key)
+        if not path.is_file():
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                checkpoint = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+        return checkpoint if isinstance(checkpoint, Checkpoint) else None
+
+    def clear(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
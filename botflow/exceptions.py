@@ -2,3 +2,14 @@ class PipelineExceptedError(Exception):
     def __init__(self, message: str, popup_message: str | None = None):
         super().__init__(message)
         self.popup_message = popup_message or message
+
+    def __reduce__(self):
+        return self.__class__, (str(self), self.popup_message)
+
+
+class StepTimeoutError(PipelineExceptedError):
+    pass
+
+
+class PipelineCancelledError(Exception):
+    pass
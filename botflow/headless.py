@@ -0,0 +1,197 @@
+import argparse
+import importlib
+import json
+import signal
+import sys
+import traceback
+from logging import Logger
+from pathlib import Path
+from typing import Any, Optional, Sequence, TextIO
+
+from botflow.cache import StepCache
+from botflow.cancellation import CancelToken
+from botflow.checkpoint import CheckpointStore
+from botflow.exceptions import PipelineCancelledError, PipelineExceptedError
+from botflow.logger import configure_logger, stop_logger
+from botflow.loops import AsyncLoopPool, AsyncLoopThreadWorker, LoopPlacement, LoopRunner
+from botflow.pipeline import PipelineRunner
+from botflow.specs import FlowSpec
+from botflow.tracing import PipelineTracer
+
+
+class ConsoleProgress:
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        self.stream = stream or sys.stdout
+        self.percentage = 0
+        self.text = ''
+        self._last_line = ''
+
+    def progress(self, value: int) -> None:
+        self.percentage = value
+        self._write()
+
+    def status(self, text: str) -> None:
+        self.text = text
+        self._write()
+
+    def _write(self) -> None:
+        line = f'[{self.percentage:>3}%] {self.text}'
+        if line == self._last_line:
+            return
+        self._last_line = line
+        self.stream.write(line + '\n')
+        self.stream.flush()
+
+
+def load_flow(target: str) -> FlowSpec:
+    module_name, _, attr = target.partition(':')
+    if not module_name or not attr:
+        raise ValueError(f"Expected 'module:attribute', got {target!r}")
+
+    flow = getattr(importlib.import_module(module_name), attr)
+    if not isinstance(flow, FlowSpec):
+        raise TypeError(f'{target} is not a FlowSpec')
+    return flow
+
+
+def load_context(
+    context: Optional[str] = None,
+    context_file: Optional[str | Path] = None,
+) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    for raw in (
+        Path(context_file).read_text(encoding='utf-8-sig') if context_file else None,
+        context,
+    ):
+        if not raw:
+            continue
+        value = json.loads(raw)
+        if not isinstance(value, dict):
+            raise ValueError('Context must be a JSON object')
+        data.update(value)
+    return data
+
+
+def run_headless(
+    flow: FlowSpec,
+    context: Optional[dict[str, Any]] = None,
+    logger: Optional[Logger] = None,
+    *,
+    progress: Optional[ConsoleProgress] = None,
+    cancel_token: Optional[CancelToken] = None,
+    max_updates_per_second: Optional[float] = None,
+    checkpoint_dir: Optional[str | Path] = None,
+    resume: bool = False,
+    cache_dir: str | Path = './.botflow_cache',
+    trace_dir: Optional[str | Path] = None,
+    trace_memory: bool = False,
+    loop_threads: int = 1,
+    loop_placement: LoopPlacement = 'round_robin',
+) -> dict[str, Any]:
+    owns_logger = logger is None
+    logger = logger if logger else configure_logger(queued=True)
+    async_loop: LoopRunner = (
+        AsyncLoopPool(loop_threads, loop_placement) if loop_threads > 1 else AsyncLoopThreadWorker()
+    )
+    async_loop.start()
+    for spec in flow.resources:
+        async_loop.register_resource(spec)
+
+    runner = PipelineRunner(
+        dict(context or {}),
+        flow.on_finish,
+        logger,
+        async_loop,
+        max_parallel_steps=flow.max_parallel_steps,
+        executor=flow.executor,
+        max_updates_per_second=max_updates_per_second,
+        cancel_token=cancel_token,
+        checkpoint_store=CheckpointStore(checkpoint_dir) if checkpoint_dir else None,
+        checkpoint_key=flow.name,
+        resume=resume,
+        step_cache=StepCache(cache_dir),
+        tracer=PipelineTracer(trace_dir, trace_memory) if trace_dir else None,
+        on_progress=progress.progress if progress else None,
+        on_status=progress.status if progress else None,
+    )
+    try:
+        if flow.run_on_loop:
+            return async_loop.run(runner.execute_async())
+        return runner.execute()
+    finally:
+        async_loop.stop()
+        if owns_logger:
+            stop_logger(logger)
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='botflow-run',
+        description="Run a FlowSpec's finish pipeline without a GUI.",
+    )
+    parser.add_argument('flow', help="flow to run, as 'package.module:attribute'")
+    parser.add_argument('--context', help='context as a JSON object')
+    parser.add_argument('--context-file', help='JSON file with the context object')
+    parser.add_argument('--output', help='write the final context as JSON to this file')
+    parser.add_argument('--checkpoint-dir', help='save checkpoints so failed runs can resume')
+    parser.add_argument('--resume', action='store_true', help='resume from the last checkpoint')
+    parser.add_argument('--cache-dir', default='./.botflow_cache')
+    parser.add_argument('--trace-dir', help='write a Chrome trace of the run to this directory')
+    parser.add_argument('--log-dir', default='./logs')
+    parser.add_argument(
+        '--loop-threads', type=int, default=1, help='number of event loop threads for async steps'
+    )
+    parser.add_argument('--quiet', action='store_true', help='do not print progress lines')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    flow = load_flow(args.flow)
+    context = load_context(args.context, args.context_file)
+    logger = configure_logger(log_dir=args.log_dir, queued=True)
+
+    cancel_token = CancelToken()
+
+    def on_interrupt(signum: int, frame: Any) -> None:
+        # A second Ctrl+C falls back to KeyboardInterrupt for steps that ignore the token.
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        cancel_token.cancel()
+
+    previous_handler = signal.signal(signal.SIGINT, on_interrupt)
+    try:
+        result = run_headless(
+            flow,
+            context,
+            logger,
+            progress=None if args.quiet else ConsoleProgress(),
+            cancel_token=cancel_token,
+            max_updates_per_second=None if args.quiet else 10,
+            checkpoint_dir=args.checkpoint_dir,
+            resume=args.resume,
+            cache_dir=args.cache_dir,
+            trace_dir=args.trace_dir,
+            loop_threads=args.loop_threads,
+        )
+    except (PipelineCancelledError, KeyboardInterrupt):
+        print('Pipeline cancelled', file=sys.stderr)
+        return 130
+    except PipelineExceptedError as e:
+        print(e.popup_message, file=sys.stderr)
+        return 1
+    except Exception:
+        print(traceback.format_exc(), file=sys.stderr)
+        return 1
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        stop_logger(logger)
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(result, default=str, ensure_ascii=False, indent=2), encoding='utf-8'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
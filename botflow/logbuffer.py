@@ -0,0 +1,40 @@
+import itertools
+import logging
+from collections import deque
+
+
+class LogRingBuffer(logging.Handler):
+    def __init__(self, capacity: int = 1000, level: int = logging.NOTSET) -> None:
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        super().__init__(level)
+        self.capacity = capacity
+        self.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s', '%H:%M:%S'))
+        self._lines: deque[str] = deque(maxlen=capacity)
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        # Handler.handle already holds self.lock here.
+        self._lines.append(line)
+        self._total += 1
+
+    def read_since(self, seen: int) -> tuple[list[str], int]:
+        with self.lock:
+            count = min(self._total - seen, len(self._lines))
+            if count <= 0:
+                return [], self._total
+            start = len(self._lines) - count
+            return list(itertools.islice(self._lines, start, None)), self._total
+
+    def lines(self) -> list[str]:
+        with self.lock:
+            return list(self._lines)
@@ -1,24 +1,24 @@
+import atexit
 import logging
+import queue
 from datetime import datetime as dt
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 
+_listeners: dict[str, tuple[QueueHandler, QueueListener]] = {}
 
-def configure_logger(
-    name: str = 'big_views',
-    log_dir: str | Path = './logs',
-    level: int = logging.INFO,
-    console: bool = True,
-    rotating_file: bool = True,
-) -> logging.Logger:
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    logger.propagate = False
 
+def _build_handlers(
+    log_dir: str | Path,
+    level: int,
+    console: bool,
+    rotating_file: bool,
+) -> list[logging.Handler]:
     log_dir = Path(log_dir)
     log_dir.mkdir(parents=True, exist_ok=True)
 
     fmt = logging.Formatter('%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s')
+    handlers: list[logging.Handler] = []
 
     if rotating_file:
         log_name = dt.now().strftime('%d-%m-%Y_%Hh-%Mm-%Ss')
@@ -34,12 +34,62 @@ def configure_logger(
         file_handler.suffix = '%Y%m%d'
         file_handler.setLevel(level)
         file_handler.setFormatter(fmt)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     if console:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(fmt)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    return handlers
+
 
+def configure_logger(
+    name: str = 'big_views',
+    log_dir: str | Path = './logs',
+    level: int = logging.INFO,
+    console: bool = True,
+    rotating_file: bool = True,
+    queued: bool = False,
+) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    handlers = _build_handlers(log_dir, level, console, rotating_file)
+    if not queued:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return logger
+
+    # File and console writes happen on the listener thread instead of the caller's.
+    stop_logger(logger)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    logger.addHandler(queue_handler)
+    _listeners[name] = (queue_handler, listener)
     return logger
+
+
+def stop_logger(logger: logging.Logger) -> None:
+    entry = _listeners.pop(logger.name, None)
+    if not entry:
+        return
+
+    queue_handler, listener = entry
+    # Swap the handlers in one assignment so no record is dropped or written twice.
+    logger.handlers = [h for h in logger.handlers if h is not queue_handler] + list(
+        listener.handlers
+    )
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+
+
+@atexit.register
+def _stop_all_loggers() -> None:
+    for name in list(_listeners):
+        stop_logger(logging.getLogger(name))
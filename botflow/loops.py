@@ -0,0 +1,154 @@
+import asyncio
+import itertools
+import os
+import threading
+import zlib
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Coroutine, Literal, Optional, Union
+
+from botflow.cancellation import CancelToken, wait_future
+from botflow.registry import ResourceRegistry, ResourceSpec
+
+LoopPlacement = Literal['round_robin', 'least_busy']
+
+
+@dataclass(frozen=True)
+class LoopStats:
+    index: int
+    thread_name: str
+    in_flight: int
+    completed: int
+
+
+class AsyncLoopThreadWorker:
+    def __init__(self, name: str = 'botflow-loop') -> None:
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.resources = ResourceRegistry()
+        self.in_flight = 0
+        self.completed = 0
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._count_lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._started.clear()
+
+        def _runner() -> None:
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            self.resources.loop = self.loop
+            self._started.set()
+            self.loop.run_forever()
+
+        self._thread = threading.Thread(target=_runner, name=self.name, daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def stop(self, timeout: Optional[float] = 5) -> None:
+        if not self.loop or not self._thread or not self._thread.is_alive():
+            return
+
+        try:
+            self.run(self.resources.aclose(), timeout=timeout)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+            self.resources.loop = None
+
+    def shard(self, key: Optional[str] = None) -> 'AsyncLoopThreadWorker':
+        return self
+
+    def register_resource(self, spec: ResourceSpec) -> None:
+        self.resources.register_spec(spec)
+
+    def _finished(self, _: Future) -> None:
+        with self._count_lock:
+            self.in_flight -= 1
+            self.completed += 1
+
+    def submit(self, coro: Coroutine[Any, Any, Any], key: Optional[str] = None) -> Future:
+        if not self.loop:
+            raise RuntimeError('Async loop not started')
+
+        with self._count_lock:
+            self.in_flight += 1
+        fut = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        fut.add_done_callback(self._finished)
+        return fut
+
+    def run(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+        key: Optional[str] = None,
+    ) -> Any:
+        return wait_future(self.submit(coro), cancel_token, timeout)
+
+    def stats(self) -> list[LoopStats]:
+        return [LoopStats(0, self.name, self.in_flight, self.completed)]
+
+
+class AsyncLoopPool:
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        placement: LoopPlacement = 'round_robin',
+        name: str = 'botflow-loop',
+    ) -> None:
+        size = size or os.cpu_count() or 1
+        if placement not in ('round_robin', 'least_busy'):
+            raise ValueError(f'Unknown loop placement: {placement}')
+
+        self.placement = placement
+        self.shards = [AsyncLoopThreadWorker(f'{name}-{i}') for i in range(size)]
+        self._next = itertools.count()
+
+    @property
+    def resources(self) -> ResourceRegistry:
+        return self.shards[0].resources
+
+    def start(self) -> None:
+        for shard in self.shards:
+            shard.start()
+
+    def stop(self, timeout: Optional[float] = 5) -> None:
+        for shard in self.shards:
+            shard.stop(timeout)
+
+    def shard(self, key: Optional[str] = None) -> AsyncLoopThreadWorker:
+        if key is not None:
+            return self.shards[zlib.crc32(key.encode('utf-8')) % len(self.shards)]
+        if self.placement == 'least_busy':
+            return min(self.shards, key=lambda shard: shard.in_flight)
+        return self.shards[next(self._next) % len(self.shards)]
+
+    def register_resource(self, spec: ResourceSpec) -> None:
+        for shard in self.shards:
+            shard.register_resource(spec)
+
+    def submit(self, coro: Coroutine[Any, Any, Any], key: Optional[str] = None) -> Future:
+        return self.shard(key).submit(coro)
+
+    def run(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+        key: Optional[str] = None,
+    ) -> Any:
+        return wait_future(self.submit(coro, key), cancel_token, timeout)
+
+    def stats(self) -> list[LoopStats]:
+        return [
+            LoopStats(i, shard.name, shard.in_flight, shard.completed)
+            for i, shard in enumerate(self.shards)
+        ]
+
+
+LoopRunner = Union[AsyncLoopThreadWorker, AsyncLoopPool]
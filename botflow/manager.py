@@ -1,10 +1,15 @@
 import os
+from concurrent.futures import Future
+from functools import partial
 from logging import Logger
+from pathlib import Path
 from typing import Any, Optional
 
-from PySide6.QtCore import QThread, Slot
+from PySide6.QtCore import QTimer, Signal, Slot
 from PySide6.QtGui import QCloseEvent, QIcon, Qt
 from PySide6.QtWidgets import (
+    QApplication,
+    QFileDialog,
     QHBoxLayout,
     QMessageBox,
     QPushButton,
@@ -15,17 +20,29 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from botflow.batch import BatchResult, BatchWorker, load_batch_records
+from botflow.cache import StepCache
+from botflow.checkpoint import CheckpointStore
 from botflow.i18n import I18n
-from botflow.logger import configure_logger
-from botflow.pages import InitialPage, LoadingPage
-from botflow.qss import qss_to_string
-from botflow.resolver import find_resource_file
+from botflow.logbuffer import LogRingBuffer
+from botflow.logger import configure_logger, stop_logger
+from botflow.loops import AsyncLoopPool, AsyncLoopThreadWorker, LoopPlacement, LoopRunner
+from botflow.pages import InitialPage, LoadingPage, QueuePanel
+from botflow.prefetch import Prefetcher
+from botflow.processes import ProcessStepExecutor
+from botflow.qss import BOTFLOW_STYLES, qss_registry
+from botflow.runqueue import RunJob
 from botflow.runtime import get_lang
-from botflow.types import FinishFn, FlowSpec, LoadingAbstract, StepSpec, WidgetAbstract
-from botflow.workers import AsyncLoopThreadWorker, PipelineWorker
+from botflow.tracing import PipelineTracer
+from botflow.types import FlowSpec, LoadingAbstract, PipelineStep, StepSpec, WidgetAbstract
+from botflow.validation import StepValidation
+from botflow.workers import PipelineThread, PipelineWorker
 
 
 class FlowManager(QWidget):
+    validation_finished = Signal(object)
+    live_validation_finished = Signal(object)
+
     ROOT_INITIAL = 'initial'
     ROOT_WIZARD = 'wizard'
     ROOT_LOADING = 'loading'
@@ -35,23 +52,72 @@ class FlowManager(QWidget):
         flow: FlowSpec,
         logger: Optional[Logger] = None,
         icon_path: Optional[str] = None,
+        max_updates_per_second: Optional[float] = 30,
+        allow_batch: bool = False,
+        batch_concurrency: int = 4,
+        checkpoint_dir: Optional[str | Path] = None,
+        cache_dir: str | Path = './.botflow_cache',
+        trace_dir: Optional[str | Path] = None,
+        trace_memory: bool = False,
+        loop_threads: int = 1,
+        loop_placement: LoopPlacement = 'round_robin',
+        queue_runs: bool = False,
+        log_lines: int = 0,
+        max_live_pages: Optional[int] = None,
+        style_application: bool = False,
     ):
+        if max_live_pages is not None and max_live_pages < 1:
+            raise ValueError('max_live_pages must be at least 1')
+
         super().__init__()
         self.flow = flow
-        self.logger = logger if logger else configure_logger()
+        self.max_live_pages = max_live_pages
+        self.style_application = style_application
+        self.queue_runs = queue_runs
+        self.max_updates_per_second = max_updates_per_second
+        self.allow_batch = allow_batch
+        self.batch_concurrency = batch_concurrency
+        self.checkpoint_store = CheckpointStore(checkpoint_dir) if checkpoint_dir else None
+        self.step_cache = StepCache(cache_dir)
+        self.trace_dir = trace_dir
+        self.trace_memory = trace_memory
+        self.logger = logger if logger else configure_logger(queued=True)
+        self._owns_logger = logger is None
+        self.log_buffer = LogRingBuffer(log_lines) if log_lines else None
+        if self.log_buffer:
+            self.logger.addHandler(self.log_buffer)
 
         self.lang = get_lang() or 'en_US'
         self.i18n = I18n.from_locales_dirs(self.lang)
 
         self.context: dict[str, Any] = {}
         self.steps: list[StepSpec] = []
-        self.pipeline: list[FinishFn] = []
+        self.pipeline: list[PipelineStep] = []
+        self._live_pages: list[int] = []
 
-        self._async_loop = AsyncLoopThreadWorker()
+        self._async_loop: LoopRunner = (
+            AsyncLoopPool(loop_threads, loop_placement)
+            if loop_threads > 1
+            else AsyncLoopThreadWorker()
+        )
         self._async_loop.start()
-
-        self._thread: Optional[QThread] = None
-        self._worker: Optional[PipelineWorker] = None
+        self._process_pool = ProcessStepExecutor()
+
+        self._pipeline_thread = PipelineThread()
+        self.validation = StepValidation(self._async_loop)
+        self.prefetcher = Prefetcher(self._async_loop)
+        self._pending_validation: Optional[tuple[StepSpec, Any, Future]] = None
+        self.validation_finished.connect(self._on_validation_finished)
+
+        self._live_page: Optional[WidgetAbstract] = None
+        self._live_future: Optional[Future] = None
+        self._live_timer = QTimer(self)
+        self._live_timer.setSingleShot(True)
+        self._live_timer.timeout.connect(self._run_live_validation)
+        self.live_validation_finished.connect(self._on_live_validation_finished)
+        self._worker: Optional[PipelineWorker | BatchWorker] = None
+        self._queued: dict[int, PipelineWorker] = {}
+        self._job_count = 0
 
         self._set_style()
 
@@ -74,6 +140,8 @@ class FlowManager(QWidget):
 
         self.initial_page = self.create_initial_page()
         self.loading_page = self.create_loading_page()
+        self.loading_page.cancel_requested.connect(self.cancel_pipeline)
+        self.queue_panel = QueuePanel(self.i18n) if queue_runs else None
 
         self._build_wizard_ui()
         self.root_stack = QStackedWidget()
@@ -87,9 +155,16 @@ class FlowManager(QWidget):
         self.set_root_page(self.ROOT_INITIAL)
 
     def _set_style(self):
-        style_file = find_resource_file('styles/flow_manager.qss')
-        qss_string = qss_to_string(style_file)
-        self.setStyleSheet(qss_string)
+        # One merged sheet on the root is parsed once; pages and widgets inherit it.
+        qss_string = qss_registry.stylesheet(*self.style_resources())
+        app = QApplication.instance()
+        if self.style_application and isinstance(app, QApplication):
+            app.setStyleSheet(qss_string)
+        else:
+            self.setStyleSheet(qss_string)
+
+    def style_resources(self) -> tuple[str, ...]:
+        return BOTFLOW_STYLES
 
     def _build_wizard_ui(self) -> None:
         nav_container = QWidget()
@@ -111,6 +186,12 @@ class FlowManager(QWidget):
         center_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self._wizard_layout.addWidget(center_container, 1)
 
+        if self.queue_panel:
+            self._wizard_layout.addSpacerItem(
+                QSpacerItem(0, 10, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+            )
+            self._wizard_layout.addWidget(self.queue_panel, 0)
+
         self._wizard_layout.addSpacerItem(
             QSpacerItem(0, 10, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
         )
@@ -121,10 +202,11 @@ class FlowManager(QWidget):
         self._wizard_layout.addWidget(nav_container, 0)
 
     def create_initial_page(self) -> InitialPage:
-        return InitialPage(self.flow.name, self.go_to_wizard_page, self.i18n)
+        on_batch = self.choose_batch_file if self.allow_batch else None
+        return InitialPage(self.flow.name, self.go_to_wizard_page, self.i18n, on_batch=on_batch)
 
     def create_loading_page(self) -> LoadingAbstract:
-        return LoadingPage(self.i18n)
+        return LoadingPage(self.i18n, log_buffer=self.log_buffer)
 
     def current_index(self) -> int:
         return self.stack.currentIndex()
@@ -141,6 +223,9 @@ class FlowManager(QWidget):
     def get_page_value(self, widget: WidgetAbstract) -> Any:
         return widget.value()
 
+    def set_page_value(self, widget: WidgetAbstract, value: Any) -> None:
+        widget.set_value(value)
+
     def register_root_pages(self) -> None:
         self.add_root_page(self.ROOT_INITIAL, self.initial_page)
         self.add_root_page(self.ROOT_WIZARD, self.wizard_page)
@@ -158,6 +243,8 @@ class FlowManager(QWidget):
         self.context = {}
         self.pipeline = list(flow.on_finish)
         self.steps = list(flow.steps)
+        for resource in flow.resources:
+            self._async_loop.register_resource(resource)
         self.rebuild_pages(go_to=0)
 
     def rebuild_pages(self, go_to: int = 0) -> None:
@@ -166,12 +253,85 @@ class FlowManager(QWidget):
             self.stack.removeWidget(w)
             w.deleteLater()
 
-        for spec in self.steps:
-            self.stack.addWidget(self.make_page(spec))
+        # Step widgets are built on first visit; until then each index holds a placeholder.
+        self._live_pages = []
+        for _ in self.steps:
+            self.stack.addWidget(QWidget())
+
+        self.show_page(max(0, min(go_to, self.stack.count() - 1)))
 
-        self.stack.setCurrentIndex(max(0, min(go_to, self.stack.count() - 1)))
+    def show_page(self, index: int) -> None:
+        if self.steps:
+            self._ensure_page(index)
+            self.stack.setCurrentIndex(index)
+            self._evict_pages(keep=index)
         self.update_nav()
 
+    def _ensure_page(self, index: int) -> None:
+        if index in self._live_pages:
+            self._live_pages.remove(index)
+            self._live_pages.append(index)
+            return
+
+        spec = self.steps[index]
+        page = self.make_page(spec)
+        if spec.key in self.context and self._can_restore(page):
+            self.set_page_value(page, self.context[spec.key])
+        if spec.live_validation and spec.validator and isinstance(page, WidgetAbstract):
+            page.value_edited.connect(partial(self._schedule_live_validation, page))
+        if spec.prefetch and isinstance(page, WidgetAbstract):
+            page.value_edited.connect(partial(self.prefetcher.cancel, spec.key))
+        self._replace_page(index, page)
+        self._live_pages.append(index)
+
+    def _evict_pages(self, keep: int) -> None:
+        if self.max_live_pages is None:
+            return
+
+        for index in list(self._live_pages):
+            if len(self._live_pages) <= self.max_live_pages:
+                return
+            page = self.stack.widget(index)
+            # Pages that cannot restore a value are never evicted, so nothing typed is lost.
+            restorable = self._can_restore(page)
+            if index == keep or (isinstance(page, WidgetAbstract) and not restorable):
+                continue
+            if isinstance(page, WidgetAbstract):
+                self.context[self.steps[index].key] = self.get_page_value(page)
+            self._drop_page(index)
+
+    def _can_restore(self, page: QWidget) -> bool:
+        return isinstance(page, WidgetAbstract) and page.can_restore()
+
+    def _drop_page(self, index: int) -> None:
+        self._replace_page(index, QWidget())
+        self._live_pages.remove(index)
+
+    def reset_pages(self) -> None:
+        self.context = {}
+        self.validation.clear()
+        # Queued jobs took their own snapshot and still need the running prefetches.
+        if self.queue_runs:
+            self.prefetcher.release()
+        else:
+            self.prefetcher.cancel_all()
+        for index in list(self._live_pages):
+            page = self.stack.widget(index)
+            if isinstance(page, WidgetAbstract) and page.can_reset():
+                page.reset()
+            else:
+                self._drop_page(index)
+        self.show_page(0)
+
+    def _replace_page(self, index: int, page: QWidget) -> None:
+        current = self.stack.currentIndex()
+        old = self.stack.widget(index)
+        self.stack.removeWidget(old)
+        self.stack.insertWidget(index, page)
+        old.deleteLater()
+        if current >= 0:
+            self.stack.setCurrentIndex(current)
+
     def update_nav(self) -> None:
         i = self.current_index()
         self.back_btn.setEnabled(i > 0)
@@ -179,15 +339,23 @@ class FlowManager(QWidget):
         text = self.i18n.t('common.start') if last else self.i18n.t('common.next')
         self.next_btn.setText(text)
 
-    def validate_step(self, spec: StepSpec, value: Any) -> tuple[bool, str]:
-        if spec.validator:
-            return spec.validator(value)
-        return True, ''
+    def validate_step(self, spec: StepSpec, value: Any) -> Future:
+        return self.validation.submit(spec, value)
 
-    def confirm_run(self) -> bool:
+    def _start_validation(self, spec: StepSpec, value: Any) -> Future:
+        result = self.validate_step(spec, value)
+        if isinstance(result, Future):
+            return result
+
+        # Overrides written for the old hook return (ok, message) directly.
+        future: Future = Future()
+        future.set_result(result)
+        return future
+
+    def confirm_run(self, text: Optional[str] = None) -> bool:
         reply = QMessageBox(self)
         reply.setWindowTitle(self.i18n.t('dialogs.confirm.title'))
-        reply.setText(self.i18n.t('dialogs.confirm.run_pipeline_text'))
+        reply.setText(text or self.i18n.t('dialogs.confirm.run_pipeline_text'))
 
         yes_button = reply.addButton(
             self.i18n.t('dialogs.confirm.yes'), QMessageBox.ButtonRole.YesRole
@@ -213,20 +381,110 @@ class FlowManager(QWidget):
     def back(self) -> None:
         i = self.current_index()
         if i > 0:
-            self.stack.setCurrentIndex(i - 1)
-            self.update_nav()
+            self.show_page(i - 1)
 
     def foward(self) -> None:
+        if self._pending_validation:
+            return
+        self._live_timer.stop()
+
         spec = self.current_spec()
         page = self.stack.currentWidget()
         val = self.get_page_value(page) if isinstance(page, WidgetAbstract) else None
 
-        ok, err = self.validate_step(spec, val)
+        future = self._start_validation(spec, val)
+        if future.done():
+            self._finish_validation(spec, val, future)
+            return
+
+        self._pending_validation = (spec, val, future)
+        self.set_validating(True)
+        future.add_done_callback(self.validation_finished.emit)
+
+    def set_validating(self, busy: bool) -> None:
+        self.stack.setEnabled(not busy)
+        self.next_btn.setProperty('busy', busy)
+        self.next_btn.style().unpolish(self.next_btn)
+        self.next_btn.style().polish(self.next_btn)
+        if busy:
+            self.next_btn.setEnabled(False)
+            self.back_btn.setEnabled(False)
+            self.next_btn.setText(self.i18n.t('common.validating'))
+        else:
+            self.next_btn.setEnabled(True)
+            self.update_nav()
+
+    @Slot(object)
+    def _on_validation_finished(self, future: Future) -> None:
+        pending = self._pending_validation
+        if not pending or pending[2] is not future:
+            return
+
+        self._pending_validation = None
+        self.set_validating(False)
+        if not future.cancelled():
+            self._finish_validation(pending[0], pending[1], future)
+
+    def _finish_validation(self, spec: StepSpec, value: Any, future: Future) -> None:
+        try:
+            ok, err = future.result()
+        except Exception as e:
+            self.logger.exception('Validation of step %s failed', spec.key)
+            ok, err = False, str(e)
+
         if not ok:
             self.show_warn(err)
             return
 
-        self.context[spec.key] = val
+        self.commit_step(spec, value)
+
+    def _schedule_live_validation(self, page: WidgetAbstract) -> None:
+        self._cancel_live_validation()
+        page.show_validation(None, '')
+        self._live_page = page
+        self._live_timer.start(int(page.spec.live_validation_delay * 1000))
+
+    def _cancel_live_validation(self) -> None:
+        future, self._live_future = self._live_future, None
+        pending = self._pending_validation
+        # A check that foward is waiting on is never cancelled.
+        if future and not (pending and pending[2] is future):
+            future.cancel()
+
+    def _run_live_validation(self) -> None:
+        page = self._live_page
+        if page is None or page is not self.stack.currentWidget():
+            return
+
+        future = self._start_validation(page.spec, self.get_page_value(page))
+        if future.done():
+            self._show_live_result(page, future)
+            return
+
+        page.show_validation(None, self.i18n.t('common.validating'))
+        self._live_future = future
+        future.add_done_callback(self.live_validation_finished.emit)
+
+    @Slot(object)
+    def _on_live_validation_finished(self, future: Future) -> None:
+        if future is not self._live_future:
+            return
+
+        self._live_future = None
+        page = self._live_page
+        if page is not None and page is self.stack.currentWidget() and not future.cancelled():
+            self._show_live_result(page, future)
+
+    def _show_live_result(self, page: WidgetAbstract, future: Future) -> None:
+        try:
+            ok, err = future.result()
+        except Exception as e:
+            ok, err = False, str(e)
+        page.show_validation(ok, '' if ok else err)
+
+    def commit_step(self, spec: StepSpec, value: Any) -> None:
+        self.context[spec.key] = value
+        self.prefetcher.start(spec, value)
 
         if self.current_index() == self.stack.count() - 1:
             can_run = self.confirm_run()
@@ -234,40 +492,141 @@ class FlowManager(QWidget):
             if not can_run:
                 return
 
-            self.run_pipeline_threaded()
+            if self.queue_runs:
+                self.enqueue_run()
+            else:
+                self.run_pipeline_threaded()
             return
 
-        self.stack.setCurrentIndex(self.current_index() + 1)
-        self.update_nav()
+        self.show_page(self.current_index() + 1)
+
+    def worker_kwargs(self) -> dict[str, Any]:
+        return {
+            'max_parallel_steps': self.flow.max_parallel_steps,
+            'executor': self.flow.executor,
+            'process_pool': self._process_pool,
+            'step_cache': self.step_cache,
+        }
+
+    def make_pipeline_worker(self, **kwargs: Any) -> PipelineWorker:
+        return PipelineWorker(
+            self.context.copy(),
+            self.pipeline,
+            self.logger,
+            self._async_loop,
+            max_updates_per_second=self.max_updates_per_second,
+            tracer=PipelineTracer(self.trace_dir, self.trace_memory) if self.trace_dir else None,
+            prefetched=self.prefetcher.snapshot(),
+            **kwargs,
+            **self.worker_kwargs(),
+        )
+
+    def run_pipeline_threaded(self, resume: bool = False) -> None:
+        if not self.pipeline:
+            self.show_success(self.i18n.t('messages.no_pipeline'))
+            return
 
-    def run_pipeline_threaded(self) -> None:
+        worker = self.make_pipeline_worker(
+            checkpoint_store=self.checkpoint_store,
+            checkpoint_key=self.flow.name,
+            resume=resume,
+        )
+        self._start_worker(worker, self.on_finished, self.on_error)
+
+    def job_title(self, number: int, context: dict[str, Any]) -> str:
+        return self.i18n.t('queue.job', number=number)
+
+    def enqueue_run(self) -> None:
+        if not self.pipeline or not self.queue_panel:
+            self.show_success(self.i18n.t('messages.no_pipeline'))
+            return
+
+        self._job_count += 1
+        job = RunJob(self._job_count, self.job_title(self._job_count, self.context))
+        # Queued jobs share the flow name, so they run without checkpoints.
+        worker = self.make_pipeline_worker()
+        item = self.queue_panel.add_job(job)
+
+        worker.progress.connect(item.set_progress)
+        worker.status.connect(item.set_status)
+        worker.finished.connect(item.on_finished)
+        worker.error.connect(item.on_error)
+        worker.cancelled.connect(item.on_cancelled)
+
+        worker.finished.connect(worker.deleteLater)
+        worker.error.connect(worker.deleteLater)
+        worker.cancelled.connect(worker.deleteLater)
+
+        item.cancel_requested.connect(worker.cancel)
+        item.done.connect(lambda: self._queued.pop(job.number, None))
+        self._queued[job.number] = worker
+
+        # The pipeline thread runs one job at a time, in submission order.
+        if self.flow.run_on_loop:
+            self._pipeline_thread.submit(lambda: self._async_loop.run(worker.run_async()))
+        else:
+            self._pipeline_thread.submit(worker.run)
+
+        self.restart_to_beginning()
+
+    def choose_batch_file(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            self.i18n.t('dialogs.batch.select_file'),
+            filter='Records (*.csv *.json)',
+        )
+        if not path:
+            return
+
+        try:
+            records = load_batch_records(path)
+        except (OSError, ValueError) as e:
+            self.show_error(str(e))
+            return
+
+        text = self.i18n.t('dialogs.confirm.run_batch_text', count=len(records))
+        if self.confirm_run(text):
+            self.run_batch_threaded(records)
+
+    def run_batch_threaded(self, records: list[dict[str, Any]]) -> None:
         if not self.pipeline:
             self.show_success(self.i18n.t('messages.no_pipeline'))
             return
 
+        worker = BatchWorker(
+            records,
+            self.pipeline,
+            self.logger,
+            self._async_loop,
+            concurrency=self.batch_concurrency,
+            max_updates_per_second=self.max_updates_per_second,
+            **self.worker_kwargs(),
+        )
+        self._start_worker(worker, self.on_batch_finished, self.on_error)
+
+    def _start_worker(self, worker: PipelineWorker | BatchWorker, on_finished, on_error) -> None:
         self.next_btn.setEnabled(False)
         self.back_btn.setEnabled(False)
 
         self.set_root_page(self.ROOT_LOADING)
+        self.loading_page.set_cancellable(True)
 
-        ctx_copy = self.context.copy()
-
-        self._thread = QThread(self)
-        self._worker = PipelineWorker(ctx_copy, self.pipeline, self.logger, self._async_loop)
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
+        self._worker = worker
         self._worker.progress.connect(self.loading_page.set_progress)
         self._worker.status.connect(self.loading_page.set_status)
-        self._worker.finished.connect(self.on_finished)
-        self._worker.error.connect(self.on_error)
+        self._worker.finished.connect(on_finished)
+        self._worker.error.connect(on_error)
+        self._worker.cancelled.connect(self.on_cancelled)
 
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.error.connect(self._thread.quit)
-        self._thread.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
+        # The worker stays on the GUI thread; signals emitted from other threads are queued.
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._worker.error.connect(self._worker.deleteLater)
+        self._worker.cancelled.connect(self._worker.deleteLater)
 
-        self._thread.start()
+        if isinstance(worker, PipelineWorker) and self.flow.run_on_loop:
+            worker.run_on_loop()
+        else:
+            self._pipeline_thread.submit(worker.run)
 
     @Slot(dict)
     def on_finished(self, ctx: dict[str, Any]) -> None:
@@ -277,23 +636,101 @@ class FlowManager(QWidget):
         self.show_success(self.i18n.t('messages.flow_success'))
         self.restart_to_beginning()
 
+    def cancel_pipeline(self) -> None:
+        if not self._worker:
+            return
+
+        self._worker.cancel()
+        self.loading_page.set_cancellable(False)
+        self.loading_page.set_status(self.i18n.t('loading.cancelling'))
+
+    @Slot()
+    def on_cancelled(self) -> None:
+        self.next_btn.setEnabled(True)
+        self.back_btn.setEnabled(True)
+        self.show_warn(self.i18n.t('messages.flow_cancelled'))
+        self.restart_to_beginning()
+
+    @Slot(list)
+    def on_batch_finished(self, results: list[BatchResult]) -> None:
+        self.next_btn.setEnabled(True)
+        self.back_btn.setEnabled(True)
+
+        failed = [r for r in results if not r.ok]
+        summary = self.i18n.t(
+            'messages.batch_summary',
+            succeeded=len(results) - len(failed),
+            total=len(results),
+            failed=len(failed),
+        )
+        if failed:
+            lines = [
+                f'#{r.index + 1}: {(r.error.strip().splitlines() or [""])[-1]}' for r in failed[:10]
+            ]
+            self.show_warn(summary + '\n\n' + '\n'.join(lines))
+        else:
+            self.show_success(summary)
+
+        self.restart_to_beginning()
+
     @Slot(str)
     def on_error(self, error_msg: str) -> None:
         self.next_btn.setEnabled(True)
         self.back_btn.setEnabled(True)
         prefix = self.i18n.t('messages.flow_error_prefix')
         self.show_error(prefix + error_msg)
+
+        if isinstance(self._worker, PipelineWorker) and self.confirm_resume():
+            self.run_pipeline_threaded(resume=True)
+            return
+
+        if self.checkpoint_store:
+            self.checkpoint_store.clear(self.flow.name)
         self.restart_to_beginning()
 
+    def confirm_resume(self) -> bool:
+        if not self.checkpoint_store:
+            return False
+
+        checkpoint = self.checkpoint_store.load(self.flow.name)
+        if not checkpoint or not checkpoint.completed:
+            return False
+
+        done = len(checkpoint.completed)
+        text = self.i18n.t(
+            'dialogs.confirm.resume_text', done=done, total=len(self.pipeline), step=done + 1
+        )
+        return self.confirm_run(text)
+
     def restart_to_beginning(self) -> None:
-        self.load_flow(self.flow)
+        self.reset_pages()
         self.set_root_page(self.ROOT_WIZARD)
 
     def go_to_wizard_page(self) -> None:
         self.set_root_page(self.ROOT_WIZARD)
 
+    def shutdown(self) -> None:
+        if self._worker:
+            self._worker.cancel()
+        for worker in self._queued.values():
+            worker.cancel()
+        if not self._pipeline_thread.stop():
+            self.logger.warning('Pipeline thread did not stop in time')
+        self._process_pool.shutdown(wait=False)
+        self.validation.shutdown()
+        self.prefetcher.cancel_all()
+        try:
+            self._async_loop.stop()
+        except Exception:
+            self.logger.exception('Failed to close loop resources')
+        if self.log_buffer:
+            self.logger.removeHandler(self.log_buffer)
+        if self._owns_logger:
+            stop_logger(self.logger)
+
     def closeEvent(self, event: QCloseEvent):  # noqa: N802
         if not event.spontaneous():
+            self.shutdown()
             event.accept()
             return
 
@@ -315,4 +752,5 @@ class FlowManager(QWidget):
             event.ignore()
             return
 
+        self.shutdown()
         event.accept()
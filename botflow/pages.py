@@ -1,10 +1,11 @@
-from typing import Callable
+from typing import Callable, Optional
 
-from PySide6.QtCore import QSize, Qt, Slot
-from PySide6.QtGui import QMovie
+from PySide6.QtCore import QSize, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QHideEvent, QMovie, QShowEvent
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
+    QPlainTextEdit,
     QProgressBar,
     QPushButton,
     QSizePolicy,
@@ -13,18 +14,21 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from botflow.qss import qss_to_string
+from botflow.logbuffer import LogRingBuffer
 from botflow.resolver import find_resource_file
+from botflow.runqueue import JobState, RunJob
 from botflow.types import I18n, LoadingAbstract
 
 
 class InitialPage(QWidget):
-    def __init__(self, name: str, on_start: Callable, i18n: I18n):
+    def __init__(
+        self,
+        name: str,
+        on_start: Callable,
+        i18n: I18n,
+        on_batch: Optional[Callable] = None,
+    ):
         super().__init__()
-        style_file = find_resource_file('styles/initial_page.qss')
-        qss_string = qss_to_string(style_file)
-        self.setStyleSheet(qss_string)
-
         title_label = QLabel(name)
         title_label.setProperty('role', 'initial_title')
         title_label.setWordWrap(True)
@@ -57,16 +61,51 @@ class InitialPage(QWidget):
             )
         )
         main_layout.addWidget(start_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        if on_batch:
+            batch_btn = QPushButton(i18n.t('initial_page.run_batch') if i18n else 'Run batch')
+            batch_btn.setProperty('role', 'initial_batch_button')
+            batch_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            batch_btn.clicked.connect(on_batch)
+            main_layout.addSpacing(12)
+            main_layout.addWidget(batch_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+
         main_layout.addStretch()
 
 
-class LoadingPage(LoadingAbstract):
-    def __init__(self, i18n: I18n):
+class LogView(QPlainTextEdit):
+    def __init__(self, buffer: LogRingBuffer, refresh_ms: int = 100):
         super().__init__()
-        style_file = find_resource_file('styles/loading_page.qss')
-        qss_string = qss_to_string(style_file)
-        self.setStyleSheet(qss_string)
+        self.buffer = buffer
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(buffer.capacity)
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.setProperty('role', 'loading_log')
+
+        self._seen = 0
+        # Records arrive from worker threads; the view catches up in one append per tick.
+        self._timer = QTimer(self)
+        self._timer.setInterval(refresh_ms)
+        self._timer.timeout.connect(self.refresh)
+
+    def refresh(self) -> None:
+        lines, self._seen = self.buffer.read_since(self._seen)
+        if lines:
+            self.appendPlainText('\n'.join(lines))
+
+    def showEvent(self, event: QShowEvent):  # noqa: N802
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
 
+    def hideEvent(self, event: QHideEvent):  # noqa: N802
+        self._timer.stop()
+        super().hideEvent(event)
+
+
+class LoadingPage(LoadingAbstract):
+    def __init__(self, i18n: I18n, log_buffer: Optional[LogRingBuffer] = None):
+        super().__init__()
         loading_gif = find_resource_file('assets/loading.gif')
         gif_label = QLabel(self)
         gif_label.setProperty('role', 'loading_icon')
@@ -99,6 +138,14 @@ class LoadingPage(LoadingAbstract):
         progress_col.addWidget(self.status_lbl, alignment=Qt.AlignmentFlag.AlignCenter)
         progress_col.addWidget(self.progress_bar)
 
+        cancel_text = i18n.t('common.cancel') if i18n else 'Cancel'
+        self.cancel_btn = QPushButton(cancel_text, self)
+        self.cancel_btn.setProperty('role', 'loading_cancel')
+        self.cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.cancel_btn.clicked.connect(self.cancel_requested.emit)
+        progress_col.addSpacing(12)
+        progress_col.addWidget(self.cancel_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 24, 0, 0)
         layout.addLayout(header)
@@ -106,7 +153,13 @@ class LoadingPage(LoadingAbstract):
             QSpacerItem(0, 32, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
         )
         layout.addLayout(progress_col)
-        layout.addStretch()
+
+        self.log_view = LogView(log_buffer) if log_buffer else None
+        if self.log_view:
+            layout.addSpacing(16)
+            layout.addWidget(self.log_view, 1)
+        else:
+            layout.addStretch()
 
     @Slot(int)
     def set_progress(self, value: int):
@@ -115,3 +168,128 @@ class LoadingPage(LoadingAbstract):
     @Slot(str)
     def set_status(self, text: str):
         self.status_lbl.setText(text)
+
+    def set_cancellable(self, enabled: bool) -> None:
+        self.cancel_btn.setEnabled(enabled)
+
+
+class QueueItem(QWidget):
+    cancel_requested = Signal()
+    done = Signal()
+
+    def __init__(self, job: RunJob, i18n: I18n):
+        super().__init__()
+        self.job = job
+        self.i18n = i18n
+
+        self.title_lbl = QLabel(job.title, self)
+        self.title_lbl.setProperty('role', 'queue_title')
+
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setProperty('role', 'queue_progress')
+
+        self.state_lbl = QLabel('', self)
+        self.state_lbl.setProperty('role', 'queue_state')
+
+        self.cancel_btn = QPushButton(i18n.t('common.cancel'), self)
+        self.cancel_btn.setProperty('role', 'queue_cancel')
+        self.cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.cancel_btn.clicked.connect(self._request_cancel)
+
+        row = QHBoxLayout(self)
+        row.setContentsMargins(0, 0, 0, 0)
+        row.addWidget(self.title_lbl)
+        row.addWidget(self.progress_bar, 1)
+        row.addWidget(self.state_lbl)
+        row.addWidget(self.cancel_btn)
+
+        self._refresh()
+
+    def _refresh(self) -> None:
+        job = self.job
+        self.progress_bar.setValue(job.progress)
+        self.state_lbl.setText(self.i18n.t(f'queue.state.{job.state}'))
+        self.state_lbl.setProperty('state', job.state)
+        self.state_lbl.style().unpolish(self.state_lbl)
+        self.state_lbl.style().polish(self.state_lbl)
+        self.setToolTip(job.error or job.status)
+        self.cancel_btn.setVisible(not job.done)
+
+    def _request_cancel(self) -> None:
+        self.cancel_btn.setEnabled(False)
+        self.cancel_requested.emit()
+
+    def _finish(self, state: JobState, error: str = '') -> None:
+        self.job.finish(state, error)
+        self._refresh()
+        self.done.emit()
+
+    @Slot(int)
+    def set_progress(self, value: int):
+        self.job.report(progress=value)
+        self._refresh()
+
+    @Slot(str)
+    def set_status(self, text: str):
+        self.job.report(status=text)
+        self._refresh()
+
+    @Slot(dict)
+    def on_finished(self, ctx: dict):
+        self._finish('succeeded')
+
+    @Slot(str)
+    def on_error(self, error_msg: str):
+        self._finish('failed', error_msg)
+
+    @Slot()
+    def on_cancelled(self):
+        self._finish('cancelled')
+
+
+class QueuePanel(QWidget):
+    def __init__(self, i18n: I18n):
+        super().__init__()
+        self.i18n = i18n
+        self.items: list[QueueItem] = []
+
+        title_lbl = QLabel(i18n.t('queue.title'), self)
+        title_lbl.setProperty('role', 'queue_header')
+
+        clear_btn = QPushButton(i18n.t('queue.clear_finished'), self)
+        clear_btn.setProperty('role', 'queue_clear')
+        clear_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        clear_btn.clicked.connect(self.clear_finished)
+
+        header = QHBoxLayout()
+        header.setContentsMargins(0, 0, 0, 0)
+        header.addWidget(title_lbl)
+        header.addStretch()
+        header.addWidget(clear_btn)
+
+        self._rows = QVBoxLayout()
+        self._rows.setContentsMargins(0, 0, 0, 0)
+        self._rows.setSpacing(4)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(header)
+        layout.addLayout(self._rows)
+
+        self.setVisible(False)
+
+    def add_job(self, job: RunJob) -> QueueItem:
+        item = QueueItem(job, self.i18n)
+        self.items.append(item)
+        self._rows.addWidget(item)
+        self.setVisible(True)
+        return item
+
+    def clear_finished(self) -> None:
+        for item in [item for item in self.items if item.job.done]:
+            self.items.remove(item)
+            self._rows.removeWidget(item)
+            item.deleteLater()
+        self.setVisible(bool(self.items))
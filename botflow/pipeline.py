@@ -0,0 +1,887 @@
+import asyncio
+import inspect
+import itertools
+import queue
+import threading
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import aclosing, nullcontext
+from logging import Logger
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+)
+
+from botflow.cache import StepCache
+from botflow.cancellation import CancelToken, await_cancellable
+from botflow.checkpoint import CheckpointStore
+from botflow.exceptions import PipelineCancelledError, StepTimeoutError
+from botflow.loops import AsyncLoopThreadWorker, LoopRunner
+from botflow.prefetch import Prefetched
+from botflow.processes import ProcessStepExecutor, picklable_view
+from botflow.reporter import ProgressReporter
+from botflow.scheduler import StepGraph, has_dependencies
+from botflow.specs import (
+    BotPipelineInfo,
+    FinishContext,
+    FinishStep,
+    PipelineStep,
+    StepExecutor,
+    as_finish_step,
+)
+from botflow.streams import END_OF_STREAM, is_stream_step, iter_queue, stream_units
+from botflow.tracing import PipelineTracer, StepSpan, StepTiming
+
+
+def _ignore(_: Any) -> None:
+    pass
+
+
+class PipelineThread:
+    def __init__(self, name: str = 'botflow-pipeline') -> None:
+        self.name = name
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._serve, name=name, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            fut, fn = item
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn())
+            except BaseException as e:
+                fut.set_exception(e)
+
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        if not self._thread.is_alive():
+            raise RuntimeError('Pipeline thread is stopped')
+        fut: Future = Future()
+        self._queue.put((fut, fn))
+        return fut
+
+    def stop(self, timeout: Optional[float] = 5) -> bool:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+
+class PipelineRunner:
+    def __init__(
+        self,
+        ctx: dict[str, Any],
+        pipeline: List[PipelineStep],
+        logger: Logger,
+        async_loop: LoopRunner,
+        max_parallel_steps: Optional[int] = None,
+        executor: StepExecutor = 'thread',
+        process_pool: Optional[ProcessStepExecutor] = None,
+        max_updates_per_second: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        checkpoint_key: str = 'pipeline',
+        resume: bool = False,
+        step_cache: Optional[StepCache] = None,
+        tracer: Optional[PipelineTracer] = None,
+        on_progress: Optional[Callable[[int], None]] = None,
+        on_status: Optional[Callable[[str], None]] = None,
+        on_traced: Optional[Callable[[list[StepTiming]], None]] = None,
+        prefetched: Optional[Mapping[str, Future]] = None,
+    ):
+        self.ctx = ctx
+        self.pipeline = pipeline
+        self.logger = logger
+        self.async_loop = async_loop
+        self.async_loop.start()
+        self.max_parallel_steps = max_parallel_steps
+        self.executor = executor
+        self.process_pool = process_pool
+        self._owns_process_pool = False
+        self.reporter = ProgressReporter(
+            on_status or _ignore, on_progress or _ignore, max_rate=max_updates_per_second
+        )
+        self.cancel_token = cancel_token or CancelToken()
+        self._step_tokens: dict[str, CancelToken] = {}
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_key = checkpoint_key
+        self.resume = resume
+        self.completed: list[str] = []
+        self._resumable: list[str] = []
+        self._supplied_keys: set[Any] = set()
+        self._unsaved_keys: set[Any] = set()
+        self.step_cache = step_cache or StepCache()
+        self.tracer = tracer
+        self.timings: list[StepTiming] = []
+        self.trace_path: Optional[Path] = None
+        self.on_traced = on_traced
+        self.prefetched = Prefetched(prefetched)
+
+    def cancel(self) -> None:
+        self.logger.info('Pipeline cancellation requested')
+        self.cancel_token.cancel()
+
+    def _run_in_process(self, step: FinishStep, context: FinishContext) -> None:
+        if not self.process_pool:
+            self.process_pool = ProcessStepExecutor()
+            self._owns_process_pool = True
+        self.process_pool.run(step.fn, context)
+
+    def _call_step(
+        self,
+        step: FinishStep,
+        progress_percentage: int,
+        step_of: str,
+        step_number: int,
+        total_steps: int,
+    ) -> None:
+        if not self.tracer:
+            self._run_step(step, progress_percentage, step_of, step_number, total_steps)
+            return
+
+        with self.tracer.step(step.name) as span:
+            self._run_step(step, progress_percentage, step_of, step_number, total_steps, span)
+
+    async def _call_step_async(
+        self,
+        step: FinishStep,
+        progress_percentage: int,
+        step_of: str,
+        step_number: int,
+        total_steps: int,
+    ) -> None:
+        if not self.tracer:
+            await self._run_step_async(step, progress_percentage, step_of, step_number, total_steps)
+            return
+
+        with self.tracer.step(step.name) as span:
+            await self._run_step_async(
+                step, progress_percentage, step_of, step_number, total_steps, span
+            )
+
+    def _restore_cached(
+        self, step: FinishStep, step_of: str, span: Optional[StepSpan]
+    ) -> tuple[Optional[str], bool]:
+        cache_key = self.step_cache.key(step.fn, step.cache, self.ctx) if step.cache else None
+        if cache_key and self._restore_outputs(step, step_of, cache_key):
+            if span:
+                span.status = 'cached'
+            return cache_key, True
+        return cache_key, False
+
+    def _make_context(
+        self,
+        step: FinishStep,
+        progress_percentage: int,
+        step_of: str,
+        step_number: int,
+        total_steps: int,
+        loop: AsyncLoopThreadWorker,
+        stream: Optional[AsyncIterator[Any]] = None,
+    ) -> FinishContext:
+        step_share = 100 // total_steps
+        token = self._step_token(step).child()
+        return FinishContext(
+            data=self.ctx,
+            logger=self.logger,
+            pipeline_info=BotPipelineInfo(
+                status=self.reporter.status,
+                progress=self.reporter.progress,
+                percentage=progress_percentage,
+                step_of=step_of,
+                step_name=step.name,
+                step_number=step_number,
+                total_steps=total_steps,
+                step_progress=self.reporter.scoped(
+                    progress_percentage, progress_percentage + step_share
+                ),
+            ),
+            cancel_token=token,
+            resources=loop.resources,
+            stream=stream,
+            prefetched=self.prefetched.with_token(token),
+        )
+
+    def _step_token(self, step: FinishStep) -> CancelToken:
+        return self._step_tokens.get(step.name, self.cancel_token)
+
+    def _start_branch(self, step: FinishStep) -> None:
+        self._step_tokens[step.name] = self.cancel_token.child()
+
+    def _end_branches(self, steps: Iterable[FinishStep], cancel: bool = False) -> None:
+        for step in steps:
+            token = self._step_tokens.pop(step.name, None)
+            if not token:
+                continue
+            if cancel:
+                token.cancel()
+            token.detach()
+
+    def _timeout_error(self, step: FinishStep) -> StepTimeoutError:
+        return StepTimeoutError(f"Step '{step.name}' timed out after {step.timeout:g}s")
+
+    def _retry_delay(
+        self, step: FinishStep, step_of: str, attempt: int, exc: Exception
+    ) -> Optional[float]:
+        policy = step.retry
+        if not policy or not policy.should_retry(exc, attempt):
+            return None
+
+        delay = policy.delay(attempt)
+        self.logger.warning(
+            '%s %s failed on attempt %d of %d, retrying in %.2fs: %s',
+            step_of,
+            step.name,
+            attempt,
+            policy.max_attempts,
+            delay,
+            exc,
+        )
+        self.reporter.status(
+            f'{step_of} {step.name} (attempt {attempt + 1} of {policy.max_attempts})'
+        )
+        return delay
+
+    def _run_step(
+        self,
+        step: FinishStep,
+        progress_percentage: int,
+        step_of: str,
+        step_number: int,
+        total_steps: int,
+        span: Optional[StepSpan] = None,
+    ) -> None:
+        cache_key, restored = self._restore_cached(step, step_of, span)
+        if restored:
+            return
+
+        args = (step, progress_percentage, step_of, step_number, total_steps, span)
+        if inspect.iscoroutinefunction(step.fn):
+            # Backoff between attempts sleeps on the loop instead of holding this thread.
+            loop = self.async_loop.shard(step.loop_key)
+            coro = self._retry_step_async(*args, loop=loop)
+            loop.run(coro, cancel_token=self._step_token(step))
+        else:
+            self._retry_step(*args)
+
+        if cache_key:
+            self._store_outputs(step, cache_key)
+
+    def _retry_step(
+        self,
+        step: FinishStep,
+        progress_percentage: int,
+        step_of: str,
+        step_number: int,
+        total_steps: int,
+        span: Optional[StepSpan],
+    ) -> None:
+        for attempt in itertools.count(1):
+            loop = self.async_loop.shard(step.loop_key)
+            context = self._make_context(
+                step, progress_percentage, step_of, step_number, total_steps, loop
+            )
+            try:
+                self._attempt_step(step, context, span, loop)
+                return
+            except Exception as e:
+                delay = self._retry_delay(step, step_of, attempt, e)
+                if delay is None:
+                    raise
+            self._step_token(step).wait(delay)
+            self._step_token(step).raise_if_cancelled()
+
+    async def _run_step_async(
+        self,
+        step: FinishStep,
+        progress_percentage: int,
+        step_of: str,
+        step_number: int,
+        total_steps: int,
+        span: Optional[StepSpan] = None,
+    ) -> None:
+        cache_key, restored = self._restore_cached(step, step_of, span)
+        if restored:
+            return
+
+        await self._retry_step_async(
+            step, progress_percentage, step_of, step_number, total_steps, span
+        )
+
+        if cache_key:
+            self._store_outputs(step, cache_key)
+
+    async def _retry_step_async(
+        self,
+        step: FinishStep,
+        progress_percentage: int,
+        step_of: str,
+        step_number: int,
+        total_steps: int,
+        span: Optional[StepSpan],
+        loop: Optional[AsyncLoopThreadWorker] = None,
+    ) -> None:
+        # A caller already running on a shard keeps every attempt there.
+        pinned = loop
+        for attempt in itertools.count(1):
+            loop = pinned or self.async_loop.shard(step.loop_key)
+            context = self._make_context(
+                step, progress_percentage, step_of, step_number, total_steps, loop
+            )
+            try:
+                await self._attempt_step_async(step, context, span, loop)
+                return
+            except Exception as e:
+                delay = self._retry_delay(step, step_of, attempt, e)
+                if delay is None:
+                    raise
+            await await_cancellable(asyncio.sleep(delay), self._step_token(step))
+
+    def _attempt_step(
+        self,
+        step: FinishStep,
+        context: FinishContext,
+        span: Optional[StepSpan],
+        loop: AsyncLoopThreadWorker,
+    ) -> None:
+        timed_out = threading.Event()
+        timer = None
+        if step.timeout:
+
+            def expire() -> None:
+                timed_out.set()
+                context.cancel_token.cancel()
+
+            timer = threading.Timer(step.timeout, expire)
+            timer.daemon = True
+            timer.start()
+
+        try:
+            self._execute_step(step, context, span, loop)
+        except PipelineCancelledError:
+            if timed_out.is_set() and not self.cancel_token.cancelled:
+                raise self._timeout_error(step) from None
+            raise
+        finally:
+            if timer:
+                timer.cancel()
+            context.cancel_token.detach()
+
+        if timed_out.is_set():
+            raise self._timeout_error(step)
+
+    async def _attempt_step_async(
+        self,
+        step: FinishStep,
+        context: FinishContext,
+        span: Optional[StepSpan],
+        loop: AsyncLoopThreadWorker,
+    ) -> None:
+        timed_out = False
+        timer = None
+        if step.timeout:
+
+            def expire() -> None:
+                nonlocal timed_out
+                timed_out = True
+                context.cancel_token.cancel()
+
+            timer = asyncio.get_running_loop().call_later(step.timeout, expire)
+
+        try:
+            await self._execute_step_async(step, context, span, loop)
+        except PipelineCancelledError:
+            if timed_out and not self.cancel_token.cancelled:
+                raise self._timeout_error(step) from None
+            raise
+        finally:
+            if timer:
+                timer.cancel()
+            context.cancel_token.detach()
+
+        if timed_out:
+            raise self._timeout_error(step)
+
+    def _restore_outputs(self, step: FinishStep, step_of: str, cache_key: str) -> bool:
+        outputs = self.step_cache.get(cache_key)
+        if outputs is None:
+            return False
+
+        self.logger.info('%s %s restored from cache', step_of, step.name)
+        self.reporter.status(f'{step_of} {step.name} (cached)')
+        self.ctx.update(outputs)
+        return True
+
+    def _store_outputs(self, step: FinishStep, cache_key: str) -> None:
+        missing = [k for k in step.cache.outputs if k not in self.ctx]
+        if missing:
+            self.logger.warning('Not caching %s: missing outputs %s', step.name, missing)
+            return
+
+        try:
+            self.step_cache.put(cache_key, {k: self.ctx[k] for k in step.cache.outputs})
+        except Exception:
+            self.logger.warning('Failed to cache outputs of %s', step.name, exc_info=True)
+
+    def _step_coroutine(
+        self, step: FinishStep, context: FinishContext, span: Optional[StepSpan]
+    ) -> Coroutine[Any, Any, Any]:
+        if step.executor == 'process':
+            raise ValueError(f"Step '{step.name}' is async and cannot run in a process")
+        coro = step.fn(context)
+        if span:
+            coro = self.tracer.measure(span, coro)
+        return coro
+
+    def _execute_step(
+        self,
+        step: FinishStep,
+        context: FinishContext,
+        span: Optional[StepSpan],
+        loop: AsyncLoopThreadWorker,
+    ) -> None:
+        fn = step.fn
+        if inspect.iscoroutinefunction(fn):
+            coro = self._step_coroutine(step, context, span)
+            loop.run(coro, cancel_token=context.cancel_token)
+            return
+
+        if (step.executor or self.executor) == 'process':
+            if span:
+                span.executor = 'process'
+                span.measured = True
+            self._run_in_process(step, context)
+            return
+
+        if span:
+            self.tracer.call(span, fn, context)
+        else:
+            fn(context)
+
+    async def _await_on(
+        self,
+        loop: AsyncLoopThreadWorker,
+        coro: Coroutine[Any, Any, Any],
+        cancel_token: CancelToken,
+    ) -> Any:
+        if loop.loop is asyncio.get_running_loop():
+            return await await_cancellable(coro, cancel_token)
+        return await await_cancellable(asyncio.wrap_future(loop.submit(coro)), cancel_token)
+
+    async def _execute_step_async(
+        self,
+        step: FinishStep,
+        context: FinishContext,
+        span: Optional[StepSpan],
+        loop: AsyncLoopThreadWorker,
+    ) -> None:
+        if inspect.iscoroutinefunction(step.fn):
+            coro = self._step_coroutine(step, context, span)
+            await self._await_on(loop, coro, context.cancel_token)
+            return
+
+        # Blocking steps must not stall the loop, so they still run on a thread.
+        running_loop = asyncio.get_running_loop()
+        await running_loop.run_in_executor(None, self._execute_step, step, context, span, loop)
+
+    def _restore_checkpoint(self) -> None:
+        if not self.checkpoint_store:
+            return
+
+        # The caller hands these keys in again on resume, so a checkpoint needn't hold them.
+        self._supplied_keys = set(self.ctx)
+        self._resumable = []
+        self._unsaved_keys = set()
+
+        checkpoint = self.checkpoint_store.load(self.checkpoint_key) if self.resume else None
+        if not checkpoint:
+            self._clear_checkpoint()
+            return
+
+        self.ctx.update(checkpoint.data)
+        self.completed = list(checkpoint.completed)
+        self._resumable = list(self.completed)
+        self.logger.info('Resuming pipeline after %d completed steps', len(self.completed))
+
+    def _save_checkpoint(self, step: FinishStep) -> None:
+        self.completed.append(step.name)
+        if not self.checkpoint_store:
+            return
+
+        # Graph siblings may still be writing to ctx, so both sets come from one copy.
+        snapshot = dict(self.ctx)
+        view = picklable_view(snapshot, self.logger)
+        unsaved = snapshot.keys() - view.keys() - self._supplied_keys
+        if unsaved:
+            # Resuming past a step whose outputs were dropped would leave later steps without them.
+            if unsaved - self._unsaved_keys:
+                self.logger.warning(
+                    'Checkpoint cannot hold %s (not picklable); resuming will rerun %s',
+                    sorted(map(str, unsaved)),
+                    step.name,
+                )
+        else:
+            self._resumable = list(self.completed)
+        self._unsaved_keys = unsaved
+
+        try:
+            self.checkpoint_store.save(self.checkpoint_key, self._resumable, view)
+        except Exception:
+            self.logger.warning('Failed to save checkpoint after %s', step.name, exc_info=True)
+
+    def _clear_checkpoint(self) -> None:
+        try:
+            self.checkpoint_store.clear(self.checkpoint_key)
+        except OSError:
+            self.logger.warning('Failed to clear checkpoint %s', self.checkpoint_key, exc_info=True)
+
+    def _announce_step(self, step: FinishStep, pct: int, step_number: int, total: int) -> str:
+        step_of = f'Step {step_number} of {total}:'
+        full_step_name = f'{step_of} {step.name}'
+
+        self.logger.info(full_step_name)
+        self.reporter.status(full_step_name)
+        self.reporter.progress(pct)
+        return step_of
+
+    def _announce_stream(self, stages: List[FinishStep], pct: int, first: int, total: int) -> str:
+        step_of = f'Steps {first}-{first + len(stages) - 1} of {total}:'
+        full_step_name = f"{step_of} {' -> '.join(step.name for step in stages)}"
+
+        self.logger.info(full_step_name)
+        self.reporter.status(full_step_name)
+        self.reporter.progress(pct)
+        return step_of
+
+    def _sequential_plan(
+        self, steps: List[FinishStep]
+    ) -> Iterator[tuple[List[FinishStep], int, str, int, int]]:
+        total = len(steps)
+
+        resumed = self.completed
+        self.completed = []
+
+        i = 1
+        for unit in stream_units(steps):
+            self.cancel_token.raise_if_cancelled()
+            pct = int((i - 1) / total * 100)
+            names = [step.name for step in unit]
+
+            if resumed[i - 1 : i - 1 + len(unit)] == names:
+                for step in unit:
+                    self.logger.info('Skipping step %d of %d: %s (checkpoint)', i, total, step.name)
+                    self.completed.append(step.name)
+                    i += 1
+                continue
+
+            resumed = []
+            if is_stream_step(unit[0]):
+                step_of = self._announce_stream(unit, pct, i, total)
+            else:
+                step_of = self._announce_step(unit[0], pct, i, total)
+            yield unit, pct, step_of, i, total
+            i += len(unit)
+
+    def _run_sequential(self, steps: List[FinishStep]) -> None:
+        for unit, pct, step_of, i, total in self._sequential_plan(steps):
+            if is_stream_step(unit[0]):
+                loop = self.async_loop.shard(unit[0].loop_key)
+                coro = self._run_stream(unit, step_of, i, total, loop)
+                loop.run(coro, cancel_token=self.cancel_token)
+            else:
+                self._call_step(unit[0], pct, step_of, i, total)
+            for step in unit:
+                self._save_checkpoint(step)
+
+    async def _run_sequential_async(self, steps: List[FinishStep]) -> None:
+        for unit, pct, step_of, i, total in self._sequential_plan(steps):
+            if is_stream_step(unit[0]):
+                loop = self.async_loop.shard(unit[0].loop_key)
+                coro = self._run_stream(unit, step_of, i, total, loop)
+                await self._await_on(loop, coro, self.cancel_token)
+            else:
+                await self._call_step_async(unit[0], pct, step_of, i, total)
+            for step in unit:
+                self._save_checkpoint(step)
+
+    async def _run_stage(
+        self,
+        step: FinishStep,
+        context: FinishContext,
+        output: Optional[asyncio.Queue],
+    ) -> None:
+        with self.tracer.step(step.name) if self.tracer else nullcontext() as span:
+            if span:
+                span.executor = 'loop'
+                span.measured = True
+
+            timeout = asyncio.timeout(step.timeout)
+            try:
+                async with timeout:
+                    result = step.fn(context)
+                    if not inspect.isasyncgen(result):
+                        await result
+                        return
+
+                    async with aclosing(result) as items:
+                        async for item in items:
+                            if output:
+                                await output.put(item)
+            except TimeoutError:
+                if timeout.expired():
+                    raise self._timeout_error(step) from None
+                raise
+
+        if output:
+            await output.put(END_OF_STREAM)
+
+    async def _run_stream(
+        self,
+        stages: List[FinishStep],
+        step_of: str,
+        first: int,
+        total: int,
+        loop: AsyncLoopThreadWorker,
+    ) -> None:
+        queues = [asyncio.Queue(maxsize=max(1, step.buffer_size)) for step in stages[:-1]]
+        contexts = [
+            self._make_context(
+                step,
+                int((number - 1) / total * 100),
+                step_of,
+                number,
+                total,
+                loop,
+                stream=iter_queue(queues[k - 1]) if k else None,
+            )
+            for k, (number, step) in enumerate(enumerate(stages, start=first))
+        ]
+        tasks: list[asyncio.Task] = []
+        for k, (step, context) in enumerate(zip(stages, contexts, strict=True)):
+            task = asyncio.ensure_future(
+                self._run_stage(step, context, queues[k] if k < len(queues) else None)
+            )
+            if tasks:
+                # A consumer that stops early releases its producer from a full queue.
+                task.add_done_callback(lambda _, upstream=tasks[-1]: upstream.cancel())
+            tasks.append(task)
+
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in tasks:
+                if task.done() and not task.cancelled() and task.exception():
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for context in contexts:
+                context.cancel_token.detach()
+
+    def _run_graph(self, graph: StepGraph) -> None:
+        total = len(graph.steps)
+        done = {name for name in self.completed if name in graph.dependencies}
+        self.completed = [name for name in self.completed if name in done]
+        pending = {step.name for step in graph.steps} - done
+        running: dict[Future, FinishStep] = {}
+        started = len(done)
+
+        cancelled: Future = Future()
+
+        def notify_cancelled() -> None:
+            cancelled.set_result(None)
+
+        self.cancel_token.add_callback(notify_cancelled)
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_parallel_steps, thread_name_prefix='botflow-step'
+        )
+        try:
+            while pending or running:
+                self.cancel_token.raise_if_cancelled()
+
+                for step in graph.ready(done, pending):
+                    pending.discard(step.name)
+                    started += 1
+                    pct = int(len(done) / total * 100)
+                    step_of = self._announce_step(step, pct, started, total)
+                    self._start_branch(step)
+                    fut = pool.submit(self._call_step, step, pct, step_of, started, total)
+                    running[fut] = step
+
+                completed, _ = wait([*running, cancelled], return_when=FIRST_COMPLETED)
+                for fut in completed:
+                    if fut is cancelled:
+                        continue
+                    step = running.pop(fut)
+                    self._end_branches([step])
+                    fut.result()
+                    done.add(step.name)
+                    self._save_checkpoint(step)
+                    self.logger.info('Step %s finished', step.name)
+
+                self.reporter.progress(int(len(done) / total * 100))
+        finally:
+            self.cancel_token.remove_callback(notify_cancelled)
+            # A failed or cancelled run stops its siblings instead of waiting them out.
+            self._end_branches(running.values(), cancel=True)
+            pool.shutdown(wait=not running, cancel_futures=True)
+
+    def _cancelled_future(self) -> tuple[asyncio.Future, Callable[[], None]]:
+        loop = asyncio.get_running_loop()
+        cancelled = loop.create_future()
+
+        def set_cancelled() -> None:
+            if not cancelled.done():
+                cancelled.set_result(None)
+
+        def notify_cancelled() -> None:
+            loop.call_soon_threadsafe(set_cancelled)
+
+        return cancelled, notify_cancelled
+
+    async def _run_graph_async(self, graph: StepGraph) -> None:
+        total = len(graph.steps)
+        done = {name for name in self.completed if name in graph.dependencies}
+        self.completed = [name for name in self.completed if name in done]
+        pending = {step.name for step in graph.steps} - done
+        running: dict[asyncio.Future, FinishStep] = {}
+        started = len(done)
+        slots = asyncio.Semaphore(self.max_parallel_steps or total)
+
+        cancelled, notify_cancelled = self._cancelled_future()
+        self.cancel_token.add_callback(notify_cancelled)
+
+        async def call_step(step: FinishStep, pct: int, step_of: str, number: int) -> None:
+            async with slots:
+                await self._call_step_async(step, pct, step_of, number, total)
+
+        try:
+            while pending or running:
+                self.cancel_token.raise_if_cancelled()
+
+                for step in graph.ready(done, pending):
+                    pending.discard(step.name)
+                    started += 1
+                    pct = int(len(done) / total * 100)
+                    step_of = self._announce_step(step, pct, started, total)
+                    self._start_branch(step)
+                    task = asyncio.ensure_future(call_step(step, pct, step_of, started))
+                    running[task] = step
+
+                completed, _ = await asyncio.wait(
+                    [*running, cancelled], return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in completed:
+                    if task is cancelled:
+                        continue
+                    step = running.pop(task)
+                    self._end_branches([step])
+                    task.result()
+                    done.add(step.name)
+                    self._save_checkpoint(step)
+                    self.logger.info('Step %s finished', step.name)
+
+                self.reporter.progress(int(len(done) / total * 100))
+        finally:
+            self.cancel_token.remove_callback(notify_cancelled)
+            cancelled.cancel()
+            # A failed or cancelled run stops its siblings instead of waiting them out.
+            self._end_branches(running.values(), cancel=True)
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+    def _finish_trace(self) -> None:
+        if not self.tracer:
+            return
+
+        self.tracer.stop()
+        self.timings = list(self.tracer.records)
+        try:
+            self.trace_path = self.tracer.write(self.checkpoint_key)
+        except OSError:
+            self.logger.warning('Failed to write pipeline trace', exc_info=True)
+        if self.trace_path:
+            self.logger.info('Pipeline trace written to %s', self.trace_path)
+        if self.on_traced:
+            self.on_traced(self.timings)
+
+    def _begin_run(self) -> None:
+        if self.tracer:
+            self.tracer.start()
+
+        self.logger.info('Starting pipeline with %d steps', len(self.pipeline))
+        self.reporter.progress(0)
+        self.reporter.status('Starting pipeline')
+        self._restore_checkpoint()
+
+    def _complete_run(self) -> None:
+        self.reporter.status('Pipeline completed successfully')
+        self.reporter.progress(100)
+
+        if self.checkpoint_store:
+            self._clear_checkpoint()
+
+        self.logger.info('Pipeline completed successfully')
+
+    def _fail_run(self, exc: Exception) -> None:
+        if isinstance(exc, PipelineCancelledError):
+            self.logger.warning('Pipeline cancelled')
+            self.reporter.status('Pipeline cancelled')
+        else:
+            self.logger.warning('Pipeline Error: %s', traceback.format_exc())
+
+    def _end_run(self) -> None:
+        self.reporter.flush()
+        self._finish_trace()
+        if self._owns_process_pool:
+            self.process_pool.shutdown()
+            self.process_pool = None
+            self._owns_process_pool = False
+
+    def execute(self) -> dict[str, Any]:
+        try:
+            self._begin_run()
+            if has_dependencies(self.pipeline):
+                self._run_graph(StepGraph(self.pipeline))
+            else:
+                self._run_sequential([as_finish_step(step) for step in self.pipeline])
+            self._complete_run()
+            return self.ctx
+        except Exception as e:
+            self._fail_run(e)
+            raise
+        finally:
+            self._end_run()
+
+    async def execute_async(self) -> dict[str, Any]:
+        try:
+            self._begin_run()
+            if has_dependencies(self.pipeline):
+                await self._run_graph_async(StepGraph(self.pipeline))
+            else:
+                await self._run_sequential_async([as_finish_step(step) for step in self.pipeline])
+            self._complete_run()
+            return self.ctx
+        except Exception as e:
+            self._fail_run(e)
+            raise
+        finally:
+            self._end_run()
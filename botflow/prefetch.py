@@ -0,0 +1,78 @@
+import asyncio
+import inspect
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+from botflow.cancellation import CancelToken, await_cancellable, wait_future
+from botflow.loops import LoopRunner
+
+if TYPE_CHECKING:
+    from botflow.specs import StepSpec
+
+
+class Prefetched:
+    def __init__(
+        self,
+        futures: Optional[Mapping[str, Future]] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> None:
+        self._futures = dict(futures or {})
+        self.cancel_token = cancel_token
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._futures
+
+    def keys(self) -> list[str]:
+        return list(self._futures)
+
+    def result(self, key: str, timeout: Optional[float] = None) -> Any:
+        return wait_future(self._futures[key], self.cancel_token, timeout)
+
+    async def get(self, key: str) -> Any:
+        return await await_cancellable(asyncio.wrap_future(self._futures[key]), self.cancel_token)
+
+    def with_token(self, cancel_token: CancelToken) -> 'Prefetched':
+        return Prefetched(self._futures, cancel_token)
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+class Prefetcher:
+    def __init__(self, async_loop: LoopRunner) -> None:
+        self.async_loop = async_loop
+        self._running: dict[str, tuple[Any, Future]] = {}
+
+    def start(self, spec: 'StepSpec', value: Any) -> Optional[Future]:
+        if not spec.prefetch:
+            return None
+
+        current = self._running.get(spec.key)
+        if current and current[0] == value and not current[1].cancelled():
+            return current[1]
+
+        self.cancel(spec.key)
+        result = spec.prefetch(value)
+        if inspect.isawaitable(result):
+            future = self.async_loop.submit(_await(result))
+        else:
+            future = Future()
+            future.set_result(result)
+        self._running[spec.key] = (value, future)
+        return future
+
+    def cancel(self, key: str) -> None:
+        entry = self._running.pop(key, None)
+        if entry:
+            entry[1].cancel()
+
+    def snapshot(self) -> dict[str, Future]:
+        return {key: future for key, (_, future) in self._running.items()}
+
+    def release(self) -> None:
+        self._running.clear()
+
+    def cancel_all(self) -> None:
+        for key in list(self._running):
+            self.cancel(key)
@@ -0,0 +1,236 @@
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from logging.handlers import QueueHandler
+from typing import Any, Callable, Optional
+
+from botflow.cancellation import CancelToken, wait_future
+from botflow.exceptions import PipelineCancelledError
+from botflow.specs import BotPipelineInfo, FinishContext, FinishFn
+
+_updates: Any = None
+_current_call: Optional[int] = None
+
+
+class _ChildLogHandler(QueueHandler):
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put((_current_call, 'log', record))
+
+
+def _init_child(queue: Any) -> None:
+    global _updates
+    _updates = queue
+
+
+def _emit(kind: str, value: Any) -> None:
+    _updates.put((_current_call, kind, value))
+
+
+def _run_in_child(
+    fn: FinishFn,
+    data: dict[str, Any],
+    info: BotPipelineInfo,
+    call_id: int,
+    logger_name: str,
+    level: int,
+) -> tuple[dict[str, Any], set[str]]:
+    global _current_call
+    _current_call = call_id
+
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(level)
+    logger.propagate = False
+    if not any(isinstance(h, _ChildLogHandler) for h in logger.handlers):
+        logger.addHandler(_ChildLogHandler(_updates))
+
+    context = FinishContext(
+        data=data,
+        logger=logger,
+        pipeline_info=replace(
+            info,
+            status=lambda text: _emit('status', text),
+            progress=lambda value: _emit('progress', value),
+            step_progress=lambda value: _emit('step_progress', value),
+        ),
+    )
+    before = {key: pickle.dumps(value) for key, value in data.items()}
+    try:
+        fn(context)
+        changed = {
+            key: value
+            for key, value in context.data.items()
+            if before.get(key) != pickle.dumps(value)
+        }
+        return changed, before.keys() - context.data.keys()
+    finally:
+        _emit('done', None)
+
+
+def picklable_view(data: dict[str, Any], logger: Optional[logging.Logger] = None) -> dict[str, Any]:
+    try:
+        pickle.dumps(data)
+        return dict(data)
+    except Exception:
+        pass
+
+    view: dict[str, Any] = {}
+    for key, value in data.items():
+        try:
+            pickle.dumps(value)
+        except Exception:
+            if logger:
+                logger.debug('Key %s is not picklable and stays in the parent process', key)
+            continue
+        view[key] = value
+    return view
+
+
+class _WorkerSlot:
+    def __init__(self, mp_context: Any, listen: Callable[[Any], None]) -> None:
+        self.queue = mp_context.Queue()
+        self.pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=mp_context,
+            initializer=_init_child,
+            initargs=(self.queue,),
+        )
+        self.listener = threading.Thread(
+            target=listen, args=(self.queue,), name='botflow-process-updates', daemon=True
+        )
+        self.listener.start()
+        self.closed = False
+
+    def close(self, wait: bool = True) -> None:
+        self.closed = True
+        if not wait:
+            # There is no public way to stop a running task before Python 3.14.
+            for process in list((getattr(self.pool, '_processes', None) or {}).values()):
+                if process.is_alive():
+                    process.terminate()
+        self.pool.shutdown(wait=wait, cancel_futures=True)
+        self.queue.put(None)
+        if wait:
+            self.listener.join()
+
+
+class ProcessStepExecutor:
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._mp_context = multiprocessing.get_context('spawn')
+        # Each child has its own single-worker pool, so stopping one never breaks the others.
+        self._idle: list[_WorkerSlot] = []
+        self._busy: set[_WorkerSlot] = set()
+        self._calls: dict[int, tuple[BotPipelineInfo, logging.Logger, threading.Event]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Condition()
+
+    def start(self) -> None:
+        with self._lock:
+            if not self._idle and not self._busy:
+                self._idle.append(_WorkerSlot(self._mp_context, self._listen))
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            slots = [*self._idle, *self._busy]
+            self._idle.clear()
+            self._busy.clear()
+            self._lock.notify_all()
+
+        for slot in slots:
+            slot.close(wait)
+
+    def _acquire(self, cancel_token: CancelToken) -> _WorkerSlot:
+        def wake() -> None:
+            with self._lock:
+                self._lock.notify_all()
+
+        cancel_token.add_callback(wake)
+        try:
+            with self._lock:
+                while not self._idle and len(self._busy) >= self.max_workers:
+                    cancel_token.raise_if_cancelled()
+                    self._lock.wait()
+                cancel_token.raise_if_cancelled()
+                slot = self._idle.pop() if self._idle else None
+                slot = slot or _WorkerSlot(self._mp_context, self._listen)
+                self._busy.add(slot)
+                return slot
+        finally:
+            cancel_token.remove_callback(wake)
+
+    def _release(self, slot: _WorkerSlot, reusable: bool) -> None:
+        with self._lock:
+            owned = slot in self._busy
+            self._busy.discard(slot)
+            if owned and reusable and not slot.closed:
+                self._idle.append(slot)
+            self._lock.notify()
+
+        if owned and not reusable:
+            slot.close(wait=False)
+
+    def _listen(self, queue: Any) -> None:
+        while True:
+            message = queue.get()
+            if message is None:
+                queue.close()
+                return
+
+            call_id, kind, value = message
+            call = self._calls.get(call_id)
+            if not call:
+                continue
+
+            info, logger, done = call
+            if kind == 'status' and info.status:
+                info.status(value)
+            elif kind == 'progress' and info.progress:
+                info.progress(value)
+            elif kind == 'step_progress' and info.step_progress:
+                info.step_progress(value)
+            elif kind == 'log':
+                logger.handle(value)
+            elif kind == 'done':
+                done.set()
+
+    def run(self, fn: FinishFn, context: FinishContext) -> None:
+        view = picklable_view(context.data, context.logger)
+        slot = self._acquire(context.cancel_token)
+        call_id = next(self._ids)
+        done = threading.Event()
+        self._calls[call_id] = (context.pipeline_info, context.logger, done)
+
+        reusable = False
+        try:
+            fut = slot.pool.submit(
+                _run_in_child,
+                fn,
+                view,
+                replace(context.pipeline_info, status=None, progress=None, step_progress=None),
+                call_id,
+                context.logger.name,
+                context.logger.getEffectiveLevel(),
+            )
+            try:
+                changed, removed = wait_future(fut, context.cancel_token)
+            except (PipelineCancelledError, BrokenProcessPool):
+                # A cancelled or timed-out child would keep running, so only its slot is stopped.
+                raise
+            except Exception:
+                reusable = True
+                raise
+            done.wait()
+            reusable = True
+        finally:
+            self._calls.pop(call_id, None)
+            self._release(slot, reusable)
+
+        for key in removed:
+            context.data.pop(key, None)
+        context.data.update(changed)
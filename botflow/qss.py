@@ -1,21 +1,69 @@
+import threading
 from pathlib import Path
 from typing import Union
 
+from botflow.resolver import find_resource_file
+
 PathLike = Union[str, Path]
 
+BOTFLOW_STYLES = (
+    'styles/flow_manager.qss',
+    'styles/initial_page.qss',
+    'styles/loading_page.qss',
+    'styles/queue_panel.qss',
+    'styles/text_widget.qss',
+    'styles/form_widget.qss',
+    'styles/file_widget.qss',
+)
+
+
+def _check_qss_path(p: Path) -> None:
+    if p.suffix != '.qss':
+        raise ValueError('File must have a .qss extension.')
+
+    if not p.is_file():
+        raise FileNotFoundError(f'The file {p} does not exist.')
+
 
 def qss_to_string(*paths: PathLike) -> str:
     parts: list[str] = []
 
     for p in paths:
         p = Path(p)
+        _check_qss_path(p)
+        parts.append(p.read_text(encoding='utf-8'))
 
-        if p.suffix != '.qss':
-            raise ValueError('File must have a .qss extension.')
+    return '\n'.join(parts) + '\n'
 
-        if not p.is_file():
-            raise FileNotFoundError(f'The file {p} does not exist.')
 
-        parts.append(p.read_text(encoding='utf-8'))
+class QssRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._files: dict[Path, tuple[int, str]] = {}
 
-    return '\n'.join(parts) + '\n'
+    def read(self, path: PathLike) -> str:
+        p = Path(path)
+        _check_qss_path(p)
+        resolved = p.resolve()
+        mtime = resolved.stat().st_mtime_ns
+
+        with self._lock:
+            cached = self._files.get(resolved)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+        text = resolved.read_text(encoding='utf-8')
+        with self._lock:
+            self._files[resolved] = (mtime, text)
+        return text
+
+    def stylesheet(self, *resources: str) -> str:
+        names = resources or BOTFLOW_STYLES
+        return '\n'.join(self.read(find_resource_file(name)) for name in names) + '\n'
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+
+
+qss_registry = QssRegistry()
@@ -0,0 +1,72 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+
+@dataclass(frozen=True)
+class ResourceSpec:
+    name: str
+    setup: Callable[[], Awaitable[Any]]
+    teardown: Optional[Callable[[Any], Awaitable[None]]] = field(default=None)
+
+
+class ResourceRegistry:
+    def __init__(self) -> None:
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._specs: dict[str, ResourceSpec] = {}
+        self._values: dict[str, Any] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._order: list[str] = []
+
+    def register(
+        self,
+        name: str,
+        setup: Callable[[], Awaitable[Any]],
+        teardown: Optional[Callable[[Any], Awaitable[None]]] = None,
+    ) -> None:
+        self.register_spec(ResourceSpec(name=name, setup=setup, teardown=teardown))
+
+    def register_spec(self, spec: ResourceSpec) -> None:
+        self._specs[spec.name] = spec
+
+    def is_open(self, name: str) -> bool:
+        return name in self._values
+
+    async def get(self, name: str) -> Any:
+        if name in self._values:
+            return self._values[name]
+
+        spec = self._specs.get(name)
+        if not spec:
+            raise KeyError(f'Resource not registered: {name}')
+
+        lock = self._locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            if name not in self._values:
+                self._values[name] = await spec.setup()
+                self._order.append(name)
+        return self._values[name]
+
+    def get_threadsafe(self, name: str, timeout: Optional[float] = None) -> Any:
+        if not self.loop:
+            raise RuntimeError('Resource registry is not attached to a running loop')
+        return asyncio.run_coroutine_threadsafe(self.get(name), self.loop).result(timeout)
+
+    async def aclose(self) -> None:
+        errors: list[BaseException] = []
+
+        while self._order:
+            name = self._order.pop()
+            value = self._values.pop(name)
+            spec = self._specs.get(name)
+
+            if spec and spec.teardown:
+                try:
+                    await spec.teardown(value)
+                except Exception as e:
+                    errors.append(e)
+
+        self._locks.clear()
+
+        if errors:
+            raise errors[0]
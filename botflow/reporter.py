@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Callable, Optional
+
+
+class ProgressReporter:
+    def __init__(
+        self,
+        status: Callable[[str], None],
+        progress: Callable[[int], None],
+        max_rate: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._emit_status = status
+        self._emit_progress = progress
+        self._interval = 1.0 / max_rate if max_rate else 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending_status: Optional[str] = None
+        self._pending_progress: Optional[int] = None
+        self._last_progress: Optional[int] = None
+        self._last_emit = float('-inf')
+        self._timer: Optional[threading.Timer] = None
+
+    def status(self, text: str) -> None:
+        if not self._interval:
+            self._emit_status(text)
+            return
+
+        with self._lock:
+            self._pending_status = text
+            self._schedule()
+
+    def progress(self, value: int) -> None:
+        value = int(value)
+        if not self._interval:
+            self._emit_progress(value)
+            return
+
+        with self._lock:
+            if value == self._last_progress and self._pending_progress is None:
+                return
+            self._pending_progress = value
+            self._schedule()
+
+    def scoped(self, start: int, end: int) -> Callable[[int], None]:
+        def report(value: int) -> None:
+            value = max(0, min(value, 100))
+            self.progress(start + (end - start) * value // 100)
+
+        return report
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            self._drain()
+
+    def _schedule(self) -> None:
+        remaining = self._last_emit + self._interval - self._clock()
+        if remaining <= 0:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            self._drain()
+            return
+
+        if not self._timer:
+            self._timer = threading.Timer(remaining, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            if self._timer is threading.current_thread():
+                self._timer = None
+            self._drain()
+
+    def _drain(self) -> None:
+        self._last_emit = self._clock()
+
+        if self._pending_status is not None:
+            self._emit_status(self._pending_status)
+            self._pending_status = None
+
+        if self._pending_progress is not None:
+            if self._pending_progress != self._last_progress:
+                self._emit_progress(self._pending_progress)
+                self._last_progress = self._pending_progress
+            self._pending_progress = None
@@ -0,0 +1,54 @@
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar, Union
+
+from botflow.exceptions import PipelineCancelledError
+
+Fn = TypeVar('Fn', bound=Callable[..., Any])
+ExceptionTypes = Union[type[BaseException], tuple[type[BaseException], ...]]
+
+RETRY_ATTR = 'botflow_retry'
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = field(default=3)
+    backoff: float = field(default=1.0)
+    multiplier: float = field(default=2.0)
+    max_backoff: float = field(default=30.0)
+    jitter: float = field(default=0.1)
+    retry_on: ExceptionTypes = field(default=(Exception,))
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+        if not 0 <= self.jitter <= 1:
+            raise ValueError('jitter must be between 0 and 1')
+        if not isinstance(self.retry_on, tuple):
+            object.__setattr__(self, 'retry_on', (self.retry_on,))
+
+    def should_retry(self, exc: BaseException, attempt: int) -> bool:
+        if attempt >= self.max_attempts or isinstance(exc, PipelineCancelledError):
+            return False
+        return isinstance(exc, self.retry_on)
+
+    def delay(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        base = min(self.backoff * self.multiplier ** (attempt - 1), self.max_backoff)
+        return base * (1 - self.jitter + 2 * self.jitter * rand())
+
+
+def retry_step(
+    max_attempts: int = 3,
+    backoff: float = 1.0,
+    multiplier: float = 2.0,
+    max_backoff: float = 30.0,
+    jitter: float = 0.1,
+    retry_on: ExceptionTypes = (Exception,),
+) -> Callable[[Fn], Fn]:
+    policy = RetryPolicy(max_attempts, backoff, multiplier, max_backoff, jitter, retry_on)
+
+    def decorator(fn: Fn) -> Fn:
+        setattr(fn, RETRY_ATTR, policy)
+        return fn
+
+    return decorator
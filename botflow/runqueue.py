@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+JobState = Literal['queued', 'running', 'succeeded', 'failed', 'cancelled']
+FINAL_STATES: tuple[JobState, ...] = ('succeeded', 'failed', 'cancelled')
+
+
+@dataclass
+class RunJob:
+    number: int
+    title: str
+    state: JobState = 'queued'
+    progress: int = 0
+    status: str = ''
+    error: str = ''
+
+    @property
+    def done(self) -> bool:
+        return self.state in FINAL_STATES
+
+    def report(self, progress: Optional[int] = None, status: Optional[str] = None) -> None:
+        if self.done:
+            return
+        self.state = 'running'
+        if progress is not None:
+            self.progress = max(0, min(progress, 100))
+        if status is not None:
+            self.status = status
+
+    def finish(self, state: JobState, error: str = '') -> None:
+        if state not in FINAL_STATES:
+            raise ValueError(f'{state!r} is not a final job state')
+        self.state = state
+        self.error = error
+        if state == 'succeeded':
+            self.progress = 100
@@ -0,0 +1,54 @@
+from typing import Iterable
+
+from botflow.specs import FinishStep, PipelineStep, as_finish_step
+from botflow.streams import is_stream_step
+
+
+def has_dependencies(steps: Iterable[PipelineStep]) -> bool:
+    return any(as_finish_step(step).depends_on is not None for step in steps)
+
+
+class StepGraph:
+    def __init__(self, steps: Iterable[PipelineStep]):
+        self.steps: list[FinishStep] = [as_finish_step(step) for step in steps]
+        self.dependencies: dict[str, tuple[str, ...]] = {}
+
+        previous = None
+        for step in self.steps:
+            if step.name in self.dependencies:
+                raise ValueError(f'Duplicate finish step name: {step.name}')
+            if is_stream_step(step):
+                raise ValueError(f"Stream stage '{step.name}' cannot be used with depends_on")
+
+            if step.depends_on is None:
+                deps = (previous,) if previous else ()
+            else:
+                deps = step.depends_on
+
+            self.dependencies[step.name] = deps
+            previous = step.name
+
+        for name, deps in self.dependencies.items():
+            unknown = [d for d in deps if d not in self.dependencies]
+            if unknown:
+                raise ValueError(f"Step '{name}' depends on unknown steps: {', '.join(unknown)}")
+
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        done: set[str] = set()
+        remaining = [step.name for step in self.steps]
+
+        while remaining:
+            ready = [n for n in remaining if all(d in done for d in self.dependencies[n])]
+            if not ready:
+                raise ValueError(f"Cycle detected between steps: {', '.join(remaining)}")
+            done.update(ready)
+            remaining = [n for n in remaining if n not in done]
+
+    def ready(self, done: set[str], pending: set[str]) -> list[FinishStep]:
+        return [
+            step
+            for step in self.steps
+            if step.name in pending and all(d in done for d in self.dependencies[step.name])
+        ]
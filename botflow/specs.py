@@ -0,0 +1,115 @@
+import logging
+from abc import ABC
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Literal,
+    Optional,
+    Protocol,
+    Union,
+    runtime_checkable,
+)
+
+from botflow.cache import CACHE_ATTR, CachePolicy
+from botflow.cancellation import CancelToken
+from botflow.prefetch import Prefetched
+from botflow.registry import ResourceRegistry, ResourceSpec
+from botflow.retry import RETRY_ATTR, RetryPolicy
+
+if TYPE_CHECKING:
+    from botflow.types import WidgetAbstract
+
+
+@runtime_checkable
+class I18n(Protocol):
+    def t(self, key: str, **params: Any) -> str: ...
+
+
+@dataclass(frozen=True)
+class BotPipelineInfo:
+    status: Optional[Callable[[str], None]]
+    progress: Optional[Callable[[int], None]]
+    percentage: int
+    step_of: str
+    step_name: str
+    step_number: int
+    total_steps: int
+    step_progress: Optional[Callable[[int], None]] = field(default=None)
+
+
+@dataclass(frozen=True)
+class FinishContext:
+    data: dict[str, Any]
+    logger: logging.Logger
+    pipeline_info: BotPipelineInfo
+    cancel_token: CancelToken = field(default_factory=CancelToken)
+    resources: Optional[ResourceRegistry] = field(default=None)
+    stream: Optional[AsyncIterator[Any]] = field(default=None)
+    prefetched: Prefetched = field(default_factory=Prefetched)
+
+
+FinishReturn = Union[None, Awaitable[None], AsyncIterator[Any]]
+FinishFn = Callable[[FinishContext], FinishReturn]
+ValidationResult = tuple[bool, str]
+Validator = Callable[[Any], Union[ValidationResult, Awaitable[ValidationResult]]]
+PrefetchFn = Callable[[Any], Awaitable[Any]]
+StepExecutor = Literal['thread', 'process']
+
+
+@dataclass(frozen=True)
+class FinishStep:
+    fn: FinishFn
+    name: str = field(default='')
+    depends_on: Optional[tuple[str, ...]] = field(default=None)
+    executor: Optional[StepExecutor] = field(default=None)
+    timeout: Optional[float] = field(default=None)
+    cache: Optional[CachePolicy] = field(default=None)
+    buffer_size: int = field(default=8)
+    retry: Optional[RetryPolicy] = field(default=None)
+    loop_key: Optional[str] = field(default=None)
+
+    def __post_init__(self):
+        if not self.name:
+            object.__setattr__(self, 'name', self.fn.__name__)
+        if self.cache is None:
+            object.__setattr__(self, 'cache', getattr(self.fn, CACHE_ATTR, None))
+        if self.retry is None:
+            object.__setattr__(self, 'retry', getattr(self.fn, RETRY_ATTR, None))
+        if self.depends_on is not None:
+            object.__setattr__(self, 'depends_on', tuple(self.depends_on))
+
+
+PipelineStep = Union[FinishFn, FinishStep]
+
+
+def as_finish_step(step: PipelineStep) -> FinishStep:
+    if isinstance(step, FinishStep):
+        return step
+    return FinishStep(fn=step)
+
+
+@dataclass(frozen=True)
+class StepSpec(ABC):
+    key: str
+    title: str
+    widget_cls: type['WidgetAbstract']
+    validator: Optional[Validator] = field(default=None)
+    validate_in_thread: bool = field(default=False)
+    live_validation: bool = field(default=False)
+    live_validation_delay: float = field(default=0.4)
+    prefetch: Optional[PrefetchFn] = field(default=None)
+
+
+@dataclass(frozen=True)
+class FlowSpec:
+    name: str
+    steps: list[StepSpec]
+    on_finish: list[PipelineStep] = field(default_factory=list)
+    max_parallel_steps: Optional[int] = field(default=None)
+    executor: StepExecutor = field(default='thread')
+    resources: list[ResourceSpec] = field(default_factory=list)
+    run_on_loop: bool = field(default=False)
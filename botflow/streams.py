@@ -0,0 +1,51 @@
+import asyncio
+import inspect
+from typing import Any, AsyncIterator
+
+from botflow.specs import FinishStep
+
+END_OF_STREAM = object()
+
+
+def is_stream_step(step: FinishStep) -> bool:
+    return inspect.isasyncgenfunction(step.fn)
+
+
+def stream_units(steps: list[FinishStep]) -> list[list[FinishStep]]:
+    units: list[list[FinishStep]] = []
+    stream: list[FinishStep] = []
+
+    for step in steps:
+        if stream:
+            if not (is_stream_step(step) or inspect.iscoroutinefunction(step.fn)):
+                raise ValueError(f"Step '{step.name}' consumes a stream and must be async")
+            stream.append(step)
+            if not is_stream_step(step):
+                stream = []
+            continue
+
+        units.append([step])
+        if is_stream_step(step):
+            stream = units[-1]
+
+    for unit in (u for u in units if is_stream_step(u[0])):
+        for step in unit:
+            _check_stage(step)
+    return units
+
+
+def _check_stage(step: FinishStep) -> None:
+    if step.executor == 'process':
+        raise ValueError(f"Step '{step.name}' is a stream stage and cannot run in a process")
+    if step.retry:
+        raise ValueError(f"Step '{step.name}' is a stream stage and cannot be retried")
+    if step.cache:
+        raise ValueError(f"Step '{step.name}' is a stream stage and cannot be cached")
+
+
+async def iter_queue(queue: asyncio.Queue) -> AsyncIterator[Any]:
+    while True:
+        item = await queue.get()
+        if item is END_OF_STREAM:
+            return
+        yield item
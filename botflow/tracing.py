@@ -0,0 +1,161 @@
+import json
+import os
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime as dt
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar, Union
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class StepTiming:
+    name: str
+    status: str
+    executor: str
+    start: float
+    wall_time: float
+    cpu_time: Optional[float]
+    thread_id: int
+    thread_name: str
+    peak_memory: Optional[int]
+
+
+class StepSpan:
+    def __init__(self, name: str) -> None:
+        thread = threading.current_thread()
+        self.name = name
+        self.status = 'ok'
+        self.executor = 'thread'
+        self.thread_id = thread.ident or 0
+        self.thread_name = thread.name
+        self.cpu_time: Optional[float] = None
+        self.measured = False
+
+
+class PipelineTracer:
+    def __init__(
+        self,
+        trace_dir: Optional[Union[str, Path]] = None,
+        trace_memory: bool = False,
+    ) -> None:
+        self.trace_dir = Path(trace_dir) if trace_dir else None
+        self.trace_memory = trace_memory
+        self.records: list[StepTiming] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        self.records = []
+        self._origin = time.perf_counter()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[StepSpan]:
+        span = StepSpan(name)
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield span
+        except BaseException:
+            span.status = 'error'
+            raise
+        finally:
+            wall_time = time.perf_counter() - start
+            cpu_time = span.cpu_time if span.measured else time.thread_time() - cpu_start
+            peak = None
+            if self.trace_memory and tracemalloc.is_tracing():
+                peak = tracemalloc.get_traced_memory()[1]
+
+            record = StepTiming(
+                name=span.name,
+                status=span.status,
+                executor=span.executor,
+                start=start - self._origin,
+                wall_time=wall_time,
+                cpu_time=cpu_time,
+                thread_id=span.thread_id,
+                thread_name=span.thread_name,
+                peak_memory=peak,
+            )
+            with self._lock:
+                self.records.append(record)
+
+    async def measure(self, span: StepSpan, awaitable: Awaitable[T]) -> T:
+        thread = threading.current_thread()
+        span.executor = 'loop'
+        span.thread_id = thread.ident or 0
+        span.thread_name = thread.name
+        span.measured = True
+
+        cpu_start = time.thread_time()
+        try:
+            return await awaitable
+        finally:
+            span.cpu_time = time.thread_time() - cpu_start
+
+    def call(self, span: StepSpan, fn: Callable[..., T], *args: Any) -> T:
+        thread = threading.current_thread()
+        span.thread_id = thread.ident or 0
+        span.thread_name = thread.name
+        span.measured = True
+
+        cpu_start = time.thread_time()
+        try:
+            return fn(*args)
+        finally:
+            span.cpu_time = time.thread_time() - cpu_start
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+        threads: dict[int, str] = {}
+
+        for record in self.records:
+            threads[record.thread_id] = record.thread_name
+            events.append(
+                {
+                    'name': record.name,
+                    'cat': record.executor,
+                    'ph': 'X',
+                    'ts': round(record.start * 1_000_000),
+                    'dur': round(record.wall_time * 1_000_000),
+                    'pid': pid,
+                    'tid': record.thread_id,
+                    'args': asdict(record),
+                }
+            )
+
+        for tid, name in threads.items():
+            events.append(
+                {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+            )
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write(self, name: str = 'pipeline') -> Optional[Path]:
+        if not self.trace_dir:
+            return None
+
+        self.trace_dir.mkdir(parents=True, exist_ok=True)
+        stamp = dt.now().strftime('%d-%m-%Y_%Hh-%Mm-%Ss-%f')
+        safe_name = re.sub(r'[^\w.-]', '_', name) or 'pipeline'
+        path = self.trace_dir / f'{safe_name}_{stamp}.json'
+        path.write_text(json.dumps(self.to_chrome_trace()), encoding='utf-8')
+        return path
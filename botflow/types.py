@@ -1,62 +1,46 @@
-import logging
-from abc import ABC, ABCMeta, abstractmethod
-from dataclasses import dataclass, field
-from typing import (
-    Any,
-    Awaitable,
-    Callable,
-    Generic,
-    Optional,
-    Protocol,
-    TypeVar,
-    Union,
-    runtime_checkable,
-)
+from abc import ABCMeta, abstractmethod
+from typing import Any, Generic, Optional, TypeVar
 
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QWidget
 
+from botflow.specs import (
+    BotPipelineInfo,
+    FinishContext,
+    FinishFn,
+    FinishReturn,
+    FinishStep,
+    FlowSpec,
+    I18n,
+    PipelineStep,
+    PrefetchFn,
+    StepExecutor,
+    StepSpec,
+    ValidationResult,
+    Validator,
+    as_finish_step,
+)
 
-@runtime_checkable
-class I18n(Protocol):
-    def t(self, key: str, **params: Any) -> str: ...
-
-
-@dataclass(frozen=True)
-class BotPipelineInfo:
-    status: Optional[Callable[[str], None]]
-    progress: Optional[Callable[[int], None]]
-    percentage: int
-    step_of: str
-    step_name: str
-    step_number: int
-    total_steps: int
-
-
-@dataclass(frozen=True)
-class FinishContext:
-    data: dict[str, Any]
-    logger: logging.Logger
-    pipeline_info: BotPipelineInfo
-
-
-FinishReturn = Union[None, Awaitable[None]]
-FinishFn = Callable[[FinishContext], FinishReturn]
-Validator = Callable[[Any], tuple[bool, str]]
-
-
-@dataclass(frozen=True)
-class StepSpec(ABC):
-    key: str
-    title: str
-    widget_cls: type['WidgetAbstract']
-    validator: Optional[Validator] = field(default=None)
-
-
-@dataclass(frozen=True)
-class FlowSpec:
-    name: str
-    steps: list[StepSpec]
-    on_finish: list[FinishFn] = field(default_factory=list)
+__all__ = [
+    'ABCQWidgetMeta',
+    'BotPipelineInfo',
+    'FinishContext',
+    'FinishFn',
+    'FinishReturn',
+    'FinishStep',
+    'FlowSpec',
+    'I18n',
+    'LoadingAbstract',
+    'PipelineStep',
+    'PrefetchFn',
+    'Spec',
+    'StepExecutor',
+    'StepSpec',
+    'ValidationResult',
+    'Validator',
+    'WidgetAbstract',
+    'as_finish_step',
+]
 
 
 class ABCQWidgetMeta(ABCMeta, type(QWidget)):
@@ -64,6 +48,8 @@ class ABCQWidgetMeta(ABCMeta, type(QWidget)):
 
 
 class LoadingAbstract(QWidget, metaclass=ABCQWidgetMeta):
+    cancel_requested = Signal()
+
     @abstractmethod
     def set_progress(self, value: int) -> None:  # noqa
         pass
@@ -72,11 +58,16 @@ class LoadingAbstract(QWidget, metaclass=ABCQWidgetMeta):
     def set_status(self, text: str) -> None:  # noqa
         pass
 
+    def set_cancellable(self, enabled: bool) -> None:
+        pass
+
 
 Spec = TypeVar('Spec', bound=StepSpec)
 
 
 class WidgetAbstract(QWidget, Generic[Spec], metaclass=ABCQWidgetMeta):
+    value_edited = Signal()
+
     def __init__(self, spec: Spec, parent: Optional[QWidget] = None, **extra_kwargs: Any):
         super().__init__(parent)
         self.spec = spec
@@ -85,3 +76,18 @@ class WidgetAbstract(QWidget, Generic[Spec], metaclass=ABCQWidgetMeta):
     @abstractmethod
     def value(self) -> Any:
         pass
+
+    def can_restore(self) -> bool:
+        return False
+
+    def set_value(self, value: Any) -> None:
+        pass
+
+    def can_reset(self) -> bool:
+        return False
+
+    def reset(self) -> None:
+        pass
+
+    def show_validation(self, ok: Optional[bool], message: str) -> None:
+        pass
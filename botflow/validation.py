@@ -0,0 +1,109 @@
+import inspect
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Hashable, Optional
+
+from botflow.loops import LoopRunner
+from botflow.specs import StepSpec, ValidationResult
+
+
+def _value_key(value: Any) -> Hashable:
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _passed(future: Future) -> bool:
+    # Only passes are cached: a failure may clear up once the operator fixes the problem.
+    return not future.cancelled() and future.exception() is None and bool(future.result()[0])
+
+
+def _completed(result: ValidationResult) -> 'Future[ValidationResult]':
+    future: Future[ValidationResult] = Future()
+    future.set_result(result)
+    return future
+
+
+class StepValidation:
+    def __init__(self, async_loop: LoopRunner, max_threads: int = 2) -> None:
+        self.async_loop = async_loop
+        self._lock = threading.Lock()
+        self._results: dict[tuple[str, Hashable], ValidationResult] = {}
+        self._pending: dict[tuple[str, Hashable], Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._max_threads = max_threads
+
+    def cached(self, spec: StepSpec, value: Any) -> Optional[ValidationResult]:
+        with self._lock:
+            return self._results.get((spec.key, _value_key(value)))
+
+    def submit(self, spec: StepSpec, value: Any) -> 'Future[ValidationResult]':
+        if not spec.validator:
+            return _completed((True, ''))
+
+        key = (spec.key, _value_key(value))
+        with self._lock:
+            if key in self._results:
+                return _completed(self._results[key])
+            if key in self._pending:
+                return self._pending[key]
+
+        future = self._start(spec, value)
+        if future.done():
+            if _passed(future):
+                with self._lock:
+                    self._results[key] = future.result()
+            return future
+
+        with self._lock:
+            self._pending[key] = future
+        future.add_done_callback(lambda f: self._store(key, f))
+        return future
+
+    def _start(self, spec: StepSpec, value: Any) -> Future:
+        assert spec.validator is not None
+        if spec.validate_in_thread:
+            return self._thread_pool().submit(spec.validator, value)
+
+        try:
+            result = spec.validator(value)
+        except Exception as e:
+            future: Future = Future()
+            future.set_exception(e)
+            return future
+
+        if inspect.isawaitable(result):
+            return self.async_loop.submit(self._await(result))
+        return _completed(result)
+
+    async def _await(self, awaitable: Any) -> ValidationResult:
+        return await awaitable
+
+    def _store(self, key: tuple[str, Hashable], future: Future) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+            if _passed(future):
+                self._results[key] = future.result()
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if not self._executor:
+                self._executor = ThreadPoolExecutor(
+                    self._max_threads, thread_name_prefix='botflow-validate'
+                )
+            return self._executor
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pending = list(self._pending.values())
+            executor, self._executor = self._executor, None
+        for future in pending:
+            future.cancel()
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Optional
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -16,18 +16,28 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from botflow.qss import qss_to_string
-from botflow.resolver import find_resource_file
 from botflow.types import StepSpec, WidgetAbstract
 
 
+class ValidationLabel(QLabel):
+    def __init__(self) -> None:
+        super().__init__()
+        self.setProperty('role', 'validation_message')
+        self.setWordWrap(True)
+        self.setVisible(False)
+
+    def show_result(self, ok: Optional[bool], message: str) -> None:
+        state = 'pending' if ok is None else 'ok' if ok else 'error'
+        self.setProperty('state', state)
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.setText(message)
+        self.setVisible(bool(message))
+
+
 class TextWidget(WidgetAbstract['TextStepSpec']):
     def __init__(self, spec: 'TextStepSpec', **extra_kwargs: Any) -> None:
         super().__init__(spec, **extra_kwargs)
-        style_file = find_resource_file('styles/text_widget.qss')
-        qss_string = qss_to_string(style_file)
-        self.setStyleSheet(qss_string)
-
         title = QLabel(spec.title)
         title.setProperty('role', 'text_title')
         title.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
@@ -42,11 +52,14 @@ class TextWidget(WidgetAbstract['TextStepSpec']):
         self.input = QLineEdit()
         self.input.setProperty('role', 'text_input')
         self.input.setPlaceholderText(spec.placeholder)
+        self.input.textEdited.connect(self.value_edited)
+        self.validation_lbl = ValidationLabel()
 
         content = QWidget()
         content_layout = QVBoxLayout(content)
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.addWidget(self.input)
+        content_layout.addWidget(self.validation_lbl)
 
         wrapper = QWidget()
         wrapper_layout = QVBoxLayout(wrapper)
@@ -76,16 +89,28 @@ class TextWidget(WidgetAbstract['TextStepSpec']):
     def value(self) -> str:
         return self.input.text().strip()
 
+    def can_restore(self) -> bool:
+        return True
+
+    def set_value(self, value: Any) -> None:
+        self.input.setText(value or '')
+
+    def can_reset(self) -> bool:
+        return True
+
+    def reset(self) -> None:
+        self.input.clear()
+        self.validation_lbl.show_result(None, '')
+
+    def show_validation(self, ok: Optional[bool], message: str) -> None:
+        self.validation_lbl.show_result(ok, message)
+
 
 class FormWidget(WidgetAbstract['FormStepSpec']):
     def __init__(self, spec: 'FormStepSpec', **extra_kwargs) -> None:
         super().__init__(spec, **extra_kwargs)
         self._inputs: dict[str, QLineEdit] = {}
 
-        style_file = find_resource_file('styles/form_widget.qss')
-        qss_string = qss_to_string(style_file)
-        self.setStyleSheet(qss_string)
-
         title = QLabel(spec.title)
         title.setProperty('role', 'step_title')
         title.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
@@ -110,11 +135,14 @@ class FormWidget(WidgetAbstract['FormStepSpec']):
             edit.setPlaceholderText(inp.placeholder)
             edit.setMaxLength(inp.max_length)
             edit.setEchoMode(inp.echo_mode)
+            edit.textEdited.connect(self.value_edited)
 
             self._inputs[inp.key] = edit
             form.addRow(lbl, edit)
 
         content_layout.addLayout(form)
+        self.validation_lbl = ValidationLabel()
+        content_layout.addWidget(self.validation_lbl)
 
         wrapper = QWidget()
         wrapper_layout = QVBoxLayout(wrapper)
@@ -139,14 +167,29 @@ class FormWidget(WidgetAbstract['FormStepSpec']):
     def value(self) -> dict[str, str]:
         return {k: w.text().strip() for k, w in self._inputs.items()}
 
+    def can_restore(self) -> bool:
+        return True
+
+    def set_value(self, value: Any) -> None:
+        values = value or {}
+        for key, edit in self._inputs.items():
+            edit.setText(values.get(key, ''))
+
+    def can_reset(self) -> bool:
+        return True
+
+    def reset(self) -> None:
+        for edit in self._inputs.values():
+            edit.clear()
+        self.validation_lbl.show_result(None, '')
+
+    def show_validation(self, ok: Optional[bool], message: str) -> None:
+        self.validation_lbl.show_result(ok, message)
+
 
 class FileWidget(WidgetAbstract['FileStepSpec']):
     def __init__(self, spec: 'FileStepSpec', **extra_kwargs: Any):
         super().__init__(spec, **extra_kwargs)
-        style_file = find_resource_file('styles/file_widget.qss')
-        qss_string = qss_to_string(style_file)
-        self.setStyleSheet(qss_string)
-
         title = QLabel(spec.title)
         title.setProperty('role', 'file_title')
         title.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
@@ -173,10 +216,13 @@ class FileWidget(WidgetAbstract['FileStepSpec']):
         row.addWidget(self.input, 1)
         row.addWidget(btn)
 
+        self.validation_lbl = ValidationLabel()
+
         content = QWidget()
         content_layout = QVBoxLayout(content)
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.addLayout(row)
+        content_layout.addWidget(self.validation_lbl)
 
         wrapper = QWidget()
         wrapper_layout = QVBoxLayout(wrapper)
@@ -209,10 +255,27 @@ class FileWidget(WidgetAbstract['FileStepSpec']):
         )
         if path:
             self.input.setText(path)
+            self.value_edited.emit()
 
     def value(self) -> str:
         return self.input.text().strip()
 
+    def can_restore(self) -> bool:
+        return True
+
+    def set_value(self, value: Any) -> None:
+        self.input.setText(value or '')
+
+    def can_reset(self) -> bool:
+        return True
+
+    def reset(self) -> None:
+        self.input.clear()
+        self.validation_lbl.show_result(None, '')
+
+    def show_validation(self, ok: Optional[bool], message: str) -> None:
+        self.validation_lbl.show_result(ok, message)
+
 
 @dataclass(frozen=True)
 class TextStepSpec(StepSpec):
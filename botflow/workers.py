@@ -1,130 +1,112 @@
-import asyncio
-import inspect
-import threading
 import traceback
+from concurrent.futures import Future
 from logging import Logger
-from typing import Any, Coroutine, List, Optional
+from pathlib import Path
+from typing import Any, List, Mapping, Optional
 
 from PySide6.QtCore import QObject, Signal, Slot
 
-from botflow.exceptions import PipelineExceptedError
-from botflow.types import BotPipelineInfo, FinishContext, FinishFn
+from botflow.cache import StepCache
+from botflow.cancellation import CancelToken
+from botflow.checkpoint import CheckpointStore
+from botflow.exceptions import PipelineCancelledError, PipelineExceptedError
+from botflow.loops import AsyncLoopPool, AsyncLoopThreadWorker, LoopRunner
+from botflow.pipeline import PipelineRunner, PipelineThread
+from botflow.processes import ProcessStepExecutor
+from botflow.tracing import PipelineTracer, StepTiming
+from botflow.types import PipelineStep, StepExecutor
 
-
-class AsyncLoopThreadWorker:
-    def __init__(self) -> None:
-        self.loop: Optional[asyncio.AbstractEventLoop] = None
-        self._thread: Optional[threading.Thread] = None
-        self._started = threading.Event()
-
-    def start(self) -> None:
-        if self._thread and self._thread.is_alive():
-            return
-
-        def _runner() -> None:
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            self._started.set()
-            self.loop.run_forever()
-
-        self._thread = threading.Thread(target=_runner, daemon=True)
-        self._thread.start()
-        self._started.wait()
-
-    def stop(self) -> None:
-        if not self.loop:
-            return
-        self.loop.call_soon_threadsafe(self.loop.stop)
-
-    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
-        if not self.loop:
-            raise RuntimeError('Async loop not started')
-        fut = asyncio.run_coroutine_threadsafe(coro, self.loop)
-        return fut.result()
+__all__ = ['AsyncLoopPool', 'AsyncLoopThreadWorker', 'PipelineThread', 'PipelineWorker']
 
 
 class PipelineWorker(QObject):
     progress = Signal(int)
     status = Signal(str)
     error = Signal(str)
-    finished = Signal(dict)
+    cancelled = Signal()
+    traced = Signal(list)
+    finished = Signal(dict, list)
 
     def __init__(
         self,
         ctx: dict[str, Any],
-        pipeline: List[FinishFn],
+        pipeline: List[PipelineStep],
         logger: Logger,
-        async_loop: AsyncLoopThreadWorker,
+        async_loop: LoopRunner,
+        max_parallel_steps: Optional[int] = None,
+        executor: StepExecutor = 'thread',
+        process_pool: Optional[ProcessStepExecutor] = None,
+        max_updates_per_second: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        checkpoint_key: str = 'pipeline',
+        resume: bool = False,
+        step_cache: Optional[StepCache] = None,
+        tracer: Optional[PipelineTracer] = None,
+        prefetched: Optional[Mapping[str, Future]] = None,
     ):
         super().__init__()
-        self.ctx = ctx
-        self.pipeline = pipeline
         self.logger = logger
-        self.async_loop = async_loop
-        self.async_loop.start()
-
-    def _call_step(
-        self,
-        fn: FinishFn,
-        progress_percentage: int,
-        step_of: str,
-        step_name: str,
-        step_number: int,
-        total_steps: int,
-    ) -> None:
-        context = FinishContext(
-            data=self.ctx,
-            logger=self.logger,
-            pipeline_info=BotPipelineInfo(
-                status=self.status.emit,
-                progress=self.progress.emit,
-                percentage=progress_percentage,
-                step_of=step_of,
-                step_name=step_name,
-                step_number=step_number,
-                total_steps=total_steps,
-            ),
+        self.runner = PipelineRunner(
+            ctx,
+            pipeline,
+            logger,
+            async_loop,
+            max_parallel_steps=max_parallel_steps,
+            executor=executor,
+            process_pool=process_pool,
+            max_updates_per_second=max_updates_per_second,
+            cancel_token=cancel_token,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
+            resume=resume,
+            step_cache=step_cache,
+            tracer=tracer,
+            on_progress=self.progress.emit,
+            on_status=self.status.emit,
+            on_traced=self.traced.emit,
+            prefetched=prefetched,
         )
 
-        if inspect.iscoroutinefunction(fn):
-            self.async_loop.run(fn(context))
-            return
-
-        fn(context)
+    @property
+    def cancel_token(self) -> CancelToken:
+        return self.runner.cancel_token
 
-    @Slot()
-    def run(self):
-        try:
-            total = len(self.pipeline)
-            self.logger.info('Starting pipeline with %d steps', total)
+    @property
+    def timings(self) -> list[StepTiming]:
+        return self.runner.timings
 
-            self.progress.emit(0)
-            self.status.emit('Starting pipeline')
+    @property
+    def trace_path(self) -> Optional[Path]:
+        return self.runner.trace_path
 
-            for i, fn in enumerate(self.pipeline, start=1):
-                pct = int((i - 1) / total * 100)
-                step_of = f'Step {i} of {total}:'
-                step_name = f'{fn.__name__}'
-                full_step_name = f'{step_of} {step_name}'
-                step_number = i
+    def cancel(self) -> None:
+        self.runner.cancel()
 
-                self.logger.info(full_step_name)
-                self.status.emit(full_step_name)
-                self.progress.emit(pct)
+    def _emit_failure(self, exc: Exception) -> None:
+        if isinstance(exc, PipelineCancelledError):
+            self.cancelled.emit()
+        elif isinstance(exc, PipelineExceptedError):
+            self.error.emit(exc.popup_message)
+        else:
+            self.error.emit(traceback.format_exc())
 
-                self._call_step(fn, pct, step_of, step_name, step_number, total)
-
-            self.status.emit('Pipeline completed successfully')
-            self.progress.emit(100)
+    @Slot()
+    def run(self):
+        try:
+            ctx = self.runner.execute()
+        except Exception as e:
+            self._emit_failure(e)
+        else:
+            self.finished.emit(ctx, self.runner.timings)
 
-            self.logger.info('Pipeline completed successfully')
-            self.finished.emit(self.ctx)
+    async def run_async(self) -> None:
+        try:
+            ctx = await self.runner.execute_async()
         except Exception as e:
-            tb = traceback.format_exc()
-            self.logger.warning('Pipeline Error: %s', tb)
+            self._emit_failure(e)
+        else:
+            self.finished.emit(ctx, self.runner.timings)
 
-            if isinstance(e, PipelineExceptedError):
-                popup_msg = e.popup_message
-                self.error.emit(popup_msg)
-            else:
-                self.error.emit(tb)
+    def run_on_loop(self) -> Future:
+        return self.runner.async_loop.submit(self.run_async())
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import Qt
+
+from botflow.batch import BatchWorker, load_batch_records
+from botflow.workers import AsyncLoopThreadWorker
+
+
+@pytest.fixture
+def logger():
+    log = logging.getLogger('botflow-tests')
+    log.setLevel(logging.DEBUG)
+    return log
+
+
+@pytest.fixture
+def async_loop():
+    loop = AsyncLoopThreadWorker()
+    loop.start()
+    yield loop
+    loop.stop()
+    time.sleep(0.05)
+
+
+def _wire_signals(worker: BatchWorker):
+    progress_events, finished_events, error_events = [], [], []
+
+    direct = Qt.ConnectionType.DirectConnection
+    worker.progress.connect(lambda v: progress_events.append(v), direct)
+    worker.finished.connect(lambda r: finished_events.append(r), direct)
+    worker.error.connect(lambda e: error_events.append(e), direct)
+
+    return progress_events, finished_events, error_events
+
+
+def test_load_batch_records_reads_csv_rows(tmp_path: Path):
+    p = tmp_path / 'records.csv'
+    p.write_text('name,age\nAna,30\nBia,25\n', encoding='utf-8')
+
+    assert load_batch_records(p) == [{'name': 'Ana', 'age': '30'}, {'name': 'Bia', 'age': '25'}]
+
+
+def test_load_batch_records_reads_json_list(tmp_path: Path):
+    p = tmp_path / 'records.json'
+    p.write_text(json.dumps([{'name': 'Ana'}]), encoding='utf-8')
+
+    assert load_batch_records(p) == [{'name': 'Ana'}]
+
+
+def test_load_batch_records_rejects_json_that_is_not_a_list_of_objects(tmp_path: Path):
+    p = tmp_path / 'records.json'
+    p.write_text(json.dumps({'name': 'Ana'}), encoding='utf-8')
+
+    with pytest.raises(ValueError, match='list of objects'):
+        load_batch_records(p)
+
+
+def test_load_batch_records_rejects_other_extensions(tmp_path: Path):
+    with pytest.raises(ValueError, match='.csv or .json'):
+        load_batch_records(tmp_path / 'records.txt')
+
+
+def test_batch_runs_records_concurrently_and_collects_results(async_loop, logger):
+    barrier = threading.Barrier(2, timeout=2)
+
+    def step(context):
+        barrier.wait()
+        if context.data['name'] == 'bad':
+            raise ValueError('bad record')
+        context.data['greeting'] = f"Hello {context.data['name']} from {context.data['site']}"
+
+    records = [{'name': 'Ana'}, {'name': 'bad'}, {'name': 'Bia'}, {'name': 'Caio'}]
+    worker = BatchWorker(
+        records,
+        [step],
+        logger,
+        async_loop,
+        concurrency=2,
+        base_context={'site': 'HQ'},
+    )
+    progress, finished, error = _wire_signals(worker)
+    worker.run()
+
+    assert error == []
+    results = finished[0]
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert results[0].context['greeting'] == 'Hello Ana from HQ'
+    assert 'bad record' in results[1].error
+    assert progress[0] == 0
+    assert progress[-1] == 100
+    assert progress == sorted(progress)
+
+
+def test_batch_overall_progress_never_decreases_with_concurrent_records(async_loop, logger):
+    def step(context):
+        time.sleep(0.001)
+
+    worker = BatchWorker(
+        [{'n': i} for i in range(8)], [step] * 6, logger, async_loop, concurrency=8
+    )
+    progress = []
+
+    def on_progress(value):
+        # A slow slot widens the window between computing and emitting a value.
+        time.sleep(0.002 if len(progress) % 2 else 0)
+        progress.append(value)
+
+    worker.progress.connect(on_progress, Qt.ConnectionType.DirectConnection)
+    worker.run()
+
+    assert progress[-1] == 100
+    assert progress == sorted(progress)
+
+
+def test_batch_cancel_skips_remaining_records(async_loop, logger):
+    async def slow_step(_):
+        await asyncio.sleep(10)
+
+    worker = BatchWorker([{}, {}, {}], [slow_step], logger, async_loop, concurrency=1)
+    _, finished, _ = _wire_signals(worker)
+    cancelled = []
+    worker.cancelled.connect(lambda: cancelled.append(True), Qt.ConnectionType.DirectConnection)
+    threading.Timer(0.05, worker.cancel).start()
+    worker.run()
+
+    assert cancelled == [True]
+    assert finished == []
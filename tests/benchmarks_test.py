@@ -0,0 +1,50 @@
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.baseline import BenchmarkResult, Comparison, compare, load_baseline, save_baseline
+
+
+def test_baseline_round_trip(tmp_path):
+    path = tmp_path / 'baseline.json'
+    save_baseline(path, [BenchmarkResult('steps', 100, 0.5)])
+
+    assert load_baseline(path) == {'steps': 0.005}
+
+
+def test_missing_baseline_is_empty(tmp_path):
+    assert load_baseline(tmp_path / 'missing.json') == {}
+
+
+def test_compare_flags_cases_past_threshold():
+    results = [BenchmarkResult('fast', 10, 1.0), BenchmarkResult('slow', 10, 1.0)]
+
+    fast, slow = compare(results, {'fast': 0.1, 'slow': 0.05})
+
+    assert fast.ratio == 1.0
+    assert not fast.regressed(0.25)
+    assert slow.ratio == 2.0
+    assert slow.regressed(0.25)
+    assert not slow.regressed(1.5)
+
+
+def test_new_cases_never_regress():
+    comparison = Comparison('new', None, 1.0)
+
+    assert comparison.ratio is None
+    assert not comparison.regressed(0.0)
+
+
+def test_main_saves_then_fails_on_regression(tmp_path, capsys):
+    path = tmp_path / 'baseline.json'
+    args = ['-k', 'pipeline_sync_10', '--repeat', '1', '--baseline', str(path)]
+
+    assert main([*args, '--save']) == 0
+    assert 'pipeline_sync_10' in json.loads(path.read_text())['results']
+
+    data = json.loads(path.read_text())
+    for entry in data['results'].values():
+        entry['per_op'] /= 1000
+    path.write_text(json.dumps(data))
+
+    assert main(args) == 1
+    assert 'REGRESSED' in capsys.readouterr().out
@@ -0,0 +1,92 @@
+import os
+import time
+from pathlib import Path
+
+from botflow.cache import CachePolicy, StepCache, cache_step
+from botflow.types import FinishStep
+
+
+@cache_step(inputs=['path', 'mode'], outputs=['converted'])
+def convert(context):
+    pass
+
+
+def test_cache_step_attaches_policy_picked_up_by_finish_step():
+    step = FinishStep(convert)
+
+    assert step.cache == CachePolicy(inputs=('path', 'mode'), outputs=('converted',))
+
+
+def test_key_depends_only_on_declared_inputs(tmp_path: Path):
+    cache = StepCache(tmp_path)
+    policy = CachePolicy(inputs=('a',), outputs=('b',))
+
+    k1 = cache.key(convert, policy, {'a': 1, 'other': 1})
+    k2 = cache.key(convert, policy, {'a': 1, 'other': 2})
+    k3 = cache.key(convert, policy, {'a': 2, 'other': 1})
+
+    assert k1 == k2
+    assert k1 != k3
+
+
+def test_key_changes_with_version(tmp_path: Path):
+    cache = StepCache(tmp_path)
+
+    k1 = cache.key(convert, CachePolicy(('a',), ('b',)), {'a': 1})
+    k2 = cache.key(convert, CachePolicy(('a',), ('b',), version='2'), {'a': 1})
+
+    assert k1 != k2
+
+
+def test_key_distinguishes_nested_containers(tmp_path: Path):
+    cache = StepCache(tmp_path)
+    policy = CachePolicy(inputs=('a',), outputs=('b',))
+
+    def key(value):
+        return cache.key(convert, policy, {'a': value})
+
+    assert key([['x'], 'y']) != key([['x', 'y']])
+    assert key({'k': [['x'], 'y']}) != key({'k': [['x', 'y']]})
+    assert key([{'k': 1}, 2]) != key([{'k': 1, 2: None}])
+    assert key(['x', 'y']) != key(('x', 'y'))
+    assert key([]) != key({})
+
+
+def test_key_tracks_file_contents_for_path_values(tmp_path: Path):
+    cache = StepCache(tmp_path / 'cache')
+    policy = CachePolicy(inputs=('path',), outputs=('b',))
+    f = tmp_path / 'input.txt'
+    f.write_text('one', encoding='utf-8')
+
+    k1 = cache.key(convert, policy, {'path': str(f)})
+    assert cache.key(convert, policy, {'path': str(f)}) == k1
+
+    f.write_text('two', encoding='utf-8')
+    os.utime(f, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+
+    assert cache.key(convert, policy, {'path': str(f)}) != k1
+
+
+def test_put_and_get_round_trip(tmp_path: Path):
+    cache = StepCache(tmp_path)
+
+    cache.put('abc', {'out': [1, 2]})
+
+    assert cache.get('abc') == {'out': [1, 2]}
+    assert cache.get('missing') is None
+
+
+def test_evict_removes_least_recently_used_entries(tmp_path: Path):
+    cache = StepCache(tmp_path, max_bytes=10**9)
+    payload = {'out': 'x' * 1000}
+    for i, key in enumerate(['old', 'used', 'new']):
+        cache.put(key, payload)
+        os.utime(tmp_path / f'{key}.pkl', ns=(i * 10**9, i * 10**9))
+
+    cache.get('old')
+    cache.max_bytes = 2500
+    cache.evict()
+
+    assert cache.get('used') is None
+    assert cache.get('old') is not None
+    assert cache.get('new') is not None
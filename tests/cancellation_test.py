@@ -0,0 +1,112 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from botflow.cancellation import CancelToken, await_cancellable, wait_future
+from botflow.exceptions import PipelineCancelledError
+
+
+def test_cancel_runs_callbacks_once():
+    token = CancelToken()
+    calls = []
+    token.add_callback(lambda: calls.append('a'))
+
+    token.cancel()
+    token.cancel()
+
+    assert token.cancelled is True
+    assert calls == ['a']
+
+
+def test_add_callback_after_cancel_runs_immediately():
+    token = CancelToken()
+    token.cancel()
+    calls = []
+
+    token.add_callback(lambda: calls.append('a'))
+
+    assert calls == ['a']
+
+
+def test_child_is_cancelled_with_parent_until_detached():
+    parent = CancelToken()
+    child = parent.child()
+    detached = parent.child()
+    detached.detach()
+
+    parent.cancel()
+
+    assert child.cancelled is True
+    assert detached.cancelled is False
+
+
+def test_raise_if_cancelled():
+    token = CancelToken()
+    token.raise_if_cancelled()
+    token.cancel()
+
+    with pytest.raises(PipelineCancelledError):
+        token.raise_if_cancelled()
+
+
+def test_wait_future_returns_result():
+    fut = Future()
+    fut.set_result(42)
+
+    assert wait_future(fut) == 42
+
+
+def test_wait_future_times_out_and_cancels_pending_future():
+    fut = Future()
+
+    with pytest.raises(TimeoutError, match='0.05s'):
+        wait_future(fut, timeout=0.05)
+
+    assert fut.cancelled() is True
+
+
+def test_wait_future_returns_when_token_is_cancelled_even_if_future_keeps_running():
+    fut = Future()
+    fut.set_running_or_notify_cancel()
+    token = CancelToken()
+    threading.Timer(0.05, token.cancel).start()
+
+    with pytest.raises(PipelineCancelledError):
+        wait_future(fut, token)
+
+    assert fut.done() is False
+
+
+def test_await_cancellable_turns_token_cancel_into_pipeline_cancelled():
+    state = {}
+
+    async def hung():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state['cancelled'] = True
+            raise
+
+    async def main():
+        token = CancelToken()
+        asyncio.get_running_loop().call_later(0.01, token.cancel)
+        with pytest.raises(PipelineCancelledError):
+            await await_cancellable(hung(), token)
+
+    asyncio.run(main())
+    assert state == {'cancelled': True}
+
+
+def test_await_cancellable_lets_outer_cancellation_through():
+    async def main():
+        token = CancelToken()
+        task = asyncio.ensure_future(await_cancellable(asyncio.sleep(10), token))
+        await asyncio.sleep(0)
+        token.cancel()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
@@ -0,0 +1,48 @@
+import threading
+from pathlib import Path
+
+from botflow.checkpoint import CheckpointStore
+
+
+def test_save_and_load_round_trip(tmp_path: Path):
+    store = CheckpointStore(tmp_path)
+
+    store.save('my flow', ['a', 'b'], {'value': 1})
+    checkpoint = store.load('my flow')
+
+    assert checkpoint.completed == ('a', 'b')
+    assert checkpoint.data == {'value': 1}
+
+
+def test_save_skips_values_that_cannot_be_pickled(tmp_path: Path):
+    store = CheckpointStore(tmp_path)
+
+    store.save('flow', ['a'], {'value': 1, 'lock': threading.Lock()})
+
+    assert store.load('flow').data == {'value': 1}
+
+
+def test_load_returns_none_for_missing_or_corrupt_checkpoints(tmp_path: Path):
+    store = CheckpointStore(tmp_path)
+    assert store.load('flow') is None
+
+    (tmp_path / 'flow.ckpt').write_bytes(b'not a pickle')
+    assert store.load('flow') is None
+
+
+def test_clear_removes_checkpoint(tmp_path: Path):
+    store = CheckpointStore(tmp_path)
+    store.save('flow', ['a'], {})
+
+    store.clear('flow')
+    store.clear('flow')
+
+    assert store.load('flow') is None
+
+
+def test_keys_are_sanitized_into_file_names(tmp_path: Path):
+    store = CheckpointStore(tmp_path)
+
+    store.save('../evil/flow', [], {})
+
+    assert [p.name for p in tmp_path.iterdir()] == ['.._evil_flow.ckpt']
@@ -0,0 +1,109 @@
+import asyncio
+import io
+import json
+import logging
+import subprocess
+import sys
+
+import pytest
+
+from botflow.exceptions import PipelineExceptedError
+from botflow.headless import ConsoleProgress, load_context, load_flow, main, run_headless
+from botflow.specs import FlowSpec
+
+
+def shout(context):
+    context.pipeline_info.step_progress(50)
+    context.data['shout'] = context.data['name'].upper()
+
+
+async def greet(context):
+    await asyncio.sleep(0)
+    context.data['greeting'] = f"Hello {context.data['shout']}"
+
+
+def fail(context):
+    raise PipelineExceptedError('Nope', 'Something went wrong')
+
+
+FLOW = FlowSpec(name='headless', steps=[], on_finish=[shout, greet])
+FAILING_FLOW = FlowSpec(name='failing', steps=[], on_finish=[shout, fail])
+
+
+@pytest.fixture
+def logger():
+    log = logging.getLogger('botflow-tests')
+    log.setLevel(logging.DEBUG)
+    return log
+
+
+def test_run_headless_runs_pipeline_and_reports_progress(logger, tmp_path):
+    stream = io.StringIO()
+
+    result = run_headless(
+        FLOW,
+        {'name': 'ana'},
+        logger,
+        progress=ConsoleProgress(stream),
+        cache_dir=tmp_path,
+    )
+
+    assert result['greeting'] == 'Hello ANA'
+    lines = stream.getvalue().splitlines()
+    assert '[  0%] Step 1 of 2: shout' in lines
+    assert '[ 25%] Step 1 of 2: shout' in lines
+    assert lines[-1] == '[100%] Pipeline completed successfully'
+
+
+def test_run_headless_can_run_on_the_loop(logger, tmp_path):
+    flow = FlowSpec(name='loop', steps=[], on_finish=[shout, greet], run_on_loop=True)
+
+    result = run_headless(flow, {'name': 'bia'}, logger, cache_dir=tmp_path)
+
+    assert result['greeting'] == 'Hello BIA'
+
+
+def test_run_headless_raises_step_errors(logger, tmp_path):
+    with pytest.raises(PipelineExceptedError):
+        run_headless(FAILING_FLOW, {'name': 'ana'}, logger, cache_dir=tmp_path)
+
+
+def test_load_flow_and_context(tmp_path):
+    path = tmp_path / 'ctx.json'
+    path.write_text(json.dumps({'name': 'file', 'keep': 1}), encoding='utf-8')
+
+    assert load_flow('tests.headless_test:FLOW') is FLOW
+    assert load_context('{"name": "cli"}', path) == {'name': 'cli', 'keep': 1}
+    with pytest.raises(ValueError):
+        load_flow('tests.headless_test')
+    with pytest.raises(TypeError):
+        load_flow('tests.headless_test:shout')
+    with pytest.raises(ValueError):
+        load_context('[1, 2]')
+
+
+def test_main_writes_output_and_exit_codes(tmp_path, capsys):
+    output = tmp_path / 'out.json'
+    common = ['--cache-dir', str(tmp_path / 'cache'), '--log-dir', str(tmp_path / 'logs')]
+
+    code = main(
+        ['tests.headless_test:FLOW', '--context', '{"name": "bia"}', '--output', str(output)]
+        + common
+    )
+    assert code == 0
+    assert json.loads(output.read_text(encoding='utf-8'))['greeting'] == 'Hello BIA'
+    assert '[100%] Pipeline completed successfully' in capsys.readouterr().out
+
+    code = main(
+        ['tests.headless_test:FAILING_FLOW', '--context', '{"name": "x"}', '--quiet'] + common
+    )
+    assert code == 1
+    assert 'Something went wrong' in capsys.readouterr().err
+
+
+def test_headless_import_does_not_load_qt():
+    code = (
+        'import sys, botflow.headless; '
+        "sys.exit(any(m.startswith('PySide6') for m in sys.modules))"
+    )
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
@@ -0,0 +1,78 @@
+import logging
+import threading
+
+import pytest
+
+from botflow.logbuffer import LogRingBuffer
+
+
+@pytest.fixture
+def logger():
+    log = logging.getLogger('botflow-logbuffer-tests')
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    yield log
+    log.handlers.clear()
+
+
+def test_keeps_only_the_latest_lines(logger):
+    buffer = LogRingBuffer(capacity=3)
+    logger.addHandler(buffer)
+
+    for i in range(5):
+        logger.info('line %d', i)
+
+    assert buffer.total == 5
+    assert [line.split()[-1] for line in buffer.lines()] == ['2', '3', '4']
+
+
+def test_read_since_returns_only_new_lines(logger):
+    buffer = LogRingBuffer(capacity=10)
+    logger.addHandler(buffer)
+
+    logger.info('first')
+    lines, seen = buffer.read_since(0)
+    assert [line.split()[-1] for line in lines] == ['first']
+
+    assert buffer.read_since(seen) == ([], seen)
+
+    logger.warning('second')
+    lines, seen = buffer.read_since(seen)
+    assert lines == [line for line in buffer.lines() if 'second' in line]
+    assert 'WARNING' in lines[0]
+    assert seen == 2
+
+
+def test_read_since_is_capped_after_overflow(logger):
+    buffer = LogRingBuffer(capacity=4)
+    logger.addHandler(buffer)
+
+    for i in range(100):
+        logger.info('line %d', i)
+    lines, seen = buffer.read_since(0)
+
+    assert seen == 100
+    assert [line.split()[-1] for line in lines] == ['96', '97', '98', '99']
+
+
+def test_concurrent_writers_are_counted(logger):
+    buffer = LogRingBuffer(capacity=50)
+    logger.addHandler(buffer)
+
+    def write():
+        for i in range(1000):
+            logger.info('line %d', i)
+
+    threads = [threading.Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert buffer.total == 4000
+    assert len(buffer.lines()) == 50
+
+
+def test_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        LogRingBuffer(capacity=0)
@@ -0,0 +1,74 @@
+import threading
+from logging.handlers import QueueHandler, TimedRotatingFileHandler
+
+from botflow.logger import configure_logger, stop_logger
+
+
+def _read_log(log_dir) -> str:
+    return ''.join(path.read_text(encoding='utf-8') for path in log_dir.glob('*.log'))
+
+
+def _close(logger) -> None:
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+
+def test_direct_mode_writes_on_calling_thread(tmp_path):
+    logger = configure_logger('botflow-direct', tmp_path, console=False)
+
+    logger.info('hello')
+
+    assert not any(isinstance(h, QueueHandler) for h in logger.handlers)
+    assert 'hello' in _read_log(tmp_path)
+    _close(logger)
+
+
+def test_queued_mode_writes_on_listener_thread(tmp_path, monkeypatch):
+    writers = set()
+    emit = TimedRotatingFileHandler.emit
+
+    def recording_emit(self, record):
+        writers.add(threading.current_thread())
+        emit(self, record)
+
+    monkeypatch.setattr(TimedRotatingFileHandler, 'emit', recording_emit)
+    logger = configure_logger('botflow-queued', tmp_path, console=False, queued=True)
+
+    assert [type(h) for h in logger.handlers] == [QueueHandler]
+    logger.info('queued record')
+    stop_logger(logger)
+
+    assert 'queued record' in _read_log(tmp_path)
+    assert writers and threading.current_thread() not in writers
+    _close(logger)
+
+
+def test_stop_flushes_every_pending_record(tmp_path):
+    logger = configure_logger('botflow-flush', tmp_path, console=False, queued=True)
+
+    def log_many(n):
+        for i in range(500):
+            logger.info('thread %d record %d', n, i)
+
+    threads = [threading.Thread(target=log_many, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stop_logger(logger)
+
+    assert _read_log(tmp_path).count(' record ') == 2000
+    _close(logger)
+
+
+def test_logging_after_stop_writes_directly(tmp_path):
+    logger = configure_logger('botflow-after-stop', tmp_path, console=False, queued=True)
+    stop_logger(logger)
+
+    logger.warning('after stop')
+
+    assert not any(isinstance(h, QueueHandler) for h in logger.handlers)
+    assert 'after stop' in _read_log(tmp_path)
+    stop_logger(logger)
+    _close(logger)
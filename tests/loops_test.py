@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from botflow.loops import AsyncLoopPool, AsyncLoopThreadWorker
+from botflow.registry import ResourceSpec
+
+
+async def thread_name():
+    return threading.current_thread().name
+
+
+@pytest.fixture
+def pool():
+    pool = AsyncLoopPool(3)
+    pool.start()
+    yield pool
+    pool.stop()
+
+
+def test_round_robin_spreads_work_over_all_loops(pool):
+    names = [pool.run(thread_name()) for _ in range(6)]
+
+    assert names == ['botflow-loop-0', 'botflow-loop-1', 'botflow-loop-2'] * 2
+
+
+def test_keys_pin_work_to_one_loop(pool):
+    names = {pool.run(thread_name(), key='tenant-a') for _ in range(5)}
+
+    assert len(names) == 1
+    assert pool.shard('tenant-a') is pool.shard('tenant-a')
+
+
+def test_least_busy_placement_and_queue_depth_stats():
+    pool = AsyncLoopPool(2, placement='least_busy')
+    pool.start()
+    release = threading.Event()
+    try:
+        blocked = pool.submit(asyncio.to_thread(release.wait, 2))
+        assert [s.in_flight for s in pool.stats()] == [1, 0]
+        assert pool.run(thread_name()) == 'botflow-loop-1'
+        release.set()
+        blocked.result(timeout=2)
+        deadline = time.monotonic() + 1
+        while pool.stats()[0].in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        stats = pool.stats()
+        assert [s.in_flight for s in stats] == [0, 0]
+        assert [s.completed for s in stats] == [1, 1]
+        assert [s.thread_name for s in stats] == ['botflow-loop-0', 'botflow-loop-1']
+    finally:
+        release.set()
+        pool.stop()
+
+
+def test_resources_are_created_once_per_loop(pool):
+    created = []
+
+    async def setup():
+        created.append(threading.current_thread().name)
+        return asyncio.get_running_loop()
+
+    pool.register_resource(ResourceSpec('loop', setup))
+    for shard in pool.shards:
+        assert shard.run(shard.resources.get('loop')) is shard.loop
+        assert shard.run(shard.resources.get('loop')) is shard.loop
+
+    assert sorted(created) == ['botflow-loop-0', 'botflow-loop-1', 'botflow-loop-2']
+
+
+def test_single_loop_worker_is_its_own_shard():
+    worker = AsyncLoopThreadWorker()
+    worker.start()
+    try:
+        assert worker.shard('any') is worker
+        assert worker.run(thread_name(), key='any') == 'botflow-loop'
+        assert worker.stats()[0].completed == 1
+    finally:
+        worker.stop()
+
+
+def test_unknown_placement_is_rejected():
+    with pytest.raises(ValueError):
+        AsyncLoopPool(2, placement='random')
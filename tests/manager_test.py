@@ -0,0 +1,328 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from botflow.manager import FlowManager  # noqa: E402
+from botflow.types import FlowSpec  # noqa: E402
+from botflow.widgets import TextStepSpec, TextWidget  # noqa: E402
+
+built: list[str] = []
+
+
+class CountingTextWidget(TextWidget):
+    def __init__(self, spec, **extra_kwargs):
+        built.append(spec.key)
+        super().__init__(spec, **extra_kwargs)
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def make_manager(app):
+    managers = []
+    logger = logging.getLogger('botflow-manager-tests')
+
+    def make(
+        steps: int = 10,
+        validator=None,
+        live: bool = False,
+        prefetch=None,
+        on_finish=(),
+        **kwargs,
+    ) -> FlowManager:
+        built.clear()
+        specs = [
+            TextStepSpec(
+                key=f'step{i}',
+                title=f'Step {i}',
+                widget_cls=CountingTextWidget,
+                validator=validator,
+                live_validation=live,
+                live_validation_delay=0.02,
+                prefetch=prefetch if i == 0 else None,
+            )
+            for i in range(steps)
+        ]
+        flow = FlowSpec(name='tests', steps=specs, on_finish=list(on_finish))
+        manager = FlowManager(flow, logger=logger, **kwargs)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.shutdown()
+
+
+def _wait_for(app, predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    assert predicate()
+
+
+def _enter(manager: FlowManager, text: str) -> None:
+    manager.stack.currentWidget().input.setText(text)
+    manager.foward()
+
+
+def test_pages_are_built_on_first_visit(make_manager):
+    manager = make_manager(steps=40)
+
+    assert built == ['step0']
+    assert manager.stack.count() == 40
+
+    _enter(manager, 'a')
+    manager.back()
+    _enter(manager, 'a')
+
+    assert built == ['step0', 'step1']
+
+
+def test_live_pages_are_bounded(make_manager):
+    manager = make_manager(max_live_pages=2)
+
+    for i in range(5):
+        _enter(manager, f'value{i}')
+
+    assert manager.current_index() == 5
+    assert sorted(manager._live_pages) == [4, 5]
+    assert not isinstance(manager.stack.widget(0), TextWidget)
+
+
+def test_evicted_values_are_kept_and_restored(make_manager):
+    manager = make_manager(max_live_pages=2)
+
+    for i in range(4):
+        _enter(manager, f'value{i}')
+    manager.stack.currentWidget().input.setText('draft')
+    manager.back()
+    manager.back()
+    manager.back()
+
+    assert manager.context['step4'] == 'draft'
+    assert manager.stack.currentWidget().value() == 'value1'
+
+    for _ in range(3):
+        manager.foward()
+    assert manager.stack.currentWidget().value() == 'draft'
+
+
+def test_rejects_invalid_page_limit(app):
+    with pytest.raises(ValueError):
+        FlowManager(FlowSpec(name='tests', steps=[]), max_live_pages=0)
+
+
+class PlainWidget(TextWidget):
+    def can_reset(self):
+        return False
+
+
+def test_restart_reuses_pages_in_place(make_manager):
+    manager = make_manager(steps=3)
+    for i in range(2):
+        _enter(manager, f'value{i}')
+    pages = [manager.stack.widget(i) for i in range(3)]
+
+    manager.restart_to_beginning()
+
+    assert manager.context == {}
+    assert manager.current_index() == 0
+    assert [manager.stack.widget(i) for i in range(3)] == pages
+    assert all(page.value() == '' for page in pages)
+    assert built == ['step0', 'step1', 'step2']
+
+
+def test_restart_rebuilds_pages_without_reset(make_manager):
+    manager = make_manager(steps=2)
+    spec = TextStepSpec(key='plain', title='Plain', widget_cls=PlainWidget)
+    manager.steps.append(spec)
+    manager.stack.addWidget(PlainWidget(spec))
+    manager._live_pages.append(2)
+    plain = manager.stack.widget(2)
+
+    manager.restart_to_beginning()
+
+    assert manager.stack.widget(2) is not plain
+    assert 2 not in manager._live_pages
+
+
+def test_async_validation_keeps_window_responsive(make_manager, app):
+    release = threading.Event()
+    calls = []
+
+    async def check(value):
+        calls.append(value)
+        await asyncio.to_thread(release.wait, 2)
+        return value == 'ok', 'Value must be ok'
+
+    manager = make_manager(steps=3, validator=check)
+    warnings = []
+    manager.show_warn = warnings.append
+
+    _enter(manager, 'ok')
+
+    assert manager.current_index() == 0
+    assert not manager.next_btn.isEnabled()
+    assert not manager.back_btn.isEnabled()
+    assert manager.next_btn.text() == manager.i18n.t('common.validating')
+
+    manager.foward()
+    release.set()
+    _wait_for(app, lambda: manager.current_index() == 1)
+
+    assert manager.next_btn.isEnabled()
+    assert manager.context['step0'] == 'ok'
+    assert calls == ['ok']
+
+    manager.back()
+    manager.foward()
+    assert manager.current_index() == 1
+    assert calls == ['ok']
+
+    _enter(manager, 'bad')
+    _wait_for(app, lambda: bool(warnings))
+    assert warnings == ['Value must be ok']
+    assert manager.current_index() == 1
+
+
+def test_validate_step_hook_can_supply_the_future(make_manager, app):
+    manager = make_manager(steps=3)
+    pending = []
+
+    def validate_step(spec, value):
+        pending.append(Future())
+        return pending[-1]
+
+    manager.validate_step = validate_step
+    warnings = []
+    manager.show_warn = warnings.append
+
+    _enter(manager, 'a')
+    assert manager.next_btn.text() == manager.i18n.t('common.validating')
+
+    pending[0].set_result((False, 'Not yet'))
+    _wait_for(app, lambda: bool(warnings))
+    assert warnings == ['Not yet']
+
+    _enter(manager, 'a')
+    pending[1].set_result((True, ''))
+    _wait_for(app, lambda: manager.current_index() == 1)
+
+
+def test_validate_step_overrides_may_return_a_tuple(make_manager):
+    manager = make_manager(steps=3)
+    manager.validate_step = lambda spec, value: (value == 'ok', 'Value must be ok')
+    warnings = []
+    manager.show_warn = warnings.append
+
+    _enter(manager, 'bad')
+    assert warnings == ['Value must be ok']
+    assert manager.current_index() == 0
+
+    _enter(manager, 'ok')
+    assert manager.current_index() == 1
+
+
+def test_live_validation_is_debounced_and_shown_inline(make_manager, app):
+    calls = []
+
+    async def check(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value == 'ok', 'Value must be ok'
+
+    manager = make_manager(steps=3, validator=check, live=True)
+    manager.show_warn = lambda msg: None
+    page = manager.stack.currentWidget()
+
+    QTest.keyClicks(page.input, 'bad')
+    _wait_for(app, lambda: page.validation_lbl.text() == 'Value must be ok')
+    assert calls == ['bad']
+    assert page.validation_lbl.property('state') == 'error'
+
+    page.input.clear()
+    QTest.keyClicks(page.input, 'ok')
+    _wait_for(app, lambda: calls == ['bad', 'ok'])
+    _wait_for(app, lambda: page.validation_lbl.isHidden())
+
+    manager.foward()
+    assert manager.current_index() == 1
+    assert calls == ['bad', 'ok']
+
+
+def test_editing_cancels_stale_live_checks(make_manager, app):
+    started = []
+    cancelled = []
+
+    async def check(value):
+        started.append(value)
+        try:
+            await asyncio.sleep(0.5 if value == 'slow' else 0)
+        except asyncio.CancelledError:
+            cancelled.append(value)
+            raise
+        return True, ''
+
+    manager = make_manager(steps=2, validator=check, live=True)
+    page = manager.stack.currentWidget()
+
+    QTest.keyClicks(page.input, 'slow')
+    _wait_for(app, lambda: started == ['slow'])
+    QTest.keyClicks(page.input, 'er')
+    _wait_for(app, lambda: cancelled == ['slow'])
+    _wait_for(app, lambda: started == ['slow', 'slower'])
+
+    assert manager.validation.cached(manager.steps[0], 'slow') is None
+    assert manager.validation.cached(manager.steps[0], 'slower') == (True, '')
+
+
+def test_prefetch_result_reaches_finish_steps(make_manager, app):
+    started = []
+    cancelled = []
+    seen = []
+
+    async def login(value):
+        started.append(value)
+        try:
+            await asyncio.sleep(0.5 if value == 'old' else 0)
+        except asyncio.CancelledError:
+            cancelled.append(value)
+            raise
+        return f'session-{value}'
+
+    def use_session(ctx):
+        seen.append(ctx.prefetched.result('step0'))
+
+    manager = make_manager(steps=2, prefetch=login, on_finish=[use_session])
+    manager.confirm_run = lambda text=None: True
+    manager.show_success = lambda msg: None
+
+    _enter(manager, 'old')
+    _wait_for(app, lambda: started == ['old'])
+
+    manager.back()
+    page = manager.stack.currentWidget()
+    page.input.clear()
+    QTest.keyClicks(page.input, 'new')
+    _wait_for(app, lambda: cancelled == ['old'])
+
+    manager.foward()
+    _enter(manager, 'done')
+    _wait_for(app, lambda: bool(seen))
+
+    assert started == ['old', 'new']
+    assert seen == ['session-new']
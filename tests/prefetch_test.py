@@ -0,0 +1,140 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError, Future
+
+import pytest
+
+from botflow.cancellation import CancelToken
+from botflow.exceptions import PipelineCancelledError
+from botflow.loops import AsyncLoopThreadWorker
+from botflow.prefetch import Prefetched, Prefetcher
+from botflow.widgets import TextStepSpec
+
+
+@pytest.fixture
+def async_loop():
+    loop = AsyncLoopThreadWorker()
+    loop.start()
+    yield loop
+    loop.stop()
+
+
+def _spec(prefetch) -> TextStepSpec:
+    return TextStepSpec(key='login', title='Login', prefetch=prefetch)
+
+
+def test_start_runs_prefetch_on_loop(async_loop):
+    threads = []
+
+    async def login(value):
+        threads.append(threading.current_thread().name)
+        return f'session-{value}'
+
+    prefetcher = Prefetcher(async_loop)
+    future = prefetcher.start(_spec(login), 'alice')
+
+    assert future.result(timeout=2) == 'session-alice'
+    assert threads == ['botflow-loop']
+    assert prefetcher.snapshot() == {'login': future}
+
+
+def test_steps_without_prefetch_are_ignored(async_loop):
+    prefetcher = Prefetcher(async_loop)
+
+    assert prefetcher.start(TextStepSpec(key='name', title='Name'), 'x') is None
+    assert prefetcher.snapshot() == {}
+
+
+def test_same_value_reuses_the_running_prefetch(async_loop):
+    calls = []
+
+    async def login(value):
+        calls.append(value)
+        return value
+
+    prefetcher = Prefetcher(async_loop)
+    spec = _spec(login)
+    first = prefetcher.start(spec, {'user': 'a'})
+    second = prefetcher.start(spec, {'user': 'a'})
+
+    assert first is second
+    assert first.result(timeout=2) == {'user': 'a'}
+    assert calls == [{'user': 'a'}]
+
+
+def test_new_value_cancels_the_stale_prefetch(async_loop):
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    async def login(value):
+        if value == 'old':
+            started.set()
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return value
+
+    prefetcher = Prefetcher(async_loop)
+    spec = _spec(login)
+    old = prefetcher.start(spec, 'old')
+    assert started.wait(2)
+
+    new = prefetcher.start(spec, 'new')
+
+    assert cancelled.wait(2)
+    assert old.cancelled()
+    assert new.result(timeout=2) == 'new'
+    assert prefetcher.snapshot() == {'login': new}
+
+
+def test_release_keeps_futures_running(async_loop):
+    release = threading.Event()
+
+    async def login(value):
+        await asyncio.to_thread(release.wait, 2)
+        return value
+
+    prefetcher = Prefetcher(async_loop)
+    future = prefetcher.start(_spec(login), 'a')
+    prefetcher.release()
+    release.set()
+
+    assert prefetcher.snapshot() == {}
+    assert future.result(timeout=2) == 'a'
+
+
+def test_prefetched_result_and_get(async_loop):
+    future: Future = Future()
+    future.set_result('session')
+    prefetched = Prefetched({'login': future})
+
+    async def read():
+        return await prefetched.get('login')
+
+    assert 'login' in prefetched
+    assert 'other' not in prefetched
+    assert prefetched.result('login') == 'session'
+    assert async_loop.run(read()) == 'session'
+
+
+def test_prefetched_result_honours_cancel_token():
+    token = CancelToken()
+    prefetched = Prefetched({'login': Future()}, token)
+    token.cancel()
+
+    with pytest.raises(PipelineCancelledError):
+        prefetched.result('login', timeout=2)
+
+
+def test_cancel_all_cancels_running_prefetches(async_loop):
+    async def login(value):
+        await asyncio.sleep(5)
+
+    prefetcher = Prefetcher(async_loop)
+    future = prefetcher.start(_spec(login), 'a')
+    prefetcher.cancel_all()
+
+    with pytest.raises(CancelledError):
+        future.result(timeout=2)
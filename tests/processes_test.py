@@ -0,0 +1,211 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from botflow.exceptions import PipelineCancelledError
+from botflow.processes import ProcessStepExecutor, picklable_view
+from botflow.types import BotPipelineInfo, FinishContext
+
+
+def cpu_step(context):
+    context.pipeline_info.status(f'working in {os.getpid()}')
+    context.pipeline_info.progress(42)
+    context.logger.info('child log line')
+    context.data['total'] = sum(context.data['numbers'])
+    context.data['pid'] = os.getpid()
+    del context.data['drop_me']
+
+
+def failing_step(_):
+    raise ValueError('child boom')
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def pool():
+    executor = ProcessStepExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+def _context(data, status, progress, logger):
+    return FinishContext(
+        data=data,
+        logger=logger,
+        pipeline_info=BotPipelineInfo(
+            status=status.append,
+            progress=progress.append,
+            percentage=0,
+            step_of='Step 1 of 1:',
+            step_name='cpu_step',
+            step_number=1,
+            total_steps=1,
+        ),
+    )
+
+
+def test_picklable_view_skips_values_that_cannot_be_pickled():
+    data = {'ok': [1, 2], 'lock': threading.Lock()}
+
+    assert picklable_view(data) == {'ok': [1, 2]}
+
+
+def test_run_merges_child_results_and_forwards_updates(pool):
+    logger = logging.getLogger('botflow-process-tests')
+    logger.setLevel(logging.INFO)
+    handler = _ListHandler()
+    logger.addHandler(handler)
+
+    lock = threading.Lock()
+    data = {'numbers': [1, 2, 3], 'drop_me': True, 'lock': lock}
+    status, progress = [], []
+
+    try:
+        pool.run(cpu_step, _context(data, status, progress, logger))
+    finally:
+        logger.removeHandler(handler)
+
+    assert data['total'] == 6
+    assert data['pid'] != os.getpid()
+    assert 'drop_me' not in data
+    assert data['lock'] is lock
+    assert status == [f"working in {data['pid']}"]
+    assert progress == [42]
+    assert 'child log line' in handler.messages
+
+
+def test_run_reraises_child_exceptions(pool):
+    logger = logging.getLogger('botflow-process-tests')
+
+    with pytest.raises(ValueError, match='child boom'):
+        pool.run(failing_step, _context({}, [], [], logger))
+
+
+def sleepy_step(context):
+    context.pipeline_info.status(str(os.getpid()))
+    time.sleep(30)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _cancel_once_started(status, context):
+    deadline = time.monotonic() + 10
+    while not status and time.monotonic() < deadline:
+        time.sleep(0.05)
+    context.cancel_token.cancel()
+
+
+def test_cancel_terminates_the_child_and_frees_its_slot(pool):
+    logger = logging.getLogger('botflow-process-tests')
+    status = []
+    context = _context({}, status, [], logger)
+    threading.Thread(target=lambda: _cancel_once_started(status, context)).start()
+
+    with pytest.raises(PipelineCancelledError):
+        pool.run(sleepy_step, context)
+
+    deadline = time.monotonic() + 5
+    while _pid_alive(int(status[0])) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _pid_alive(int(status[0]))
+
+    data = {'numbers': [1], 'drop_me': True}
+    pool.run(cpu_step, _context(data, [], [], logger))
+    assert data['total'] == 1
+
+
+def test_shutdown_without_wait_does_not_block_on_running_children():
+    executor = ProcessStepExecutor(max_workers=1)
+    logger = logging.getLogger('botflow-process-tests')
+    status, errors = [], []
+
+    def run():
+        try:
+            executor.run(sleepy_step, _context({}, status, [], logger))
+        except BrokenProcessPool as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not status and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    started = time.monotonic()
+    executor.shutdown(wait=False)
+    thread.join(5)
+
+    assert time.monotonic() - started < 5
+    assert len(errors) == 1
+
+
+def slow_sum_step(context):
+    context.pipeline_info.status('started')
+    time.sleep(1)
+    context.data['total'] = sum(context.data['numbers'])
+
+
+def test_cancelling_one_call_leaves_concurrent_calls_running():
+    executor = ProcessStepExecutor(max_workers=2)
+    logger = logging.getLogger('botflow-process-tests')
+    other_status, errors = [], []
+    data = {'numbers': [1, 2]}
+
+    def run_other():
+        try:
+            executor.run(slow_sum_step, _context(data, other_status, [], logger))
+        except Exception as exc:
+            errors.append(exc)
+
+    try:
+        other = threading.Thread(target=run_other)
+        other.start()
+
+        status = []
+        context = _context({}, status, [], logger)
+        threading.Thread(target=lambda: _cancel_once_started(status, context)).start()
+        with pytest.raises(PipelineCancelledError):
+            executor.run(sleepy_step, context)
+        other.join(10)
+
+        assert errors == []
+        assert data['total'] == 3
+    finally:
+        executor.shutdown()
+
+
+def test_waiting_for_a_free_slot_can_be_cancelled(pool):
+    logger = logging.getLogger('botflow-process-tests')
+    status = []
+    busy = _context({}, status, [], logger)
+    runner = threading.Thread(
+        target=lambda: pytest.raises(PipelineCancelledError, pool.run, sleepy_step, busy)
+    )
+    runner.start()
+
+    waiting = _context({'numbers': [1], 'drop_me': True}, [], [], logger)
+    threading.Thread(target=lambda: _cancel_once_started(status, waiting)).start()
+    with pytest.raises(PipelineCancelledError):
+        pool.run(cpu_step, waiting)
+
+    busy.cancel_token.cancel()
+    runner.join(5)
+    assert not runner.is_alive()
@@ -1,8 +1,9 @@
+import os
 from pathlib import Path
 
 import pytest
 
-from botflow.qss import qss_to_string
+from botflow.qss import QssRegistry, qss_to_string
 
 
 def test_qss_to_string_reads_one_file_and_adds_trailing_newline(tmp_path: Path):
@@ -47,3 +48,52 @@ def test_qss_to_string_accepts_str_paths(tmp_path: Path):
     out = qss_to_string(str(p))
 
     assert out == 'X\n'
+
+
+def test_registry_reads_each_file_once(tmp_path: Path, monkeypatch):
+    p = tmp_path / 'a.qss'
+    p.write_text('A', encoding='utf-8')
+    registry = QssRegistry()
+    reads = []
+    read_text = Path.read_text
+
+    def counting_read(self, *args, **kwargs):
+        reads.append(self)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, 'read_text', counting_read)
+
+    assert registry.read(p) == 'A'
+    assert registry.read(str(p)) == 'A'
+    assert registry.read(tmp_path / '.' / 'a.qss') == 'A'
+    assert len(reads) == 1
+
+
+def test_registry_rereads_changed_files(tmp_path: Path):
+    p = tmp_path / 'a.qss'
+    p.write_text('A', encoding='utf-8')
+    registry = QssRegistry()
+    registry.read(p)
+
+    p.write_text('B', encoding='utf-8')
+    stat = p.stat()
+    os.utime(p, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert registry.read(p) == 'B'
+
+
+def test_registry_validates_paths(tmp_path: Path):
+    registry = QssRegistry()
+    (tmp_path / 'a.txt').write_text('x', encoding='utf-8')
+
+    with pytest.raises(ValueError, match=r'\.qss'):
+        registry.read(tmp_path / 'a.txt')
+    with pytest.raises(FileNotFoundError, match='does not exist'):
+        registry.read(tmp_path / 'missing.qss')
+
+
+def test_registry_merges_botflow_styles_in_order():
+    sheet = QssRegistry().stylesheet()
+
+    assert sheet.index('#nav_divider') < sheet.index('loading_progress')
+    assert sheet.index('loading_progress') < sheet.index('text_input')
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from botflow.registry import ResourceRegistry
+from botflow.workers import AsyncLoopThreadWorker
+
+
+def test_get_sets_up_resource_once_and_reuses_it():
+    registry = ResourceRegistry()
+    calls = []
+
+    async def setup():
+        calls.append('setup')
+        await asyncio.sleep(0)
+        return object()
+
+    registry.register('client', setup)
+
+    async def main():
+        return await asyncio.gather(*(registry.get('client') for _ in range(5)))
+
+    values = asyncio.run(main())
+
+    assert calls == ['setup']
+    assert all(v is values[0] for v in values)
+    assert registry.is_open('client')
+
+
+def test_get_raises_for_unknown_resource():
+    registry = ResourceRegistry()
+
+    with pytest.raises(KeyError, match='not registered'):
+        asyncio.run(registry.get('missing'))
+
+
+def test_aclose_tears_down_in_reverse_order():
+    registry = ResourceRegistry()
+    closed = []
+
+    async def setup():
+        return 'value'
+
+    async def teardown_a(value):
+        closed.append('a')
+
+    async def teardown_b(value):
+        closed.append('b')
+
+    registry.register('a', setup, teardown_a)
+    registry.register('b', setup, teardown_b)
+
+    async def main():
+        await registry.get('a')
+        await registry.get('b')
+        await registry.aclose()
+
+    asyncio.run(main())
+
+    assert closed == ['b', 'a']
+    assert not registry.is_open('a')
+
+
+def test_get_threadsafe_requires_a_running_loop():
+    with pytest.raises(RuntimeError, match='not attached'):
+        ResourceRegistry().get_threadsafe('x')
+
+
+def test_loop_resources_reuse_connection_and_close_on_stop():
+    loop = AsyncLoopThreadWorker()
+    loop.start()
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        while line := await reader.readline():
+            writer.write(line.upper())
+            await writer.drain()
+        writer.close()
+
+    async def start_server():
+        return await asyncio.start_server(handle, '127.0.0.1', 0)
+
+    async def stop_server(server):
+        server.close()
+        await server.wait_closed()
+
+    async def connect():
+        server = await loop.resources.get('server')
+        port = server.sockets[0].getsockname()[1]
+        return await asyncio.open_connection('127.0.0.1', port)
+
+    async def disconnect(conn):
+        _, writer = conn
+        writer.close()
+        await writer.wait_closed()
+
+    loop.resources.register('server', start_server, stop_server)
+    loop.resources.register('echo', connect, disconnect)
+
+    async def ask(text):
+        reader, writer = await loop.resources.get('echo')
+        writer.write(f'{text}\n'.encode())
+        await writer.drain()
+        return (await reader.readline()).decode().strip()
+
+    assert loop.run(ask('one')) == 'ONE'
+    _, writer = loop.resources.get_threadsafe('echo')
+    assert loop.run(ask('two')) == 'TWO'
+    assert len(connections) == 1
+
+    loop.stop()
+
+    assert writer.is_closing()
+    assert not loop.resources.is_open('echo')
+    assert not loop.resources.is_open('server')
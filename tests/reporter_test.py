@@ -0,0 +1,90 @@
+import time
+
+from botflow.reporter import ProgressReporter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _reporter(max_rate=None, clock=None):
+    statuses, progresses = [], []
+    reporter = ProgressReporter(
+        statuses.append, progresses.append, max_rate=max_rate, clock=clock or time.monotonic
+    )
+    return reporter, statuses, progresses
+
+
+def test_without_rate_every_update_is_forwarded():
+    reporter, statuses, progresses = _reporter()
+
+    for i in range(5):
+        reporter.progress(i)
+    reporter.status('a')
+    reporter.status('b')
+
+    assert progresses == [0, 1, 2, 3, 4]
+    assert statuses == ['a', 'b']
+
+
+def test_updates_within_interval_are_coalesced_and_flush_delivers_last_value():
+    clock = FakeClock()
+    reporter, statuses, progresses = _reporter(max_rate=10, clock=clock)
+
+    reporter.progress(1)
+    for i in range(2, 1000):
+        reporter.progress(i)
+        reporter.status(f'row {i}')
+    reporter.flush()
+
+    assert progresses == [1, 999]
+    assert statuses == ['row 999']
+
+
+def test_updates_after_interval_are_emitted_immediately():
+    clock = FakeClock()
+    reporter, _, progresses = _reporter(max_rate=10, clock=clock)
+
+    reporter.progress(1)
+    clock.now = 0.2
+    reporter.progress(2)
+
+    assert progresses == [1, 2]
+
+
+def test_repeated_progress_values_are_dropped():
+    clock = FakeClock()
+    reporter, _, progresses = _reporter(max_rate=10, clock=clock)
+
+    reporter.progress(5)
+    clock.now = 1
+    reporter.progress(5)
+    reporter.flush()
+
+    assert progresses == [5]
+
+
+def test_pending_update_is_delivered_by_timer_without_flush():
+    reporter, statuses, _ = _reporter(max_rate=50)
+
+    reporter.status('first')
+    reporter.status('last')
+    time.sleep(0.1)
+
+    assert statuses == ['first', 'last']
+
+
+def test_scoped_maps_sub_step_progress_into_step_share():
+    reporter, _, progresses = _reporter()
+    report = reporter.scoped(50, 75)
+
+    report(0)
+    report(50)
+    report(100)
+    report(150)
+
+    assert progresses == [50, 62, 75, 75]
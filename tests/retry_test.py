@@ -0,0 +1,41 @@
+import pytest
+
+from botflow.exceptions import PipelineCancelledError
+from botflow.retry import RetryPolicy, retry_step
+from botflow.types import FinishStep
+
+
+@retry_step(max_attempts=5, retry_on=ConnectionError)
+def flaky(context):
+    pass
+
+
+def test_retry_step_attaches_policy_picked_up_by_finish_step():
+    step = FinishStep(flaky)
+
+    assert step.retry == RetryPolicy(max_attempts=5, retry_on=(ConnectionError,))
+
+
+def test_should_retry_respects_attempts_types_and_cancellation():
+    policy = RetryPolicy(max_attempts=3, retry_on=(ConnectionError, TimeoutError))
+
+    assert policy.should_retry(ConnectionError(), 1)
+    assert policy.should_retry(TimeoutError(), 2)
+    assert not policy.should_retry(ConnectionError(), 3)
+    assert not policy.should_retry(ValueError(), 1)
+    assert not RetryPolicy().should_retry(PipelineCancelledError(), 1)
+
+
+def test_delay_grows_exponentially_up_to_the_cap_with_jitter():
+    policy = RetryPolicy(backoff=1, multiplier=2, max_backoff=5, jitter=0.5)
+
+    assert [policy.delay(n, rand=lambda: 0.5) for n in (1, 2, 3, 4)] == [1, 2, 4, 5]
+    assert policy.delay(2, rand=lambda: 0) == 1
+    assert policy.delay(2, rand=lambda: 1) == 3
+
+
+def test_policy_validates_arguments():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=2)
@@ -0,0 +1,61 @@
+import pytest
+
+from botflow.runqueue import RunJob
+
+
+def test_job_starts_queued():
+    job = RunJob(1, 'Job #1')
+
+    assert job.state == 'queued'
+    assert job.progress == 0
+    assert not job.done
+
+
+def test_report_marks_job_running_and_clamps_progress():
+    job = RunJob(1, 'Job #1')
+
+    job.report(progress=150, status='Downloading')
+
+    assert job.state == 'running'
+    assert job.progress == 100
+    assert job.status == 'Downloading'
+
+    job.report(status='Parsing')
+    assert job.progress == 100
+    assert job.status == 'Parsing'
+
+
+def test_finish_records_final_state():
+    job = RunJob(1, 'Job #1')
+    job.report(progress=40)
+
+    job.finish('failed', 'boom')
+
+    assert job.done
+    assert job.state == 'failed'
+    assert job.error == 'boom'
+    assert job.progress == 40
+
+
+def test_finish_success_completes_progress():
+    job = RunJob(1, 'Job #1')
+
+    job.finish('succeeded')
+
+    assert job.progress == 100
+
+
+def test_reports_after_finish_are_ignored():
+    job = RunJob(1, 'Job #1')
+    job.finish('cancelled')
+
+    job.report(progress=50, status='late')
+
+    assert job.state == 'cancelled'
+    assert job.progress == 0
+    assert job.status == ''
+
+
+def test_finish_rejects_non_final_state():
+    with pytest.raises(ValueError):
+        RunJob(1, 'Job #1').finish('running')
@@ -0,0 +1,65 @@
+import pytest
+
+from botflow.scheduler import StepGraph, has_dependencies
+from botflow.types import FinishStep
+
+
+def a(_):
+    pass
+
+
+def b(_):
+    pass
+
+
+def c(_):
+    pass
+
+
+def test_has_dependencies_is_false_for_plain_functions():
+    assert has_dependencies([a, b, c]) is False
+
+
+def test_has_dependencies_is_true_when_any_step_declares_them():
+    assert has_dependencies([a, FinishStep(b, depends_on=())]) is True
+
+
+def test_finish_step_defaults_name_to_function_name():
+    assert FinishStep(a).name == 'a'
+    assert FinishStep(a, name='custom').name == 'custom'
+
+
+def test_steps_without_depends_on_follow_previous_step():
+    graph = StepGraph([a, b, FinishStep(c, depends_on=())])
+
+    assert graph.dependencies == {'a': (), 'b': ('a',), 'c': ()}
+
+
+def test_ready_returns_steps_whose_dependencies_are_done():
+    graph = StepGraph(
+        [
+            FinishStep(a, depends_on=()),
+            FinishStep(b, depends_on=()),
+            FinishStep(c, depends_on=['a', 'b']),
+        ]
+    )
+
+    pending = {'a', 'b', 'c'}
+    assert [s.name for s in graph.ready(set(), pending)] == ['a', 'b']
+    assert [s.name for s in graph.ready({'a'}, {'b', 'c'})] == ['b']
+    assert [s.name for s in graph.ready({'a', 'b'}, {'c'})] == ['c']
+
+
+def test_rejects_duplicate_step_names():
+    with pytest.raises(ValueError, match='Duplicate'):
+        StepGraph([FinishStep(a, depends_on=()), FinishStep(b, name='a')])
+
+
+def test_rejects_unknown_dependencies():
+    with pytest.raises(ValueError, match='unknown steps: missing'):
+        StepGraph([FinishStep(a, depends_on=('missing',))])
+
+
+def test_rejects_cycles():
+    with pytest.raises(ValueError, match='Cycle'):
+        StepGraph([FinishStep(a, depends_on=('b',)), FinishStep(b, depends_on=('a',))])
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from botflow.cache import CachePolicy
+from botflow.retry import RetryPolicy
+from botflow.scheduler import StepGraph
+from botflow.specs import FinishStep
+from botflow.streams import END_OF_STREAM, iter_queue, stream_units
+
+
+async def pages(_):
+    yield 1
+
+
+async def parse(context):
+    async for item in context.stream:
+        yield item
+
+
+async def upload(context):
+    async for _ in context.stream:
+        pass
+
+
+def report(_):
+    pass
+
+
+def _names(units):
+    return [[step.name for step in unit] for unit in units]
+
+
+def test_stream_units_groups_generators_with_their_consumer():
+    steps = [FinishStep(fn) for fn in (report, pages, parse, upload, report)]
+
+    assert _names(stream_units(steps)) == [
+        ['report'],
+        ['pages', 'parse', 'upload'],
+        ['report'],
+    ]
+
+
+def test_stream_units_keeps_trailing_generator_as_its_own_stream():
+    steps = [FinishStep(report), FinishStep(pages)]
+
+    assert _names(stream_units(steps)) == [['report'], ['pages']]
+
+
+def test_stream_units_rejects_sync_consumers_and_process_stages():
+    with pytest.raises(ValueError, match="'report' consumes a stream"):
+        stream_units([FinishStep(pages), FinishStep(report)])
+
+    with pytest.raises(ValueError, match='cannot run in a process'):
+        stream_units([FinishStep(pages, executor='process'), FinishStep(upload)])
+
+
+def test_stream_units_rejects_retried_and_cached_stages():
+    with pytest.raises(ValueError, match="'pages' is a stream stage and cannot be retried"):
+        stream_units([FinishStep(pages, retry=RetryPolicy()), FinishStep(upload)])
+
+    with pytest.raises(ValueError, match="'upload' is a stream stage and cannot be cached"):
+        stream_units([FinishStep(pages), FinishStep(upload, cache=CachePolicy(('a',), ('b',)))])
+
+    assert _names(stream_units([FinishStep(report, retry=RetryPolicy())])) == [['report']]
+
+
+def test_step_graph_rejects_stream_stages():
+    with pytest.raises(ValueError, match='cannot be used with depends_on'):
+        StepGraph([FinishStep(pages, depends_on=())])
+
+
+def test_iter_queue_stops_at_end_of_stream():
+    async def main():
+        queue = asyncio.Queue()
+        for item in (1, 2, END_OF_STREAM, 3):
+            queue.put_nowait(item)
+        return [item async for item in iter_queue(queue)]
+
+    assert asyncio.run(main()) == [1, 2]
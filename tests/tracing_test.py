@@ -0,0 +1,103 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from botflow.tracing import PipelineTracer
+
+
+def test_step_records_wall_and_cpu_time():
+    tracer = PipelineTracer()
+    tracer.start()
+
+    with tracer.step('busy'):
+        sum(range(200_000))
+
+    [record] = tracer.records
+    assert record.name == 'busy'
+    assert record.status == 'ok'
+    assert record.executor == 'thread'
+    assert record.wall_time > 0
+    assert record.cpu_time is not None and record.cpu_time > 0
+    assert record.thread_id == threading.get_ident()
+    assert record.peak_memory is None
+
+
+def test_step_marks_errors_and_reraises():
+    tracer = PipelineTracer()
+    tracer.start()
+
+    with pytest.raises(RuntimeError):
+        with tracer.step('boom'):
+            raise RuntimeError('boom')
+
+    assert tracer.records[0].status == 'error'
+
+
+def test_measure_records_loop_thread_time():
+    tracer = PipelineTracer()
+    tracer.start()
+
+    async def work():
+        await asyncio.sleep(0)
+        return 42
+
+    results = {}
+
+    def run_loop():
+        results['thread'] = threading.get_ident()
+        with tracer.step('async') as span:
+            results['value'] = asyncio.run(tracer.measure(span, work()))
+
+    thread = threading.Thread(target=run_loop, name='loop-thread')
+    thread.start()
+    thread.join()
+
+    [record] = tracer.records
+    assert results['value'] == 42
+    assert record.executor == 'loop'
+    assert record.thread_name == 'loop-thread'
+    assert record.thread_id == results['thread']
+
+
+def test_trace_memory_reports_peak_allocation():
+    tracer = PipelineTracer(trace_memory=True)
+    tracer.start()
+    try:
+        with tracer.step('alloc'):
+            data = bytearray(2_000_000)
+            del data
+    finally:
+        tracer.stop()
+
+    assert tracer.records[0].peak_memory >= 2_000_000
+
+
+def test_write_exports_chrome_trace(tmp_path):
+    tracer = PipelineTracer(tmp_path)
+    tracer.start()
+    with tracer.step('first'):
+        pass
+    with tracer.step('second'):
+        pass
+
+    path = tracer.write('my flow')
+
+    assert path.parent == tmp_path
+    assert path.name.startswith('my_flow_')
+    trace = json.loads(path.read_text(encoding='utf-8'))
+    spans = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+    meta = [e for e in trace['traceEvents'] if e['ph'] == 'M']
+    assert [e['name'] for e in spans] == ['first', 'second']
+    assert spans[0]['ts'] <= spans[1]['ts']
+    assert meta[0]['args']['name'] == threading.current_thread().name
+
+
+def test_write_without_trace_dir_is_a_noop():
+    tracer = PipelineTracer()
+    tracer.start()
+    with tracer.step('only'):
+        pass
+
+    assert tracer.write() is None
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from botflow.loops import AsyncLoopThreadWorker
+from botflow.validation import StepValidation
+from botflow.widgets import TextStepSpec
+
+
+@pytest.fixture
+def validation():
+    loop = AsyncLoopThreadWorker()
+    loop.start()
+    validation = StepValidation(loop)
+    yield validation
+    validation.shutdown()
+    loop.stop()
+
+
+def test_steps_without_validator_pass(validation):
+    spec = TextStepSpec(key='name', title='Name')
+
+    assert validation.submit(spec, 'x').result() == (True, '')
+
+
+def test_sync_validator_runs_inline(validation):
+    threads = []
+
+    def check(value):
+        threads.append(threading.current_thread())
+        return value == 'ok', 'bad value'
+
+    spec = TextStepSpec(key='name', title='Name', validator=check)
+    future = validation.submit(spec, 'nope')
+
+    assert future.done()
+    assert future.result() == (False, 'bad value')
+    assert threads == [threading.current_thread()]
+
+
+def test_coroutine_validator_runs_on_loop(validation):
+    threads = []
+
+    async def check(value):
+        threads.append(threading.current_thread().name)
+        await asyncio.sleep(0.05)
+        return True, ''
+
+    spec = TextStepSpec(key='name', title='Name', validator=check)
+    future = validation.submit(spec, 'x')
+
+    assert not future.done()
+    assert future.result(timeout=2) == (True, '')
+    assert threads == ['botflow-loop']
+
+
+def test_thread_validator_runs_off_caller(validation):
+    threads = []
+
+    def check(value):
+        threads.append(threading.current_thread())
+        time.sleep(0.05)
+        return True, ''
+
+    spec = TextStepSpec(key='name', title='Name', validator=check, validate_in_thread=True)
+
+    assert validation.submit(spec, 'x').result(timeout=2) == (True, '')
+    assert threads and threads[0] is not threading.current_thread()
+
+
+def test_passing_results_are_cached_per_step_and_value(validation):
+    calls = []
+
+    async def check(value):
+        calls.append(value)
+        return (True, '') if value['user'] else (False, 'missing user')
+
+    spec = TextStepSpec(key='login', title='Login', validator=check)
+
+    assert validation.submit(spec, {'user': 'a'}).result(timeout=2) == (True, '')
+    assert validation.submit(spec, {'user': 'a'}).result(timeout=2) == (True, '')
+    assert validation.cached(spec, {'user': 'a'}) == (True, '')
+    assert validation.submit(spec, {'user': ''}).result(timeout=2) == (False, 'missing user')
+    assert validation.cached(spec, {'user': ''}) is None
+    assert validation.submit(spec, {'user': ''}).result(timeout=2) == (False, 'missing user')
+    assert calls == [{'user': 'a'}, {'user': ''}, {'user': ''}]
+
+    validation.clear()
+    assert validation.cached(spec, {'user': 'a'}) is None
+
+
+def test_concurrent_submissions_share_one_run(validation):
+    calls = []
+    release = threading.Event()
+
+    def check(value):
+        calls.append(value)
+        release.wait(2)
+        return True, ''
+
+    spec = TextStepSpec(key='name', title='Name', validator=check, validate_in_thread=True)
+    first = validation.submit(spec, 'x')
+    second = validation.submit(spec, 'x')
+    release.set()
+
+    assert first is second
+    assert first.result(timeout=2) == (True, '')
+    assert calls == ['x']
+
+
+def test_errors_are_not_cached(validation):
+    calls = []
+
+    async def check(value):
+        calls.append(value)
+        if len(calls) == 1:
+            raise ConnectionError('api down')
+        return True, ''
+
+    spec = TextStepSpec(key='name', title='Name', validator=check)
+
+    with pytest.raises(ConnectionError):
+        validation.submit(spec, 'x').result(timeout=2)
+    assert validation.submit(spec, 'x').result(timeout=2) == (True, '')
+    assert len(calls) == 2
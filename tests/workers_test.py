@@ -1,11 +1,21 @@
 import asyncio
+import json
 import logging
+import threading
 import time
 
 import pytest
+from PySide6.QtCore import Qt
 
+from botflow import pipeline as pipeline_module
+from botflow.cache import StepCache, cache_step
+from botflow.checkpoint import CheckpointStore
 from botflow.exceptions import PipelineExceptedError
-from botflow.workers import AsyncLoopThreadWorker, PipelineWorker
+from botflow.processes import ProcessStepExecutor
+from botflow.retry import retry_step
+from botflow.tracing import PipelineTracer
+from botflow.types import FinishStep
+from botflow.workers import AsyncLoopPool, AsyncLoopThreadWorker, PipelineThread, PipelineWorker
 
 
 def _wire_signals(worker: PipelineWorker):
@@ -14,10 +24,11 @@ def _wire_signals(worker: PipelineWorker):
     error_events = []
     finished_events = []
 
-    worker.progress.connect(lambda v: progress_events.append(v))
-    worker.status.connect(lambda s: status_events.append(s))
-    worker.error.connect(lambda e: error_events.append(e))
-    worker.finished.connect(lambda d: finished_events.append(d))
+    direct = Qt.ConnectionType.DirectConnection
+    worker.progress.connect(lambda v: progress_events.append(v), direct)
+    worker.status.connect(lambda s: status_events.append(s), direct)
+    worker.error.connect(lambda e: error_events.append(e), direct)
+    worker.finished.connect(lambda d: finished_events.append(d), direct)
 
     return progress_events, status_events, error_events, finished_events
 
@@ -118,3 +129,930 @@ def test_pipeline_emits_traceback_for_generic_exception(async_loop, logger):
     assert len(error) == 1
     assert 'ValueError' in error[0]
     assert 'boom' in error[0]
+
+
+def test_pipeline_runs_independent_steps_concurrently(async_loop, logger):
+    ctx = {}
+    barrier = threading.Barrier(2, timeout=2)
+
+    def download_a(context):
+        barrier.wait()
+        context.data['a'] = 1
+
+    async def download_b(context):
+        await asyncio.sleep(0)
+        await asyncio.to_thread(barrier.wait)
+        context.data['b'] = 2
+
+    def merge(context):
+        context.data['total'] = context.data['a'] + context.data['b']
+
+    pipeline = [
+        FinishStep(download_a, depends_on=()),
+        FinishStep(download_b, depends_on=()),
+        FinishStep(merge, depends_on=('download_a', 'download_b')),
+    ]
+    worker = PipelineWorker(ctx=ctx, pipeline=pipeline, logger=logger, async_loop=async_loop)
+    progress, status, error, finished = _wire_signals(worker)
+    worker.run()
+
+    assert error == []
+    assert finished == [ctx]
+    assert ctx['total'] == 3
+    assert status.index('Step 3 of 3: merge') > status.index('Step 2 of 3: download_b')
+    assert progress[-1] == 100
+
+
+def test_pipeline_graph_stops_scheduling_after_failure(async_loop, logger):
+    ctx = {}
+    calls = []
+
+    def bad_step(_):
+        raise ValueError('boom')
+
+    def after(_):
+        calls.append('after')
+
+    pipeline = [FinishStep(bad_step, depends_on=()), FinishStep(after, depends_on=('bad_step',))]
+    worker = PipelineWorker(ctx=ctx, pipeline=pipeline, logger=logger, async_loop=async_loop)
+    _, _, error, finished = _wire_signals(worker)
+    worker.run()
+
+    assert finished == []
+    assert calls == []
+    assert 'boom' in error[0]
+
+
+def test_pipeline_graph_failure_cancels_running_siblings(async_loop, logger):
+    stopped = []
+
+    def bad_step(_):
+        time.sleep(0.05)
+        raise ValueError('boom')
+
+    def waiting_step(context):
+        stopped.append(context.cancel_token.wait(5))
+
+    async def sleeping_step(_):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            stopped.append(True)
+            raise
+
+    pipeline = [
+        FinishStep(bad_step, depends_on=()),
+        FinishStep(waiting_step, depends_on=()),
+        FinishStep(sleeping_step, depends_on=()),
+    ]
+    for run_on_loop in (False, True):
+        stopped.clear()
+        worker = PipelineWorker(ctx={}, pipeline=pipeline, logger=logger, async_loop=async_loop)
+        _, _, error, _ = _wire_signals(worker)
+        started = time.monotonic()
+        if run_on_loop:
+            worker.run_on_loop().result(timeout=5)
+        else:
+            worker.run()
+
+        assert time.monotonic() - started < 2
+        assert 'boom' in error[0]
+        deadline = time.monotonic() + 2
+        while len(stopped) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stopped == [True, True]
+
+
+def test_pipeline_reports_invalid_graph_as_error(async_loop, logger):
+    def step(_):
+        pass
+
+    pipeline = [FinishStep(step, depends_on=('missing',))]
+    worker = PipelineWorker(ctx={}, pipeline=pipeline, logger=logger, async_loop=async_loop)
+    _, _, error, finished = _wire_signals(worker)
+    worker.run()
+
+    assert finished == []
+    assert 'unknown steps' in error[0]
+
+
+def process_step(context):
+    context.data['value'] = context.data['value'] * 2
+    context.pipeline_info.progress(75)
+
+
+def test_pipeline_runs_process_steps_and_merges_context(async_loop, logger):
+    ctx = {'value': 21}
+    pool = ProcessStepExecutor(max_workers=1)
+
+    worker = PipelineWorker(
+        ctx=ctx,
+        pipeline=[FinishStep(process_step, executor='process')],
+        logger=logger,
+        async_loop=async_loop,
+        process_pool=pool,
+    )
+    progress, _, error, finished = _wire_signals(worker)
+    try:
+        worker.run()
+    finally:
+        pool.shutdown()
+
+    assert error == []
+    assert ctx['value'] == 42
+    assert 75 in progress
+
+
+def test_pipeline_rejects_async_steps_in_process_executor(async_loop, logger):
+    async def async_step(_):
+        pass
+
+    worker = PipelineWorker(
+        ctx={},
+        pipeline=[FinishStep(async_step, executor='process')],
+        logger=logger,
+        async_loop=async_loop,
+    )
+    _, _, error, _ = _wire_signals(worker)
+    worker.run()
+
+    assert 'cannot run in a process' in error[0]
+
+
+def test_pipeline_maps_step_progress_into_step_share(async_loop, logger):
+    def step_one(_):
+        pass
+
+    def step_two(context):
+        context.pipeline_info.step_progress(50)
+
+    worker = PipelineWorker(
+        ctx={}, pipeline=[step_one, step_two], logger=logger, async_loop=async_loop
+    )
+    progress, _, _, _ = _wire_signals(worker)
+    worker.run()
+
+    assert progress == [0, 0, 50, 75, 100]
+
+
+def test_pipeline_throttles_step_updates_but_delivers_final_values(async_loop, logger):
+    def chatty_step(context):
+        for i in range(10_000):
+            context.pipeline_info.step_progress(i // 100)
+            context.pipeline_info.status(f'row {i}')
+
+    worker = PipelineWorker(
+        ctx={},
+        pipeline=[chatty_step],
+        logger=logger,
+        async_loop=async_loop,
+        max_updates_per_second=20,
+    )
+    progress, status, error, _ = _wire_signals(worker)
+    worker.run()
+
+    assert error == []
+    assert len(status) < 100
+    assert len(progress) < 100
+    assert progress[-1] == 100
+    assert status[-1] == 'Pipeline completed successfully'
+
+
+def _wire_cancelled(worker: PipelineWorker):
+    cancelled_events = []
+    worker.cancelled.connect(
+        lambda: cancelled_events.append(True), Qt.ConnectionType.DirectConnection
+    )
+    return cancelled_events
+
+
+def test_async_step_timeout_cancels_coroutine(async_loop, logger):
+    state = {}
+
+    async def hung_step(_):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state['cancelled'] = True
+            raise
+
+    worker = PipelineWorker(
+        ctx={},
+        pipeline=[FinishStep(hung_step, timeout=0.05)],
+        logger=logger,
+        async_loop=async_loop,
+    )
+    _, _, error, finished = _wire_signals(worker)
+    started = time.monotonic()
+    worker.run()
+
+    assert time.monotonic() - started < 2
+    assert finished == []
+    assert error == ["Step 'hung_step' timed out after 0.05s"]
+    time.sleep(0.05)
+    assert state == {'cancelled': True}
+
+
+def test_sync_step_timeout_is_seen_through_the_token(async_loop, logger):
+    def polling_step(context):
+        while not context.cancel_token.wait(0.01):
+            pass
+        context.cancel_token.raise_if_cancelled()
+
+    worker = PipelineWorker(
+        ctx={},
+        pipeline=[FinishStep(polling_step, timeout=0.05)],
+        logger=logger,
+        async_loop=async_loop,
+    )
+    _, _, error, _ = _wire_signals(worker)
+    worker.run()
+
+    assert error == ["Step 'polling_step' timed out after 0.05s"]
+
+
+def test_cancel_stops_running_async_step_and_skips_the_rest(async_loop, logger):
+    calls = []
+
+    async def slow_step(_):
+        await asyncio.sleep(10)
+
+    def next_step(_):
+        calls.append('next')
+
+    worker = PipelineWorker(
+        ctx={}, pipeline=[slow_step, next_step], logger=logger, async_loop=async_loop
+    )
+    _, status, error, finished = _wire_signals(worker)
+    cancelled = _wire_cancelled(worker)
+    threading.Timer(0.05, worker.cancel).start()
+    started = time.monotonic()
+    worker.run()
+
+    assert time.monotonic() - started < 2
+    assert cancelled == [True]
+    assert error == []
+    assert finished == []
+    assert calls == []
+    assert status[-1] == 'Pipeline cancelled'
+
+
+def test_cancel_releases_graph_waiting_on_blocked_step(async_loop, logger):
+    release = threading.Event()
+
+    def blocking_step(_):
+        release.wait(5)
+
+    pipeline = [FinishStep(blocking_step, depends_on=())]
+    worker = PipelineWorker(ctx={}, pipeline=pipeline, logger=logger, async_loop=async_loop)
+    cancelled = _wire_cancelled(worker)
+    threading.Timer(0.05, worker.cancel).start()
+    started = time.monotonic()
+    try:
+        worker.run()
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 2
+    assert cancelled == [True]
+
+
+def test_steps_share_loop_resources(async_loop, logger):
+    created = []
+
+    async def open_client():
+        created.append(True)
+        return {'requests': 0}
+
+    async_loop.resources.register('client', open_client)
+
+    async def async_step(context):
+        client = await context.resources.get('client')
+        client['requests'] += 1
+
+    def sync_step(context):
+        client = context.resources.get_threadsafe('client')
+        client['requests'] += 1
+        context.data['requests'] = client['requests']
+
+    ctx = {}
+    worker = PipelineWorker(
+        ctx=ctx, pipeline=[async_step, sync_step], logger=logger, async_loop=async_loop
+    )
+    _, _, error, _ = _wire_signals(worker)
+    worker.run()
+
+    assert error == []
+    assert ctx['requests'] == 2
+    assert created == [True]
+
+
+def test_pipeline_resumes_from_checkpoint_after_failure(async_loop, logger, tmp_path):
+    store = CheckpointStore(tmp_path)
+    calls = []
+    fail = {'step_two': True}
+
+    def step_one(context):
+        calls.append('step_one')
+        context.data['one'] = 1
+
+    def step_two(context):
+        calls.append('step_two')
+        if fail['step_two']:
+            raise ValueError('boom')
+        context.data['two'] = context.data['one'] + 1
+
+    def run(resume):
+        ctx = {}
+        worker = PipelineWorker(
+            ctx=ctx,
+            pipeline=[step_one, step_two],
+            logger=logger,
+            async_loop=async_loop,
+            checkpoint_store=store,
+            checkpoint_key='flow',
+            resume=resume,
+        )
+        _, _, error, _ = _wire_signals(worker)
+        worker.run()
+        return ctx, error
+
+    _, error = run(resume=False)
+    assert 'boom' in error[0]
+    assert store.load('flow').completed == ('step_one',)
+
+    fail['step_two'] = False
+    ctx, error = run(resume=True)
+
+    assert error == []
+    assert ctx == {'one': 1, 'two': 2}
+    assert calls == ['step_one', 'step_two', 'step_two']
+    assert store.load('flow') is None
+
+
+def test_pipeline_does_not_resume_past_steps_with_unpicklable_outputs(
+    async_loop, logger, tmp_path, caplog
+):
+    store = CheckpointStore(tmp_path)
+    calls = []
+
+    def open_session(context):
+        calls.append('open_session')
+        context.data['session'] = threading.Lock()
+
+    def step_one(context):
+        calls.append('step_one')
+        context.data['one'] = 1
+
+    def step_two(_):
+        raise ValueError('boom')
+
+    worker = PipelineWorker(
+        ctx={'client': threading.Lock()},
+        pipeline=[step_one, open_session, step_two],
+        logger=logger,
+        async_loop=async_loop,
+        checkpoint_store=store,
+        checkpoint_key='flow',
+    )
+    _wire_signals(worker)
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        worker.run()
+
+    checkpoint = store.load('flow')
+    assert checkpoint.completed == ('step_one',)
+    assert checkpoint.data == {'one': 1}
+    assert "Checkpoint cannot hold ['session']" in caplog.text
+
+
+def test_checkpoint_ignores_keys_written_while_it_is_saved(
+    async_loop, logger, tmp_path, caplog, monkeypatch
+):
+    ctx = {}
+    real_view = pipeline_module.picklable_view
+
+    def view_then_sibling_writes(data, log=None):
+        view = real_view(data, log)
+        ctx[f'sibling{len(ctx)}'] = 1
+        return view
+
+    monkeypatch.setattr(pipeline_module, 'picklable_view', view_then_sibling_writes)
+    worker = PipelineWorker(
+        ctx=ctx,
+        pipeline=[lambda context: None, lambda context: None],
+        logger=logger,
+        async_loop=async_loop,
+        checkpoint_store=CheckpointStore(tmp_path),
+        checkpoint_key='flow',
+    )
+    _, _, error, _ = _wire_signals(worker)
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        worker.run()
+
+    assert error == []
+    assert 'Checkpoint cannot hold' not in caplog.text
+
+
+def test_pipeline_logs_checkpoint_save_failures(async_loop, logger, tmp_path, caplog):
+    store = CheckpointStore(tmp_path / 'not-a-dir')
+    (tmp_path / 'not-a-dir').write_text('')
+
+    worker = PipelineWorker(
+        ctx={},
+        pipeline=[lambda context: context.data.update(done=True)],
+        logger=logger,
+        async_loop=async_loop,
+        checkpoint_store=store,
+        checkpoint_key='flow',
+    )
+    _, _, error, _ = _wire_signals(worker)
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        worker.run()
+
+    assert error == []
+    assert 'Failed to save checkpoint' in caplog.text
+
+
+def test_pipeline_graph_skips_checkpointed_steps(async_loop, logger, tmp_path):
+    store = CheckpointStore(tmp_path)
+    store.save('flow', ['download_a'], {'a': 1})
+    calls = []
+
+    def download_a(_):
+        calls.append('download_a')
+
+    def download_b(context):
+        calls.append('download_b')
+        context.data['b'] = 2
+
+    pipeline = [
+        FinishStep(download_a, depends_on=()),
+        FinishStep(download_b, depends_on=()),
+    ]
+    ctx = {}
+    worker = PipelineWorker(
+        ctx=ctx,
+        pipeline=pipeline,
+        logger=logger,
+        async_loop=async_loop,
+        checkpoint_store=store,
+        checkpoint_key='flow',
+        resume=True,
+    )
+    _, _, error, _ = _wire_signals(worker)
+    worker.run()
+
+    assert error == []
+    assert calls == ['download_b']
+    assert ctx == {'a': 1, 'b': 2}
+
+
+def test_fresh_run_discards_previous_checkpoint(async_loop, logger, tmp_path):
+    store = CheckpointStore(tmp_path)
+    store.save('flow', ['step'], {'stale': True})
+    calls = []
+
+    def step(_):
+        calls.append('step')
+        raise ValueError('boom')
+
+    ctx = {}
+    worker = PipelineWorker(
+        ctx=ctx,
+        pipeline=[step],
+        logger=logger,
+        async_loop=async_loop,
+        checkpoint_store=store,
+        checkpoint_key='flow',
+    )
+    _wire_signals(worker)
+    worker.run()
+
+    assert calls == ['step']
+    assert 'stale' not in ctx
+    assert store.load('flow') is None
+
+
+def test_pipeline_skips_cached_steps(async_loop, logger, tmp_path):
+    calls = []
+
+    @cache_step(inputs=['name'], outputs=['greeting'])
+    def greet(context):
+        calls.append(context.data['name'])
+        context.data['greeting'] = f"Hello {context.data['name']}"
+
+    def run(name):
+        ctx = {'name': name}
+        worker = PipelineWorker(
+            ctx=ctx,
+            pipeline=[greet],
+            logger=logger,
+            async_loop=async_loop,
+            step_cache=StepCache(tmp_path),
+        )
+        _, status, error, _ = _wire_signals(worker)
+        worker.run()
+        assert error == []
+        return ctx, status
+
+    run('Ana')
+    ctx, status = run('Ana')
+    run('Bia')
+
+    assert calls == ['Ana', 'Bia']
+    assert ctx['greeting'] == 'Hello Ana'
+    assert 'Step 1 of 1: greet (cached)' in status
+
+
+def test_pipeline_traces_steps_by_executor(async_loop, logger, tmp_path):
+    @cache_step(inputs=['name'], outputs=['greeting'])
+    def greet(context):
+        context.data['greeting'] = f"Hello {context.data['name']}"
+
+    async def fetch(context):
+        await asyncio.sleep(0.01)
+
+    def run():
+        worker = PipelineWorker(
+            ctx={'name': 'Ana'},
+            pipeline=[greet, fetch],
+            logger=logger,
+            async_loop=async_loop,
+            checkpoint_key='traced flow',
+            step_cache=StepCache(tmp_path / 'cache'),
+            tracer=PipelineTracer(tmp_path / 'traces'),
+        )
+        traced, finished = [], []
+        direct = Qt.ConnectionType.DirectConnection
+        worker.traced.connect(traced.append, direct)
+        worker.finished.connect(lambda ctx, timings: finished.append(timings), direct)
+        _, _, error, _ = _wire_signals(worker)
+        worker.run()
+        assert error == []
+        assert traced == [worker.timings]
+        assert finished == [worker.timings]
+        return worker
+
+    first = run()
+    second = run()
+
+    assert [(t.name, t.status, t.executor) for t in first.timings] == [
+        ('greet', 'ok', 'thread'),
+        ('fetch', 'ok', 'loop'),
+    ]
+    assert second.timings[0].status == 'cached'
+    assert second.timings[1].thread_id == async_loop._thread.ident
+
+    trace = json.loads(second.trace_path.read_text(encoding='utf-8'))
+    assert [e['name'] for e in trace['traceEvents'] if e['ph'] == 'X'] == ['greet', 'fetch']
+
+
+def test_pipeline_runs_on_loop_without_extra_threads(async_loop, logger):
+    threads = {}
+
+    async def fetch(context):
+        threads['fetch'] = threading.get_ident()
+        context.data['value'] = 1
+
+    def compute(context):
+        threads['compute'] = threading.get_ident()
+        context.data['value'] += 1
+
+    worker = PipelineWorker(ctx={}, pipeline=[fetch, compute], logger=logger, async_loop=async_loop)
+    _, status, error, finished = _wire_signals(worker)
+    worker.run_on_loop().result(timeout=2)
+
+    assert error == []
+    assert finished[0]['value'] == 2
+    assert threads['fetch'] == async_loop._thread.ident
+    assert threads['compute'] not in (async_loop._thread.ident, threading.get_ident())
+    assert status[-1] == 'Pipeline completed successfully'
+
+
+def test_pipeline_on_loop_runs_graph_concurrently(async_loop, logger):
+    both_started = asyncio.Event()
+    started = []
+
+    async def step(context):
+        started.append(context.pipeline_info.step_name)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    async def first(context):
+        await step(context)
+
+    async def second(context):
+        await step(context)
+
+    def last(context):
+        context.data['order'] = list(started)
+
+    pipeline = [
+        FinishStep(first, depends_on=()),
+        FinishStep(second, depends_on=()),
+        FinishStep(last, depends_on=('first', 'second')),
+    ]
+    worker = PipelineWorker(ctx={}, pipeline=pipeline, logger=logger, async_loop=async_loop)
+    _, _, error, finished = _wire_signals(worker)
+    worker.run_on_loop().result(timeout=2)
+
+    assert error == []
+    assert sorted(finished[0]['order']) == ['first', 'second']
+
+
+def test_pipeline_on_loop_times_out_and_cancels(async_loop, logger):
+    async def hung_step(_):
+        await asyncio.sleep(10)
+
+    worker = PipelineWorker(
+        ctx={},
+        pipeline=[FinishStep(hung_step, timeout=0.05)],
+        logger=logger,
+        async_loop=async_loop,
+    )
+    _, _, error, _ = _wire_signals(worker)
+    worker.run_on_loop().result(timeout=2)
+    assert error == ["Step 'hung_step' timed out after 0.05s"]
+
+    worker = PipelineWorker(
+        ctx={}, pipeline=[hung_step, hung_step], logger=logger, async_loop=async_loop
+    )
+    _, status, error, finished = _wire_signals(worker)
+    cancelled = _wire_cancelled(worker)
+    threading.Timer(0.05, worker.cancel).start()
+    worker.run_on_loop().result(timeout=2)
+
+    assert cancelled == [True]
+    assert error == finished == []
+    assert status[-1] == 'Pipeline cancelled'
+
+
+def test_pipeline_thread_reuses_one_thread_across_runs(async_loop, logger):
+    local = threading.local()
+    seen = []
+
+    def step(context):
+        local.runs = getattr(local, 'runs', 0) + 1
+        seen.append((threading.current_thread().name, local.runs))
+
+    host = PipelineThread(name='botflow-test-pipeline')
+    try:
+        for _ in range(3):
+            worker = PipelineWorker(ctx={}, pipeline=[step], logger=logger, async_loop=async_loop)
+            _, _, error, finished = _wire_signals(worker)
+            host.submit(worker.run).result(timeout=2)
+            assert error == [] and len(finished) == 1
+    finally:
+        assert host.stop()
+
+    assert seen == [('botflow-test-pipeline', n) for n in (1, 2, 3)]
+    assert not host.is_running()
+    with pytest.raises(RuntimeError):
+        host.submit(lambda: None)
+
+
+def test_stream_stages_overlap_with_bounded_buffers(async_loop, logger):
+    events = []
+
+    async def fetch(_):
+        for page in range(6):
+            events.append(('fetch', page))
+            yield page
+
+    async def parse(context):
+        async for page in context.stream:
+            events.append(('parse', page))
+            yield page * 10
+
+    async def upload(context):
+        context.data['uploaded'] = [item async for item in context.stream]
+
+    pipeline = [FinishStep(fetch, buffer_size=1), FinishStep(parse, buffer_size=1), upload]
+    worker = PipelineWorker(ctx={}, pipeline=pipeline, logger=logger, async_loop=async_loop)
+    _, status, error, finished = _wire_signals(worker)
+    worker.run()
+
+    assert error == []
+    assert finished[0]['uploaded'] == [0, 10, 20, 30, 40, 50]
+    assert 'Steps 1-3 of 3: fetch -> parse -> upload' in status
+    # With one-slot buffers the producer can only run a couple of items ahead.
+    assert events.index(('parse', 0)) < events.index(('fetch', 4))
+
+
+def test_stream_consumer_stopping_early_closes_producer(async_loop, logger):
+    closed = []
+
+    async def endless(_):
+        try:
+            n = 0
+            while True:
+                yield n
+                n += 1
+        finally:
+            closed.append(True)
+
+    async def take_three(context):
+        context.data['taken'] = []
+        async for item in context.stream:
+            context.data['taken'].append(item)
+            if len(context.data['taken']) == 3:
+                break
+
+    def after(context):
+        context.data['after'] = True
+
+    worker = PipelineWorker(
+        ctx={}, pipeline=[endless, take_three, after], logger=logger, async_loop=async_loop
+    )
+    _, _, error, finished = _wire_signals(worker)
+    worker.run()
+
+    assert error == []
+    assert finished[0]['taken'] == [0, 1, 2]
+    assert finished[0]['after'] is True
+    assert closed == [True]
+
+
+def test_stream_stage_failure_and_timeout_stop_the_stream(async_loop, logger):
+    async def produce(_):
+        for n in range(100):
+            yield n
+
+    async def explode(context):
+        async for item in context.stream:
+            if item == 2:
+                raise PipelineExceptedError('Upload failed', 'Upload failed at 2')
+
+    async def hang(_):
+        yield 1
+        await asyncio.sleep(10)
+
+    async def consume(context):
+        async for _ in context.stream:
+            pass
+
+    worker = PipelineWorker(
+        ctx={}, pipeline=[produce, explode], logger=logger, async_loop=async_loop
+    )
+    _, _, error, _ = _wire_signals(worker)
+    worker.run()
+    assert error == ['Upload failed at 2']
+
+    worker = PipelineWorker(
+        ctx={},
+        pipeline=[FinishStep(hang, timeout=0.05), consume],
+        logger=logger,
+        async_loop=async_loop,
+    )
+    _, _, error, _ = _wire_signals(worker)
+    started = time.monotonic()
+    worker.run_on_loop().result(timeout=2)
+    assert time.monotonic() - started < 2
+    assert error == ["Step 'hang' timed out after 0.05s"]
+
+
+def test_step_retries_transient_failures_with_backoff(async_loop, logger):
+    attempts = []
+
+    @retry_step(max_attempts=3, backoff=0.01, retry_on=ConnectionError)
+    def flaky(context):
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise ConnectionError('reset by peer')
+        context.data['ok'] = True
+
+    worker = PipelineWorker(ctx={}, pipeline=[flaky], logger=logger, async_loop=async_loop)
+    _, status, error, finished = _wire_signals(worker)
+    worker.run()
+
+    assert error == []
+    assert finished[0]['ok'] is True
+    assert len(attempts) == 3
+    assert 'Step 1 of 1: flaky (attempt 2 of 3)' in status
+    assert 'Step 1 of 1: flaky (attempt 3 of 3)' in status
+
+
+def test_step_gives_up_on_non_retryable_errors_and_exhausted_attempts(async_loop, logger):
+    calls = []
+
+    @retry_step(max_attempts=3, backoff=0, retry_on=ConnectionError)
+    def broken(_):
+        calls.append('broken')
+        raise ValueError('bad input')
+
+    @retry_step(max_attempts=2, backoff=0)
+    async def down(_):
+        calls.append('down')
+        raise PipelineExceptedError('Service down', 'Service down')
+
+    worker = PipelineWorker(ctx={}, pipeline=[broken], logger=logger, async_loop=async_loop)
+    _, _, error, _ = _wire_signals(worker)
+    worker.run()
+    assert 'ValueError: bad input' in error[0]
+
+    worker = PipelineWorker(ctx={}, pipeline=[down], logger=logger, async_loop=async_loop)
+    _, _, error, _ = _wire_signals(worker)
+    worker.run_on_loop().result(timeout=2)
+    assert error == ['Service down']
+    assert calls == ['broken', 'down', 'down']
+
+
+def test_async_step_retries_back_off_on_the_loop(async_loop, logger, monkeypatch):
+    attempts, submitted = [], []
+
+    @retry_step(max_attempts=3, backoff=0.01, jitter=0, retry_on=ConnectionError)
+    async def flaky(context):
+        attempts.append(threading.current_thread())
+        if len(attempts) < 3:
+            raise ConnectionError('reset by peer')
+
+    submit = async_loop.submit
+
+    def counting_submit(*args, **kwargs):
+        submitted.append(args)
+        return submit(*args, **kwargs)
+
+    monkeypatch.setattr(async_loop, 'submit', counting_submit)
+    worker = PipelineWorker(ctx={}, pipeline=[flaky], logger=logger, async_loop=async_loop)
+    _, _, error, _ = _wire_signals(worker)
+    worker.run()
+
+    assert error == []
+    assert len(attempts) == 3
+    assert len(submitted) == 1
+
+
+def test_cancel_interrupts_retry_backoff(async_loop, logger):
+    @retry_step(max_attempts=5, backoff=10, jitter=0)
+    async def failing(_):
+        raise ConnectionError('reset by peer')
+
+    for run_on_loop in (False, True):
+        worker = PipelineWorker(ctx={}, pipeline=[failing], logger=logger, async_loop=async_loop)
+        cancelled = _wire_cancelled(worker)
+        threading.Timer(0.05, worker.cancel).start()
+        started = time.monotonic()
+        if run_on_loop:
+            worker.run_on_loop().result(timeout=2)
+        else:
+            worker.run()
+
+        assert time.monotonic() - started < 2
+        assert cancelled == [True]
+
+
+def test_round_robin_async_steps_occupy_one_shard_each(logger):
+    pool = AsyncLoopPool(2)
+    threads = []
+
+    @retry_step(max_attempts=2, backoff=0, retry_on=ConnectionError)
+    async def first(_):
+        threads.append(threading.current_thread().name)
+        if len(threads) == 1:
+            raise ConnectionError('reset by peer')
+
+    async def second(_):
+        threads.append(threading.current_thread().name)
+
+    try:
+        worker = PipelineWorker(ctx={}, pipeline=[first, second], logger=logger, async_loop=pool)
+        _, _, error, _ = _wire_signals(worker)
+        worker.run()
+
+        assert error == []
+        assert threads[0] == threads[1] != threads[2]
+        assert [s.completed for s in pool.stats()] == [1, 1]
+    finally:
+        pool.stop()
+
+
+def test_pipeline_places_async_steps_on_pool_loops(logger):
+    pool = AsyncLoopPool(2)
+    seen = {}
+
+    async def first(context):
+        seen['first'] = threading.current_thread().name
+        seen['first_resources'] = context.resources
+
+    async def second(context):
+        seen['second'] = threading.current_thread().name
+        seen['second_resources'] = context.resources
+
+    pipeline = [FinishStep(first, loop_key='a'), FinishStep(second, loop_key='d')]
+    try:
+        for run_on_loop in (False, True):
+            worker = PipelineWorker(ctx={}, pipeline=pipeline, logger=logger, async_loop=pool)
+            _, _, error, finished = _wire_signals(worker)
+            if run_on_loop:
+                worker.run_on_loop().result(timeout=2)
+            else:
+                worker.run()
+
+            assert error == [] and len(finished) == 1
+            assert seen['first'] == pool.shard('a').name
+            assert seen['second'] == pool.shard('d').name
+            assert seen['first'] != seen['second']
+            assert seen['first_resources'] is pool.shard('a').resources
+    finally:
+        pool.stop()